@@ -0,0 +1,2 @@
+# Modules de mesure enregistrés auprès du harnais à l'import (dans l'ordre d'exécution)
+from . import bench_processor, bench_validator, bench_storage, bench_graph, bench_sensor
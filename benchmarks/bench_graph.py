@@ -0,0 +1,54 @@
+import os
+import time
+from .harness import BenchmarkResult, best_time, benchmark
+
+
+@benchmark("graph")
+def bench_graph():
+    # Rendu hors écran : aucune fenêtre n'est affichée
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    try:
+        from PyQt5.QtWidgets import QApplication
+        from src.gui.widgets.graph_widget import GraphWidget
+    except ImportError:
+        return []
+    app = QApplication.instance() or QApplication([])
+    
+    graph = GraphWidget("Altitude (m)", "Temps (s)", "Altitude", redraw_interval_ms=None)
+    graph.resize(1000, 600)
+    graph.show()
+    app.processEvents()
+    
+    count = 20000
+    start = time.time()
+    repeats = [0]
+    
+    def add_points():
+        # Chaque répétition prolonge la série : les timestamps restent croissants
+        base = start + repeats[0] * count * 0.01
+        repeats[0] += 1
+        for index in range(count):
+            graph.add_data_point(base + index * 0.01, float(index % 500), "Altitude")
+    
+    per_point = best_time(add_points, repeat=5) / count
+    
+    # Rendu complet (axes, graduations, séries décimées) sur ~100 000 points
+    full_draw = best_time(graph.canvas.draw, repeat=5)
+    
+    # Image typique du tableau de bord : 10 nouveaux points puis un rendu
+    timestamp = [start + repeats[0] * count * 0.01]
+    
+    def frame():
+        for _ in range(10):
+            timestamp[0] += 0.01
+            graph.add_data_point(timestamp[0], 250.0, "Altitude")
+        graph.render_frame()
+        app.processEvents()
+    
+    frame_time = best_time(frame, number=20, repeat=3)
+    graph.close()
+    return [
+        BenchmarkResult("graph.add_data_point", per_point * 1e6, "µs"),
+        BenchmarkResult("graph.full_redraw", full_draw * 1e3, "ms"),
+        BenchmarkResult("graph.frame_render", frame_time * 1e3, "ms"),
+    ]
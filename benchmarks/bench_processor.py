@@ -0,0 +1,36 @@
+import time
+from src.data.data_processor import TelemetryProcessor
+from src.data.spsc_ring import OverflowPolicy
+from .fixtures import make_readings
+from .harness import BenchmarkResult, benchmark
+
+
+READINGS = 50000
+
+
+@benchmark("processor")
+def bench_processor():
+    readings = make_readings(READINGS)
+    # File bloquante : aucune perte, le débit mesuré est celui du traitement complet
+    processor = TelemetryProcessor(buffer_size=READINGS, queue_capacity=8192,
+                                   overflow_policy=OverflowPolicy.BLOCK)
+    processor.add_batch_callback(lambda batch: None, max_batch=256, max_latency_ms=5)
+    processor.start_processing()
+    
+    started = time.perf_counter()
+    add_reading = processor.add_reading
+    for reading in readings:
+        add_reading(reading)
+    enqueued = time.perf_counter()
+    while processor.get_ingest_stats()['popped'] < READINGS:
+        time.sleep(0.0005)
+    elapsed = time.perf_counter() - started
+    processor.stop_processing()
+    
+    enqueue_latency = processor.get_latency_stats()['enqueue']
+    return [
+        BenchmarkResult("processor.ingest_throughput", READINGS / elapsed, "lect/s", higher_is_better=True),
+        BenchmarkResult("processor.add_reading", (enqueued - started) / READINGS * 1e6, "µs"),
+        BenchmarkResult("processor.enqueue_latency_p50", enqueue_latency['p50_ms'], "ms", gated=False),
+        BenchmarkResult("processor.enqueue_latency_p99", enqueue_latency['p99_ms'], "ms", gated=False),
+    ]
@@ -0,0 +1,17 @@
+from src.sensors.mock_sensor import MockRocketSensor
+from .harness import BenchmarkResult, best_time, benchmark
+
+
+@benchmark("sensor")
+def bench_sensor():
+    sensor = MockRocketSensor(sample_rate=1000.0)
+    sensor.connect()
+    count = 20000
+    
+    def read_all():
+        read = sensor.read_data
+        for _ in range(count):
+            read()
+    
+    per_read = best_time(read_all, repeat=7) / count
+    return [BenchmarkResult("sensor.mock_read_rate", 1.0 / per_read, "lect/s", higher_is_better=True)]
@@ -0,0 +1,58 @@
+import shutil
+import tempfile
+from src.data.data_storage import DataStorage
+from .fixtures import make_frame
+from .harness import BenchmarkResult, best_time, benchmark
+
+
+# Tailles par format : les formats texte sont mesurés sur des volumes plus petits
+SIZES = {
+    'json': (1000, 20000),
+    'csv': (1000, 20000),
+    'binary': (1000, 200000),
+    'archive': (1000, 50000),
+}
+
+
+@benchmark("storage")
+def bench_storage():
+    temp_dir = tempfile.mkdtemp()
+    results = []
+    try:
+        storage = DataStorage(temp_dir)
+        frames = {size: make_frame(size) for sizes in SIZES.values() for size in sizes}
+        savers = {
+            'json': storage.save_to_json,
+            'csv': storage.save_to_csv,
+            'binary': storage.save_to_binary,
+            'archive': storage.save_to_archive,
+        }
+        
+        def load_binary(name):
+            reader = storage.load_flight_log(name)
+            try:
+                return reader.to_frame()
+            finally:
+                reader.close()
+        
+        loaders = {
+            'json': storage.load_frame_from_json,
+            'binary': load_binary,
+            'archive': lambda name: storage.open_archive(name).to_frame(),
+        }
+        extensions = {'json': 'json', 'csv': 'csv', 'binary': 'rtlog', 'archive': 'rtarc'}
+        
+        for fmt, sizes in SIZES.items():
+            for size in sizes:
+                frame = frames[size]
+                filename = f"bench_{size}.{extensions[fmt]}"
+                save_time = best_time(lambda: savers[fmt](frame, filename), repeat=3)
+                results.append(BenchmarkResult(f"storage.{fmt}.save_{size}", size / save_time, "lect/s",
+                                               higher_is_better=True))
+                if fmt in loaders:
+                    load_time = best_time(lambda: loaders[fmt](filename), repeat=3)
+                    results.append(BenchmarkResult(f"storage.{fmt}.load_{size}", size / load_time, "lect/s",
+                                                   higher_is_better=True))
+    finally:
+        shutil.rmtree(temp_dir)
+    return results
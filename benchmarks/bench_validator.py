@@ -0,0 +1,23 @@
+from src.core.telemetry_data import TelemetryDataValidator
+from src.core.telemetry_frame import TelemetryFrame
+from .fixtures import make_readings
+from .harness import BenchmarkResult, best_time, benchmark
+
+
+@benchmark("validator")
+def bench_validator():
+    validator = TelemetryDataValidator()
+    readings = make_readings(20000)
+    frame = TelemetryFrame.from_readings(readings * 5)
+    
+    def check_all():
+        check = validator.check_reading
+        for reading in readings:
+            check(reading)
+    
+    per_reading = best_time(check_all, repeat=7) / len(readings)
+    per_row = best_time(lambda: validator.validate_batch(frame), repeat=7) / len(frame)
+    return [
+        BenchmarkResult("validator.check_reading", per_reading * 1e9, "ns/lect"),
+        BenchmarkResult("validator.validate_batch", per_row * 1e9, "ns/lect"),
+    ]
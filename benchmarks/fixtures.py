@@ -0,0 +1,27 @@
+import math
+import time
+from typing import List
+from src.core.telemetry_data import TelemetryReading
+from src.core.telemetry_frame import TelemetryFrame
+
+
+def make_readings(count: int, rate: float = 100.0) -> List[TelemetryReading]:
+    # Lectures déterministes et valides (vol simulé à fréquence fixe)
+    start_ns = time.time_ns()
+    period_ns = int(1e9 / rate)
+    readings = []
+    for index in range(count):
+        t = index / rate
+        altitude = 500.0 * math.sin(t / 30.0) + 500.0
+        readings.append(TelemetryReading.from_values(
+            timestamp_ns=start_ns + index * period_ns, altitude=altitude, velocity=math.cos(t) * 50.0,
+            acc_x=math.sin(t * 3.0), acc_y=math.cos(t * 2.0), acc_z=9.81 + math.sin(t),
+            temperature=20.0 - altitude * 0.0065, pressure=101325.0 - altitude * 12.0,
+            roll=math.sin(t) * 5.0, pitch=math.cos(t) * 5.0, yaw=(t * 10.0) % 360.0,
+            lat=45.0 + t * 1e-6, lon=2.0 + t * 1e-6, battery_voltage=12.0
+        ))
+    return readings
+
+
+def make_frame(count: int, rate: float = 100.0) -> TelemetryFrame:
+    return TelemetryFrame.from_readings(make_readings(count, rate))
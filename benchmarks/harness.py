@@ -0,0 +1,176 @@
+import json
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Résultats mesurés, comparés à une référence JSON : toute dégradation au-delà de la
+# tolérance fait échouer l'exécution. Les temps sont pris au perf_counter, sans attente fixe.
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.30
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+    # Les mesures trop bruitées (percentiles de latence inter-threads) sont rapportées sans bloquer
+    gated: bool = True
+
+
+@dataclass
+class Comparison:
+    result: BenchmarkResult
+    baseline: Optional[float]
+    change: Optional[float]  # dégradation relative (> 0 : pire que la référence)
+    regressed: bool
+
+
+_BENCHMARKS: List[Tuple[str, Callable[[], List[BenchmarkResult]]]] = []
+
+
+def benchmark(group: str):
+    # Déclare une fonction de mesure retournant une liste de BenchmarkResult
+    def register(function: Callable[[], List[BenchmarkResult]]):
+        _BENCHMARKS.append((group, function))
+        return function
+    return register
+
+
+def best_time(function: Callable[[], object], number: int = 1, repeat: int = 5) -> float:
+    # Meilleur temps par appel (s) sur `repeat` séries de `number` appels
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - started) / number)
+    return min(timings)
+
+
+def environment() -> Dict[str, str]:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'processor': platform.processor() or platform.machine(),
+    }
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Optional[dict]:
+    if not path.exists():
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_results(results: List[BenchmarkResult], path: Path) -> None:
+    _write_payload({result.name: asdict(result) for result in results}, path)
+
+
+def update_baseline(results: List[BenchmarkResult], path: Path = BASELINE_PATH) -> None:
+    # Seules les mesures refaites sont remplacées : une exécution filtrée (--bench-filter)
+    # conserve la référence des autres groupes
+    existing = load_baseline(path)
+    entries = dict(existing.get('results', {})) if existing else {}
+    entries.update({result.name: asdict(result) for result in results})
+    _write_payload(entries, path)
+
+
+def _write_payload(entries: Dict[str, dict], path: Path) -> None:
+    payload = {
+        'environment': environment(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': entries,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+    temp_path.replace(path)
+
+
+def compare(results: List[BenchmarkResult], baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> List[Comparison]:
+    reference = baseline.get('results', {})
+    comparisons = []
+    for result in results:
+        entry = reference.get(result.name)
+        if entry is None or not entry.get('value'):
+            comparisons.append(Comparison(result, None, None, False))
+            continue
+        base = entry['value']
+        if result.higher_is_better:
+            change = base / result.value - 1 if result.value > 0 else float('inf')
+        else:
+            change = result.value / base - 1
+        comparisons.append(Comparison(result, base, change, result.gated and change > tolerance))
+    return comparisons
+
+
+def run_all(name_filter: Optional[str] = None, stream=sys.stdout) -> List[BenchmarkResult]:
+    results: List[BenchmarkResult] = []
+    for group, function in _BENCHMARKS:
+        if name_filter and name_filter not in group:
+            continue
+        started = time.perf_counter()
+        group_results = function()
+        stream.write(f"{group}: {len(group_results)} mesures en {time.perf_counter() - started:.1f} s\n")
+        stream.flush()
+        results.extend(group_results)
+    return results
+
+
+def _best(first: BenchmarkResult, second: BenchmarkResult) -> BenchmarkResult:
+    if first.higher_is_better:
+        return first if first.value >= second.value else second
+    return first if first.value <= second.value else second
+
+
+def confirm_regressions(results: List[BenchmarkResult], baseline: dict, tolerance: float = DEFAULT_TOLERANCE,
+                        retries: int = 2, stream=sys.stdout) -> List[BenchmarkResult]:
+    # Une régression doit se reproduire : les groupes concernés sont relancés et la meilleure
+    # mesure est conservée (filtre le bruit d'une machine partagée)
+    for _ in range(retries):
+        regressed = {comparison.result.name.split('.', 1)[0]
+                     for comparison in compare(results, baseline, tolerance) if comparison.regressed}
+        if not regressed:
+            break
+        by_name = {result.name: result for result in results}
+        for group, function in _BENCHMARKS:
+            if group not in regressed:
+                continue
+            stream.write(f"{group}: nouvelle mesure pour confirmer une régression\n")
+            for result in function():
+                previous = by_name.get(result.name)
+                by_name[result.name] = _best(previous, result) if previous is not None else result
+        results = [by_name[result.name] for result in results]
+    return results
+
+
+def format_report(comparisons: List[Comparison], tolerance: float) -> str:
+    lines = [f"{'benchmark':<44} {'valeur':>14} {'référence':>14} {'écart':>8}"]
+    for comparison in comparisons:
+        result = comparison.result
+        value = f"{result.value:.4g} {result.unit}"
+        base = f"{comparison.baseline:.4g}" if comparison.baseline is not None else "-"
+        if comparison.change is None:
+            change = "nouveau"
+        else:
+            # Affiché en amélioration positive / dégradation négative
+            change = f"{-comparison.change * 100:+.0f}%"
+        flag = ""
+        if comparison.regressed:
+            flag = "  RÉGRESSION"
+        elif not result.gated:
+            flag = "  (info)"
+        lines.append(f"{result.name:<44} {value:>14} {base:>14} {change:>8}{flag}")
+    regressions = sum(1 for comparison in comparisons if comparison.regressed)
+    lines.append(f"{regressions} régression(s) au-delà de {tolerance * 100:.0f}%")
+    return "\n".join(lines)
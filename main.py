@@ -10,17 +10,28 @@ import os
 # Ajouter le répertoire src au PATH Python
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.gui.main_window import main
 from src.utils.logger import get_logger
 
+
+def run(argv):
+    # Le mode sans interface n'importe jamais Qt ni matplotlib
+    if '--headless' in argv:
+        from src.headless import main as headless_main
+        return headless_main(argv)
+    
+    from src.gui.main_window import main as gui_main
+    return gui_main()
+
+
 if __name__ == "__main__":
     logger = get_logger()
     
     try:
         logger.log_system_event("Application startup", {"version": "1.0.0"})
-        main()
+        exit_code = run(sys.argv[1:])
     except Exception as e:
         logger.log_error_event("Application crash", str(e), {"exception_type": type(e).__name__})
         raise
     finally:
-        logger.log_system_event("Application shutdown")
\ No newline at end of file
+        logger.log_system_event("Application shutdown")
+    sys.exit(exit_code)
@@ -3,22 +3,25 @@
 Script pour exécuter tous les tests du système de télémétrie
 """
 
+import argparse
+import logging
 import unittest
 import sys
 import os
+from pathlib import Path
 
 # Ajouter le répertoire src au PATH Python
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 def run_tests():
-    # Découvrir et exécuter tous les tests
-    loader = unittest.TestLoader()
+    # Découvrir et exécuter tous les tests (un chargeur par répertoire : discover mémorise
+    # le répertoire racine du premier appel)
     
     # Charger les tests unitaires
-    unit_tests = loader.discover('tests/unit', pattern='test_*.py')
+    unit_tests = unittest.TestLoader().discover('tests/unit', pattern='test_*.py')
     
     # Charger les tests d'intégration
-    integration_tests = loader.discover('tests/integration', pattern='test_*.py')
+    integration_tests = unittest.TestLoader().discover('tests/integration', pattern='test_*.py')
     
     # Créer une suite de tests complète
     test_suite = unittest.TestSuite([unit_tests, integration_tests])
@@ -30,6 +33,50 @@ def run_tests():
     # Retourner le code de sortie approprié
     return 0 if result.wasSuccessful() else 1
 
+def run_benchmarks(args):
+    # Rendu Qt hors écran, avant tout import de PyQt5
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from benchmarks import harness
+    from src.utils.logger import get_logger
+    
+    # Les sauvegardes répétées journalisent chacune un événement : seuls les avertissements restent
+    get_logger().logger.setLevel(logging.WARNING)
+    
+    baseline_path = Path(args.baseline) if args.baseline else harness.BASELINE_PATH
+    results = harness.run_all(args.bench_filter)
+    baseline = harness.load_baseline(baseline_path)
+    
+    if baseline is None or args.update_baseline:
+        harness.update_baseline(results, baseline_path)
+        comparisons = harness.compare(results, {})
+        print(harness.format_report(comparisons, args.tolerance))
+        print(f"Référence enregistrée dans {baseline_path}")
+        return 0
+    
+    if baseline.get('environment') != harness.environment():
+        print("Attention : référence mesurée sur un autre environnement "
+              f"({baseline.get('environment')}), relancer avec --update-baseline si nécessaire")
+    results = harness.confirm_regressions(results, baseline, args.tolerance)
+    comparisons = harness.compare(results, baseline, args.tolerance)
+    print(harness.format_report(comparisons, args.tolerance))
+    if args.output:
+        harness.save_results(results, Path(args.output))
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Tests et benchmarks du système de télémétrie")
+    parser.add_argument('--bench', action='store_true', help="exécuter les benchmarks au lieu des tests")
+    parser.add_argument('--bench-filter', default=None, help="ne lancer que les groupes contenant ce texte")
+    parser.add_argument('--baseline', default=None, help="fichier de référence JSON (défaut : benchmarks/baseline.json)")
+    parser.add_argument('--update-baseline', action='store_true', help="remplacer dans la référence les mesures de cette exécution")
+    parser.add_argument('--tolerance', type=float, default=0.30,
+                        help="dégradation relative tolérée avant échec (défaut : 0.30)")
+    parser.add_argument('--output', default=None, help="écrire aussi les résultats de cette exécution en JSON")
+    return parser
+
+
 if __name__ == '__main__':
-    exit_code = run_tests()
+    args = build_parser().parse_args()
+    exit_code = run_benchmarks(args) if args.bench else run_tests()
     sys.exit(exit_code)
\ No newline at end of file
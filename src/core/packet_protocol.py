@@ -0,0 +1,140 @@
+import binascii
+import struct
+from typing import Dict, List, NamedTuple
+from .telemetry_data import TelemetryReading
+
+
+# Trame binaire (little-endian) :
+#   sync (2) | longueur du payload (<H) | vehicle_id (<H) | seq (<H)
+#   | payload : timestamp_ns (<q), altitude..yaw (10 x f32), lat, lon (2 x f64), batterie (f32)
+#   | CRC-16/CCITT (<H) calculé de la longueur à la fin du payload
+# Les champs optionnels absents sont transmis en NaN.
+SYNC = b'\xa5\x5a'
+HEADER = struct.Struct('<2sHHH')
+PAYLOAD = struct.Struct('<q10f2df')
+CRC = struct.Struct('<H')
+FRAME_SIZE = HEADER.size + PAYLOAD.size + CRC.size
+CRC_INIT = 0xFFFF
+
+_NAN = float('nan')
+
+
+class Packet(NamedTuple):
+    vehicle_id: int
+    seq: int
+    reading: TelemetryReading
+
+
+def encode_frame(reading: TelemetryReading, vehicle_id: int = 0, seq: int = 0) -> bytes:
+    frame = bytearray(FRAME_SIZE)
+    HEADER.pack_into(frame, 0, SYNC, PAYLOAD.size, vehicle_id, seq & 0xFFFF)
+    PAYLOAD.pack_into(
+        frame, HEADER.size, reading.timestamp_ns,
+        reading.altitude, reading.velocity, reading.acc_x, reading.acc_y, reading.acc_z,
+        reading.temperature, reading.pressure, reading.roll, reading.pitch, reading.yaw,
+        _NAN if reading.lat is None else reading.lat,
+        _NAN if reading.lon is None else reading.lon,
+        _NAN if reading.battery_voltage is None else reading.battery_voltage,
+    )
+    crc = binascii.crc_hqx(memoryview(frame)[len(SYNC):HEADER.size + PAYLOAD.size], CRC_INIT)
+    CRC.pack_into(frame, HEADER.size + PAYLOAD.size, crc)
+    return bytes(frame)
+
+
+class PacketDecoder:
+    # Extrait les trames d'un flux d'octets arbitrairement découpé. Les octets reçus sont
+    # accumulés dans un unique bytearray ; les trames sont lues en place via memoryview et
+    # unpack_from, sans copie. Après une corruption, la recherche reprend à l'octet suivant
+    # le faux mot de synchronisation.
+    def __init__(self):
+        self._buffer = bytearray()
+        self._last_seq: Dict[int, int] = {}
+        
+        self.frames = 0
+        self.crc_errors = 0
+        self.length_errors = 0
+        self.bytes_skipped = 0
+        self.lost = 0
+    
+    @property
+    def pending_bytes(self) -> int:
+        return len(self._buffer)
+    
+    def feed(self, data) -> List[Packet]:
+        buffer = self._buffer
+        buffer += data
+        packets: List[Packet] = []
+        position = 0
+        size = len(buffer)
+        header_size = HEADER.size
+        payload_size = PAYLOAD.size
+        crc_offset = header_size + payload_size
+        
+        with memoryview(buffer) as view:
+            while True:
+                start = buffer.find(SYNC, position)
+                if start < 0:
+                    # Conserver un éventuel premier octet de synchronisation en fin de tampon
+                    keep = 1 if position < size and buffer[-1] == SYNC[0] else 0
+                    self.bytes_skipped += size - keep - position
+                    position = size - keep
+                    break
+                
+                self.bytes_skipped += start - position
+                position = start
+                if size - start < header_size:
+                    break
+                
+                _, length, vehicle_id, seq = HEADER.unpack_from(buffer, start)
+                if length != payload_size:
+                    self.length_errors += 1
+                    position = start + 1
+                    continue
+                if size - start < FRAME_SIZE:
+                    break
+                
+                crc = binascii.crc_hqx(view[start + 2:start + crc_offset], CRC_INIT)
+                if crc != CRC.unpack_from(buffer, start + crc_offset)[0]:
+                    self.crc_errors += 1
+                    position = start + 1
+                    continue
+                
+                values = PAYLOAD.unpack_from(buffer, start + header_size)
+                reading = TelemetryReading.from_values(*values)
+                if reading.lat != reading.lat or reading.lon != reading.lon:
+                    reading.lat = reading.lon = None
+                if reading.battery_voltage != reading.battery_voltage:
+                    reading.battery_voltage = None
+                
+                self._track_sequence(vehicle_id, seq)
+                packets.append(Packet(vehicle_id, seq, reading))
+                position = start + FRAME_SIZE
+        
+        # Compaction une fois par appel : le coût est amorti sur toutes les trames décodées
+        if position:
+            del buffer[:position]
+        self.frames += len(packets)
+        return packets
+    
+    def _track_sequence(self, vehicle_id: int, seq: int) -> None:
+        last = self._last_seq.get(vehicle_id)
+        if last is not None:
+            gap = (seq - last - 1) & 0xFFFF
+            # Un très grand écart correspond à un doublon ou à un redémarrage, pas à des pertes
+            if gap < 0x8000:
+                self.lost += gap
+        self._last_seq[vehicle_id] = seq
+    
+    def reset(self) -> None:
+        self._buffer.clear()
+        self._last_seq.clear()
+    
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'frames': self.frames,
+            'crc_errors': self.crc_errors,
+            'length_errors': self.length_errors,
+            'bytes_skipped': self.bytes_skipped,
+            'lost': self.lost,
+            'pending_bytes': len(self._buffer),
+        }
@@ -1,29 +1,146 @@
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+import json
+from dataclasses import dataclass, field, asdict
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
+import numpy as np
+
+
+def datetime_to_ns(timestamp: datetime) -> int:
+    return round(timestamp.timestamp() * 1_000_000) * 1000
 
 
-@dataclass
 class TelemetryReading:
-    timestamp: datetime
-    altitude: float
-    velocity: float
-    acceleration: Dict[str, float]  # x, y, z
-    temperature: float
-    pressure: float
-    orientation: Dict[str, float]  # roll, pitch, yaw
-    gps_coordinates: Optional[Dict[str, float]] = None  # lat, lon
-    battery_voltage: Optional[float] = None
+    # Représentation compacte : champs plats dans des slots, timestamp en ns epoch.
+    # acceleration / orientation / gps_coordinates / timestamp restent disponibles
+    # sous forme de propriétés calculées pour le code existant.
+    __slots__ = ('timestamp_ns', 'altitude', 'velocity', 'acc_x', 'acc_y', 'acc_z',
+                 'temperature', 'pressure', 'roll', 'pitch', 'yaw', 'lat', 'lon',
+                 'battery_voltage')
+    
+    def __init__(self, timestamp, altitude: float, velocity: float, acceleration: Dict[str, float],
+                 temperature: float, pressure: float, orientation: Dict[str, float],
+                 gps_coordinates: Optional[Dict[str, float]] = None,
+                 battery_voltage: Optional[float] = None):
+        # Constructeur historique à base de dicts, timestamp en datetime ou en ns
+        self.timestamp_ns = timestamp if isinstance(timestamp, int) else datetime_to_ns(timestamp)
+        self.altitude = altitude
+        self.velocity = velocity
+        self.acc_x = acceleration['x']
+        self.acc_y = acceleration['y']
+        self.acc_z = acceleration['z']
+        self.temperature = temperature
+        self.pressure = pressure
+        self.roll = orientation['roll']
+        self.pitch = orientation['pitch']
+        self.yaw = orientation['yaw']
+        self.lat = gps_coordinates['lat'] if gps_coordinates else None
+        self.lon = gps_coordinates['lon'] if gps_coordinates else None
+        self.battery_voltage = battery_voltage
+    
+    @classmethod
+    def from_values(cls, timestamp_ns: int, altitude: float, velocity: float,
+                    acc_x: float, acc_y: float, acc_z: float,
+                    temperature: float, pressure: float,
+                    roll: float, pitch: float, yaw: float,
+                    lat: Optional[float] = None, lon: Optional[float] = None,
+                    battery_voltage: Optional[float] = None) -> 'TelemetryReading':
+        # Chemin rapide : aucun dict ni datetime intermédiaire
+        reading = object.__new__(cls)
+        reading.timestamp_ns = timestamp_ns
+        reading.altitude = altitude
+        reading.velocity = velocity
+        reading.acc_x = acc_x
+        reading.acc_y = acc_y
+        reading.acc_z = acc_z
+        reading.temperature = temperature
+        reading.pressure = pressure
+        reading.roll = roll
+        reading.pitch = pitch
+        reading.yaw = yaw
+        reading.lat = lat
+        reading.lon = lon
+        reading.battery_voltage = battery_voltage
+        return reading
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TelemetryReading':
+        timestamp = data['timestamp']
+        if isinstance(timestamp, str):
+            # Fichiers plus anciens : timestamp ISO 8601
+            timestamp = datetime.fromisoformat(timestamp)
+        return cls(
+            timestamp=timestamp,
+            altitude=data['altitude'],
+            velocity=data['velocity'],
+            acceleration=data['acceleration'],
+            temperature=data['temperature'],
+            pressure=data['pressure'],
+            orientation=data['orientation'],
+            gps_coordinates=data.get('gps_coordinates'),
+            battery_voltage=data.get('battery_voltage')
+        )
+    
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self.timestamp_ns = datetime_to_ns(value)
+    
+    @property
+    def acceleration(self) -> Dict[str, float]:
+        # Copie : modifier le dict retourné ne modifie pas la lecture
+        return {'x': self.acc_x, 'y': self.acc_y, 'z': self.acc_z}
+    
+    @acceleration.setter
+    def acceleration(self, value: Dict[str, float]) -> None:
+        self.acc_x, self.acc_y, self.acc_z = value['x'], value['y'], value['z']
+    
+    @property
+    def orientation(self) -> Dict[str, float]:
+        return {'roll': self.roll, 'pitch': self.pitch, 'yaw': self.yaw}
+    
+    @orientation.setter
+    def orientation(self, value: Dict[str, float]) -> None:
+        self.roll, self.pitch, self.yaw = value['roll'], value['pitch'], value['yaw']
+    
+    @property
+    def gps_coordinates(self) -> Optional[Dict[str, float]]:
+        if self.lat is None or self.lon is None:
+            return None
+        return {'lat': self.lat, 'lon': self.lon}
+    
+    @gps_coordinates.setter
+    def gps_coordinates(self, value: Optional[Dict[str, float]]) -> None:
+        self.lat = value['lat'] if value else None
+        self.lon = value['lon'] if value else None
+    
+    def as_tuple(self) -> tuple:
+        return (self.timestamp_ns, self.altitude, self.velocity, self.acc_x, self.acc_y, self.acc_z,
+                self.temperature, self.pressure, self.roll, self.pitch, self.yaw,
+                self.lat, self.lon, self.battery_voltage)
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"TelemetryReading({fields})"
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp_ns,
             'altitude': self.altitude,
             'velocity': self.velocity,
-            'acceleration': self.acceleration,
+            'acceleration': {'x': self.acc_x, 'y': self.acc_y, 'z': self.acc_z},
             'temperature': self.temperature,
             'pressure': self.pressure,
-            'orientation': self.orientation,
+            'orientation': {'roll': self.roll, 'pitch': self.pitch, 'yaw': self.yaw},
             'gps_coordinates': self.gps_coordinates,
             'battery_voltage': self.battery_voltage
         }
@@ -40,15 +157,110 @@ class FlightPhase:
     LANDED = "landed"
 
 
+@dataclass
+class ValidationLimits:
+    altitude_min: float = -1000
+    altitude_max: float = 100000
+    velocity_max: float = 1000  # en valeur absolue
+    temperature_min: float = -100
+    temperature_max: float = 100
+    pressure_min: float = 0
+    pressure_max: float = 120000
+    
+    @classmethod
+    def from_dict(cls, values: Dict[str, float]) -> 'ValidationLimits':
+        unknown = set(values) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Limites inconnues: {sorted(unknown)}")
+        return cls(**values)
+    
+    @classmethod
+    def from_json(cls, path: str) -> 'ValidationLimits':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+    
+    def to_dict(self) -> Dict[str, float]:
+        return asdict(self)
+    
+    def rules(self) -> List[Tuple[str, float, float]]:
+        # (canal, min, max) - bornes incluses
+        return [
+            ('altitude', self.altitude_min, self.altitude_max),
+            ('velocity', -self.velocity_max, self.velocity_max),
+            ('temperature', self.temperature_min, self.temperature_max),
+            ('pressure', self.pressure_min, self.pressure_max),
+        ]
+
+
+@dataclass
+class ValidationResult:
+    mask: np.ndarray  # True = échantillon valide
+    rejections: Dict[str, int] = field(default_factory=dict)  # règle -> échantillons rejetés par cette règle en premier
+    
+    @property
+    def valid_count(self) -> int:
+        return int(np.count_nonzero(self.mask))
+    
+    @property
+    def rejected_count(self) -> int:
+        return len(self.mask) - self.valid_count
+
+
+class _DefaultValidatorMethod:
+    # validate_reading était une staticmethod : appelée sur la classe, elle utilise un
+    # validateur aux limites par défaut
+    def __init__(self, function):
+        self.function = function
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            instance = owner._default_instance()
+        return self.function.__get__(instance, owner)
+
+
 class TelemetryDataValidator:
-    @staticmethod
-    def validate_reading(reading: TelemetryReading) -> bool:
-        if reading.altitude < -1000 or reading.altitude > 100000:
-            return False
-        if abs(reading.velocity) > 1000:
-            return False
-        if reading.temperature < -100 or reading.temperature > 100:
-            return False
-        if reading.pressure < 0 or reading.pressure > 120000:
-            return False
-        return True
\ No newline at end of file
+    _default = None
+    
+    def __init__(self, limits: Optional[ValidationLimits] = None):
+        self.limits = limits or ValidationLimits()
+    
+    @classmethod
+    def _default_instance(cls) -> 'TelemetryDataValidator':
+        if cls.__dict__.get('_default') is None:
+            cls._default = cls()
+        return cls._default
+    
+    @property
+    def limits(self) -> ValidationLimits:
+        return self._limits
+    
+    @limits.setter
+    def limits(self, limits: ValidationLimits) -> None:
+        # Règles figées une fois pour toutes : check_reading est sur le chemin critique d'ingestion.
+        # Réaffecter limits (et non modifier ses champs) pour changer les bornes.
+        self._limits = limits
+        self._rules = tuple(limits.rules())
+    
+    def check_reading(self, reading: TelemetryReading) -> Optional[str]:
+        # Retourne le nom de la première règle violée, ou None
+        for channel, low, high in self._rules:
+            value = getattr(reading, channel)
+            if value < low or value > high:
+                return channel
+        return None
+    
+    @_DefaultValidatorMethod
+    def validate_reading(self, reading: TelemetryReading) -> bool:
+        return self.check_reading(reading) is None
+    
+    def validate_batch(self, frame) -> ValidationResult:
+        # Toutes les limites sont évaluées sous forme de masques NumPy en une passe.
+        # Comme check_reading, un échantillon rejeté n'est compté que pour sa première règle en échec.
+        mask = np.ones(len(frame), dtype=bool)
+        rejections = {}
+        for channel, low, high in self._rules:
+            column = frame[channel]
+            rejected = ((column < low) | (column > high)) & mask
+            rejections[channel] = int(np.count_nonzero(rejected))
+            mask &= ~rejected
+        return ValidationResult(mask=mask, rejections=rejections)
@@ -0,0 +1,141 @@
+import numpy as np
+from typing import Iterable, List, Optional, Sequence
+from .telemetry_data import TelemetryReading
+
+
+# Disposition colonnaire d'un échantillon : une ligne par lecture, une colonne par canal.
+# Les champs optionnels (GPS, batterie) valent NaN lorsqu'ils sont absents.
+TELEMETRY_DTYPE = np.dtype([
+    ('timestamp_ns', '<i8'),
+    ('altitude', '<f8'),
+    ('velocity', '<f8'),
+    ('acc_x', '<f8'),
+    ('acc_y', '<f8'),
+    ('acc_z', '<f8'),
+    ('temperature', '<f8'),
+    ('pressure', '<f8'),
+    ('roll', '<f8'),
+    ('pitch', '<f8'),
+    ('yaw', '<f8'),
+    ('lat', '<f8'),
+    ('lon', '<f8'),
+    ('battery_voltage', '<f8'),
+])
+
+CHANNELS = TELEMETRY_DTYPE.names
+VALUE_CHANNELS = CHANNELS[1:]
+
+
+_NAN = float('nan')
+
+
+def _reading_to_row(reading: TelemetryReading) -> tuple:
+    row = reading.as_tuple()
+    if row[11] is None or row[12] is None or row[13] is None:
+        row = row[:11] + tuple(_NAN if value is None else value for value in row[11:])
+    return row
+
+
+class TelemetryFrame:
+    def __init__(self, capacity: int = 1024, data: Optional[np.ndarray] = None):
+        if data is not None:
+            if data.dtype != TELEMETRY_DTYPE:
+                raise ValueError(f"dtype incompatible: {data.dtype}")
+            self._data = data
+            self._size = len(data)
+        else:
+            self._data = np.empty(max(1, capacity), dtype=TELEMETRY_DTYPE)
+            self._size = 0
+    
+    @classmethod
+    def from_readings(cls, readings: Sequence[TelemetryReading]) -> 'TelemetryFrame':
+        frame = cls(capacity=len(readings))
+        frame.extend(readings)
+        return frame
+    
+    @classmethod
+    def from_array(cls, data: np.ndarray) -> 'TelemetryFrame':
+        return cls(data=data)
+    
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+    
+    @property
+    def data(self) -> np.ndarray:
+        # Vue sur les lignes remplies, sans copie
+        return self._data[:self._size]
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._data[key][:self._size]
+        if isinstance(key, slice):
+            return TelemetryFrame(data=self.data[key])
+        return self.reading_at(key)
+    
+    def __iter__(self):
+        for index in range(self._size):
+            yield self.reading_at(index)
+    
+    def times(self) -> np.ndarray:
+        # Timestamps en secondes epoch, pratique pour les graphiques
+        return self['timestamp_ns'] * 1e-9
+    
+    def append(self, reading: TelemetryReading) -> None:
+        if self._size == len(self._data):
+            self._grow(self._size + 1)
+        self._data[self._size] = _reading_to_row(reading)
+        self._size += 1
+    
+    def extend(self, readings: Iterable[TelemetryReading]) -> None:
+        rows = [_reading_to_row(reading) for reading in readings]
+        if not rows:
+            return
+        end = self._size + len(rows)
+        if end > len(self._data):
+            self._grow(end)
+        self._data[self._size:end] = rows
+        self._size = end
+    
+    def extend_frame(self, other: 'TelemetryFrame') -> None:
+        end = self._size + len(other)
+        if end > len(self._data):
+            self._grow(end)
+        self._data[self._size:end] = other.data
+        self._size = end
+    
+    def clear(self) -> None:
+        self._size = 0
+    
+    def copy(self) -> 'TelemetryFrame':
+        return TelemetryFrame(data=self.data.copy())
+    
+    def reading_at(self, index: int) -> TelemetryReading:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("index hors limites")
+        return self._row_to_reading(self._data[index].item())
+    
+    def to_readings(self) -> List[TelemetryReading]:
+        # tolist() convertit tout le bloc en tuples Python en une seule passe
+        return [self._row_to_reading(row) for row in self.data.tolist()]
+    
+    @staticmethod
+    def _row_to_reading(row: tuple) -> TelemetryReading:
+        reading = TelemetryReading.from_values(*row)
+        # NaN -> None pour les champs optionnels
+        if reading.lat != reading.lat or reading.lon != reading.lon:
+            reading.lat = reading.lon = None
+        if reading.battery_voltage != reading.battery_voltage:
+            reading.battery_voltage = None
+        return reading
+    
+    def _grow(self, minimum: int) -> None:
+        new_capacity = max(minimum, len(self._data) * 2)
+        data = np.empty(new_capacity, dtype=TELEMETRY_DTYPE)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
@@ -0,0 +1,267 @@
+import json
+import lzma
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
+from ..core.telemetry_frame import TelemetryFrame, TELEMETRY_DTYPE
+
+
+# Archive colonnaire compressée :
+#   magic (8) | version (<H) | réservé (<H)
+#   | blocs compressés (un par canal et par tranche de temps)
+#   | index JSON (plage de temps, min/max et position de chaque bloc)
+#   | trailer : position de l'index (<Q), taille de l'index (<I), magic de fin (4)
+MAGIC = b'RKTARCH\x00'
+TRAILER_MAGIC = b'RKTA'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<8sHH')
+_TRAILER = struct.Struct('<QI4s')
+
+CODECS = {
+    'zlib': (lambda data: zlib.compress(data, 6), zlib.decompress),
+    'lzma': (lambda data: lzma.compress(data, preset=6), lzma.decompress),
+}
+
+# Canaux à variation lente : encodés en différences successives
+DEFAULT_DELTA_CHANNELS = ('timestamp_ns', 'altitude', 'velocity', 'temperature',
+                          'pressure', 'lat', 'lon', 'battery_voltage')
+
+
+def _shuffle(data: np.ndarray) -> bytes:
+    # Regroupe les octets de même poids : les octets de poids fort se compressent très bien
+    return data.view(np.uint8).reshape(-1, data.dtype.itemsize).T.tobytes()
+
+
+def _unshuffle(raw: bytes, dtype: np.dtype, count: int) -> np.ndarray:
+    planes = np.frombuffer(raw, dtype=np.uint8).reshape(dtype.itemsize, count)
+    return np.ascontiguousarray(planes.T).view(dtype).reshape(count)
+
+
+def encode_column(values: np.ndarray, delta: bool, compress) -> bytes:
+    # Les flottants sont traités via leur représentation entière : le delta reste sans perte
+    as_int = np.ascontiguousarray(values).view(np.int64)
+    if delta and len(as_int):
+        as_int = np.diff(as_int, prepend=np.int64(0))
+    return compress(_shuffle(as_int))
+
+
+def decode_column(blob: bytes, dtype: np.dtype, count: int, delta: bool, decompress) -> np.ndarray:
+    as_int = _unshuffle(decompress(blob), np.dtype('<i8'), count)
+    if delta:
+        as_int = np.cumsum(as_int, dtype=np.int64)
+    return as_int.view(dtype)
+
+
+def _bounds(values: np.ndarray) -> Tuple[Optional[float], Optional[float]]:
+    if values.dtype.kind == 'f':
+        finite = values[~np.isnan(values)]
+        if not len(finite):
+            return None, None
+        return float(finite.min()), float(finite.max())
+    return int(values.min()), int(values.max())
+
+
+class ArchiveWriter:
+    def __init__(self, path: Union[str, Path], chunk_seconds: float = 1.0, codec: str = 'zlib',
+                 delta_channels: Iterable[str] = DEFAULT_DELTA_CHANNELS):
+        if codec not in CODECS:
+            raise ValueError(f"Codec inconnu: {codec}")
+        self.path = Path(path)
+        self.codec = codec
+        self.chunk_ns = int(chunk_seconds * 1e9)
+        self.delta_channels = set(delta_channels)
+        self._compress = CODECS[codec][0]
+        
+        self._chunks: List[dict] = []
+        self._pending = TelemetryFrame(capacity=1024)
+        self._origin_ns: Optional[int] = None
+        self._file = open(self.path, 'wb')
+        self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0))
+    
+    def add_frame(self, frame: TelemetryFrame) -> None:
+        if not len(frame):
+            return
+        if self._origin_ns is None:
+            self._origin_ns = int(frame['timestamp_ns'][0])
+        self._pending.extend_frame(frame)
+        
+        # Écrire toutes les tranches antérieures à la plus récente, garder celle-ci en attente.
+        # Les timestamps peuvent arriver dans le désordre (plusieurs capteurs, réseau) : une
+        # lecture en retard sur une tranche déjà écrite forme un bloc supplémentaire.
+        slots = (self._pending['timestamp_ns'] - self._origin_ns) // self.chunk_ns
+        complete = slots < slots.max()
+        if complete.any():
+            self._write_chunks(self._pending.data[complete])
+            remainder = self._pending.data[~complete].copy()
+            self._pending.clear()
+            self._pending.extend_frame(TelemetryFrame.from_array(remainder))
+    
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        if len(self._pending):
+            self._write_chunks(self._pending.data)
+            self._pending.clear()
+        
+        footer = json.dumps({
+            'version': FORMAT_VERSION,
+            'codec': self.codec,
+            'chunk_ns': self.chunk_ns,
+            'channels': [[name, TELEMETRY_DTYPE.fields[name][0].str] for name in TELEMETRY_DTYPE.names],
+            'chunks': self._chunks,
+        }).encode('utf-8')
+        footer_offset = self._file.tell()
+        self._file.write(footer)
+        self._file.write(_TRAILER.pack(footer_offset, len(footer), TRAILER_MAGIC))
+        self._file.close()
+    
+    def _write_chunks(self, data: np.ndarray) -> None:
+        slots = (data['timestamp_ns'] - self._origin_ns) // self.chunk_ns
+        if np.any(slots[1:] < slots[:-1]):
+            # Regroupement par tranche, ordre d'arrivée conservé dans chaque tranche
+            order = np.argsort(slots, kind='stable')
+            data, slots = data[order], slots[order]
+        starts = np.flatnonzero(np.diff(slots, prepend=slots[0] - 1))
+        for start, end in zip(starts, list(starts[1:]) + [len(data)]):
+            self._write_chunk(data[start:end])
+    
+    def _write_chunk(self, data: np.ndarray) -> None:
+        timestamps = data['timestamp_ns']
+        chunk = {
+            't0': int(timestamps.min()),
+            't1': int(timestamps.max()),
+            'count': len(data),
+            'columns': {},
+        }
+        for name in TELEMETRY_DTYPE.names:
+            column = data[name]
+            blob = encode_column(column, name in self.delta_channels, self._compress)
+            low, high = _bounds(column)
+            chunk['columns'][name] = {
+                'offset': self._file.tell(),
+                'length': len(blob),
+                'delta': name in self.delta_channels,
+                'min': low,
+                'max': high,
+            }
+            self._file.write(blob)
+        self._chunks.append(chunk)
+    
+    def __enter__(self) -> 'ArchiveWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class ArchiveReader:
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            magic, version, _ = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"Fichier non reconnu comme archive: {path}")
+            if version > FORMAT_VERSION:
+                raise ValueError(f"Version de format non supportée: {version}")
+            
+            f.seek(-_TRAILER.size, 2)
+            footer_offset, footer_length, trailer_magic = _TRAILER.unpack(f.read(_TRAILER.size))
+            if trailer_magic != TRAILER_MAGIC:
+                raise ValueError(f"Archive incomplète (index absent): {path}")
+            f.seek(footer_offset)
+            footer = json.loads(f.read(footer_length))
+        
+        self.version = footer['version']
+        self.codec = footer['codec']
+        self.chunk_ns = footer['chunk_ns']
+        self.chunks: List[dict] = footer['chunks']
+        self.dtypes: Dict[str, np.dtype] = {name: np.dtype(code) for name, code in footer['channels']}
+        self._decompress = CODECS[self.codec][1]
+    
+    @property
+    def channels(self) -> Tuple[str, ...]:
+        return tuple(self.dtypes)
+    
+    def __len__(self) -> int:
+        return sum(chunk['count'] for chunk in self.chunks)
+    
+    @property
+    def start_ns(self) -> Optional[int]:
+        return min(chunk['t0'] for chunk in self.chunks) if self.chunks else None
+    
+    @property
+    def end_ns(self) -> Optional[int]:
+        return max(chunk['t1'] for chunk in self.chunks) if self.chunks else None
+    
+    def select_chunks(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> List[dict]:
+        return [chunk for chunk in self.chunks
+                if (start_ns is None or chunk['t1'] >= start_ns)
+                and (end_ns is None or chunk['t0'] <= end_ns)]
+    
+    def channel_bounds(self, channel: str, start_ns: Optional[int] = None,
+                       end_ns: Optional[int] = None) -> Tuple[Optional[float], Optional[float]]:
+        # Min/max calculés depuis l'index seul, sans décompression
+        lows = [c['columns'][channel]['min'] for c in self.select_chunks(start_ns, end_ns)]
+        highs = [c['columns'][channel]['max'] for c in self.select_chunks(start_ns, end_ns)]
+        lows = [value for value in lows if value is not None]
+        highs = [value for value in highs if value is not None]
+        return (min(lows) if lows else None, max(highs) if highs else None)
+    
+    def read_column(self, channel: str, start_ns: Optional[int] = None,
+                    end_ns: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        # Retourne (timestamps_ns, valeurs) ; seuls les blocs concernés sont lus et décompressés
+        chunks = self.select_chunks(start_ns, end_ns)
+        if not chunks:
+            return np.empty(0, dtype='<i8'), np.empty(0, dtype=self.dtypes[channel])
+        
+        times, values = [], []
+        with open(self.path, 'rb') as f:
+            for chunk in chunks:
+                chunk_times = self._read_block(f, chunk, 'timestamp_ns')
+                chunk_values = chunk_times if channel == 'timestamp_ns' else self._read_block(f, chunk, channel)
+                times.append(chunk_times)
+                values.append(chunk_values)
+        
+        times = np.concatenate(times)
+        values = np.concatenate(values)
+        mask = np.ones(len(times), dtype=bool)
+        if start_ns is not None:
+            mask &= times >= start_ns
+        if end_ns is not None:
+            mask &= times <= end_ns
+        return times[mask], values[mask]
+    
+    def read_relative(self, channel: str, start_s: float, end_s: float) -> Tuple[np.ndarray, np.ndarray]:
+        # Plage exprimée en secondes depuis le début du vol (T+start_s .. T+end_s)
+        if self.start_ns is None:
+            return self.read_column(channel)
+        return self.read_column(channel, self.start_ns + int(start_s * 1e9), self.start_ns + int(end_s * 1e9))
+    
+    def to_frame(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> TelemetryFrame:
+        chunks = self.select_chunks(start_ns, end_ns)
+        data = np.empty(sum(chunk['count'] for chunk in chunks), dtype=TELEMETRY_DTYPE)
+        position = 0
+        with open(self.path, 'rb') as f:
+            for chunk in chunks:
+                end = position + chunk['count']
+                for name in TELEMETRY_DTYPE.names:
+                    if name in chunk['columns']:
+                        data[name][position:end] = self._read_block(f, chunk, name)
+                    else:
+                        data[name][position:end] = np.nan
+                position = end
+        
+        mask = np.ones(len(data), dtype=bool)
+        if start_ns is not None:
+            mask &= data['timestamp_ns'] >= start_ns
+        if end_ns is not None:
+            mask &= data['timestamp_ns'] <= end_ns
+        return TelemetryFrame.from_array(data[mask])
+    
+    def _read_block(self, f, chunk: dict, channel: str) -> np.ndarray:
+        column = chunk['columns'][channel]
+        f.seek(column['offset'])
+        blob = f.read(column['length'])
+        return decode_column(blob, self.dtypes[channel], chunk['count'], column['delta'], self._decompress)
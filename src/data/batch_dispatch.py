@@ -0,0 +1,158 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+from ..core.telemetry_data import TelemetryReading
+from ..utils.logger import get_logger
+
+
+class SheddingPolicy:
+    LATEST = "latest"  # consommateur en retard : ne garder que la dernière lecture
+    DROP_OLDEST = "drop_oldest"  # garder les max_pending lectures les plus récentes
+
+
+class BatchSubscription:
+    # Livre les lectures par lots à un callback, depuis un thread dédié :
+    # un consommateur lent ne bloque jamais le thread de traitement.
+    def __init__(self, callback: Callable[[List[TelemetryReading]], None], max_batch: int = 100,
+                 max_latency_ms: float = 50.0, max_pending: Optional[int] = None,
+                 shedding: str = SheddingPolicy.LATEST):
+        if shedding not in (SheddingPolicy.LATEST, SheddingPolicy.DROP_OLDEST):
+            raise ValueError(f"Politique de délestage inconnue: {shedding}")
+        self.callback = callback
+        self.max_batch = max(1, max_batch)
+        self.max_latency = max_latency_ms / 1000.0
+        self.max_pending = max_pending or self.max_batch * 10
+        self.shedding = shedding
+        self.logger = get_logger()
+        
+        self._pending: deque = deque()
+        self._oldest_pending = 0.0
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        
+        self.delivered = 0
+        self.batches = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.last_callback_ms = 0.0
+    
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+    
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._deliver_loop, daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+    
+    def offer(self, readings: List[TelemetryReading]) -> None:
+        # Appelé une fois par lot traité, pas une fois par lecture
+        if not readings:
+            return
+        with self._condition:
+            if not self._pending:
+                self._oldest_pending = time.monotonic()
+            self._pending.extend(readings)
+            
+            overflow = len(self._pending) - self.max_pending
+            if overflow > 0:
+                if self.shedding == SheddingPolicy.LATEST:
+                    latest = self._pending[-1]
+                    self.dropped += len(self._pending) - 1
+                    self._pending.clear()
+                    self._pending.append(latest)
+                else:
+                    for _ in range(overflow):
+                        self._pending.popleft()
+                    self.dropped += overflow
+            
+            self.max_depth = max(self.max_depth, len(self._pending))
+            if len(self._pending) >= self.max_batch:
+                self._condition.notify()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'callback': getattr(self.callback, '__qualname__', repr(self.callback)),
+            'queue_depth': self.queue_depth,
+            'max_depth': self.max_depth,
+            'delivered': self.delivered,
+            'batches': self.batches,
+            'dropped': self.dropped,
+            'last_callback_ms': self.last_callback_ms,
+        }
+    
+    def _deliver_loop(self) -> None:
+        while True:
+            with self._condition:
+                while self._running:
+                    if len(self._pending) >= self.max_batch:
+                        break
+                    if self._pending:
+                        remaining = self._oldest_pending + self.max_latency - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                    else:
+                        self._condition.wait(0.5)
+                
+                if not self._pending:
+                    if not self._running:
+                        return
+                    continue
+                
+                count = min(len(self._pending), self.max_batch)
+                batch = [self._pending.popleft() for _ in range(count)]
+                if self._pending:
+                    self._oldest_pending = time.monotonic()
+            
+            self._invoke(batch)
+    
+    def _invoke(self, batch: List[TelemetryReading]) -> None:
+        start = time.perf_counter()
+        try:
+            self.callback(batch)
+        except Exception as e:
+            self.logger.log_error_event("Batch callback error", str(e), {"exception_type": type(e).__name__})
+        self.last_callback_ms = (time.perf_counter() - start) * 1000
+        self.delivered += len(batch)
+        self.batches += 1
+
+
+class PullSubscription(BatchSubscription):
+    # Variante sans thread : le consommateur (ex. horloge d'affichage) récupère lui-même les
+    # lectures en attente à son rythme ; la même politique de délestage borne la file.
+    def __init__(self, max_pending: int = 10000, shedding: str = SheddingPolicy.DROP_OLDEST):
+        super().__init__(None, max_batch=max_pending, max_pending=max_pending, shedding=shedding)
+    
+    def start(self) -> None:
+        pass
+    
+    def stop(self) -> None:
+        pass
+    
+    def drain(self) -> List[TelemetryReading]:
+        with self._condition:
+            if not self._pending:
+                return []
+            batch = list(self._pending)
+            self._pending.clear()
+        self.delivered += len(batch)
+        self.batches += 1
+        return batch
+    
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats['callback'] = 'pull'
+        return stats
@@ -0,0 +1,292 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from ..core.telemetry_data import TelemetryReading, TelemetryDataValidator, ValidationResult
+from ..core.telemetry_frame import TelemetryFrame
+from .batch_dispatch import BatchSubscription, PullSubscription, SheddingPolicy
+from .spsc_ring import OverflowPolicy, SpscRing
+from .stream_writer import StreamingWriter
+from .time_buffer import TimeSortedBuffer
+from ..utils.latency import LatencyTracker
+from ..utils.logger import get_logger
+from ..utils.metrics import get_registry, weak_callback
+
+
+class TelemetryProcessor:
+    def __init__(self, buffer_size: int = 1000, validator: Optional[TelemetryDataValidator] = None,
+                 queue_capacity: int = 8192, overflow_policy: str = OverflowPolicy.BLOCK,
+                 batch_size: int = 256, name: str = "main"):
+        self.name = name
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.validator = validator or TelemetryDataValidator()
+        self.logger = get_logger()
+        
+        self._data_buffer = TimeSortedBuffer(buffer_size)
+        # File d'ingestion : un seul thread producteur (acquisition), le thread de traitement consomme.
+        # BLOCK par défaut : les lectures alimentent aussi le journal de vol, le producteur attend
+        # plutôt que de perdre des données (pertes éventuelles visibles dans get_pipeline_stats)
+        self._ingest = SpscRing(queue_capacity, overflow_policy)
+        self._callbacks: List[Callable[[TelemetryReading], None]] = []
+        self._batch_subscriptions: List[BatchSubscription] = []
+        self._writer: Optional[StreamingWriter] = None
+        # Tenu par le thread de traitement pendant l'écriture d'un lot
+        self._writer_lock = threading.Lock()
+        self._lock = threading.Lock()
+        
+        # Statistiques de validation : règle -> nombre de rejets
+        self._rejections: Dict[str, int] = {}
+        self._accepted_count = 0
+        self._rejected_count = 0
+        
+        self._is_processing = False
+        self._processing_thread: Optional[threading.Thread] = None
+        
+        # Latences par étape (histogrammes) ; l'acquisition et l'affichage y enregistrent aussi
+        # leurs étapes ('sensor_read', 'jitter', 'paint') pour une vue complète du pipeline
+        self.latency = LatencyTracker()
+        self._validation_latency = self.latency.histogram('validation')
+        self._enqueue_latency = self.latency.histogram('enqueue')
+        self._processing_latency = self.latency.histogram('processing')
+        self._callback_latency = self.latency.histogram('callback')
+        self._rate_mark = (time.monotonic(), 0)
+        self._input_rate = 0.0
+        self._register_metrics()
+    
+    def add_data_callback(self, callback: Callable[[TelemetryReading], None]) -> None:
+        self._callbacks.append(callback)
+    
+    def remove_data_callback(self, callback: Callable[[TelemetryReading], None]) -> None:
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+    
+    def add_batch_callback(self, callback: Callable[[List[TelemetryReading]], None], max_batch: int = 100,
+                           max_latency_ms: float = 50.0, max_pending: Optional[int] = None,
+                           shedding: str = SheddingPolicy.LATEST) -> BatchSubscription:
+        # Livraison par lots coalescés (au plus max_batch lectures, au plus max_latency_ms d'attente)
+        subscription = BatchSubscription(callback, max_batch, max_latency_ms, max_pending, shedding)
+        self._batch_subscriptions.append(subscription)
+        if self._is_processing:
+            subscription.start()
+        return subscription
+    
+    def add_pull_subscription(self, max_pending: int = 10000,
+                              shedding: str = SheddingPolicy.DROP_OLDEST) -> PullSubscription:
+        # Lectures mises de côté pour un consommateur qui les récupère lui-même (drain())
+        subscription = PullSubscription(max_pending, shedding)
+        self._batch_subscriptions.append(subscription)
+        return subscription
+    
+    def remove_batch_callback(self, callback) -> None:
+        for subscription in list(self._batch_subscriptions):
+            if subscription is callback or subscription.callback == callback:
+                subscription.stop()
+                self._batch_subscriptions.remove(subscription)
+    
+    def get_callback_stats(self) -> List[Dict[str, Any]]:
+        return [subscription.get_stats() for subscription in self._batch_subscriptions]
+    
+    def attach_writer(self, writer: StreamingWriter) -> None:
+        # Étape de persistance incrémentale, exécutée dans le thread de traitement
+        self.swap_writer(writer)
+    
+    def detach_writer(self) -> Optional[StreamingWriter]:
+        return self.swap_writer(None)
+    
+    def swap_writer(self, writer: Optional[StreamingWriter]) -> Optional[StreamingWriter]:
+        # Rotation sans perte : chaque lot est écrit entièrement dans l'ancien ou le nouveau fichier.
+        # Au retour, le thread de traitement n'utilise plus l'ancien writer, qui peut être finalisé.
+        with self._writer_lock:
+            previous, self._writer = self._writer, writer
+        if previous is not None:
+            previous.flush()
+        return previous
+    
+    def add_reading(self, reading: TelemetryReading) -> bool:
+        started = time.perf_counter_ns()
+        failed_rule = self.validator.check_reading(reading)
+        self._validation_latency.record(time.perf_counter_ns() - started)
+        if failed_rule is not None:
+            self._rejections[failed_rule] = self._rejections.get(failed_rule, 0) + 1
+            self._rejected_count += 1
+            return False
+        
+        if not self._ingest.push(reading):
+            return False
+        self._accepted_count += 1
+        return True
+    
+    def add_frame(self, frame: TelemetryFrame) -> ValidationResult:
+        # Validation vectorisée du lot entier, seules les lignes valides sont converties
+        started = time.perf_counter_ns()
+        result = self.validator.validate_batch(frame)
+        self._validation_latency.record(time.perf_counter_ns() - started)
+        for rule, count in result.rejections.items():
+            if count:
+                self._rejections[rule] = self._rejections.get(rule, 0) + count
+        
+        self._rejected_count += result.rejected_count
+        
+        valid = TelemetryFrame.from_array(frame.data[result.mask])
+        push = self._ingest.push
+        self._accepted_count += sum(1 for reading in valid.to_readings() if push(reading))
+        return result
+    
+    def get_ingest_stats(self) -> Dict[str, Any]:
+        return self._ingest.get_stats()
+    
+    def get_validation_stats(self) -> Dict[str, object]:
+        return {
+            'accepted': self._accepted_count,
+            'rejected': self._rejected_count,
+            'rejections_by_rule': dict(self._rejections)
+        }
+    
+    def _register_metrics(self) -> None:
+        # Valeurs déjà tenues par le processeur : publiées par callback, aucun coût par lecture
+        registry = get_registry()
+        labels = {'processor': self.name}
+        for name, help_text, kind, getter in (
+            ('telemetry_processor_queue_depth', "Lectures en attente dans la file d'ingestion", 'gauge',
+             lambda processor: len(processor._ingest)),
+            ('telemetry_processor_processed_total', "Lectures traitées", 'counter',
+             lambda processor: processor._ingest.popped),
+            ('telemetry_processor_accepted_total', "Lectures acceptées par la validation", 'counter',
+             lambda processor: processor._accepted_count),
+            ('telemetry_processor_rejected_total', "Lectures rejetées par la validation", 'counter',
+             lambda processor: processor._rejected_count),
+            ('telemetry_processor_dropped_total', "Lectures perdues par débordement de la file", 'counter',
+             lambda processor: processor._ingest.dropped_oldest + processor._ingest.dropped_newest
+             + processor._ingest.block_timeouts),
+            ('telemetry_processor_callback_seconds', "Durée de distribution aux callbacks par lot", 'histogram',
+             lambda processor: processor._callback_latency),
+        ):
+            registry.register_callback(name, help_text, kind, weak_callback(self, getter), labels)
+    
+    def get_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        # p50/p99/max (ms) par étape : sensor_read, jitter, validation, enqueue (temps passé
+        # dans la file d'ingestion), processing, callback, paint
+        return self.latency.snapshot()
+    
+    def get_pipeline_stats(self) -> Dict[str, Any]:
+        # Débit d'entrée mesuré sur au moins une demi-seconde entre deux appels
+        now = time.monotonic()
+        last_time, last_accepted = self._rate_mark
+        accepted = self._accepted_count
+        if now - last_time >= 0.5:
+            self._input_rate = (accepted - last_accepted) / (now - last_time)
+            self._rate_mark = (now, accepted)
+        
+        ingest = self._ingest.get_stats()
+        callbacks = self.get_callback_stats()
+        return {
+            'latency': self.get_latency_stats(),
+            'input_rate': self._input_rate,
+            'accepted': accepted,
+            'rejected': self._rejected_count,
+            'queue_depth': ingest['depth'],
+            'ingest_dropped': ingest['dropped_newest'] + ingest['dropped_oldest'] + ingest['block_timeouts'],
+            'callback_dropped': sum(stats['dropped'] for stats in callbacks),
+        }
+    
+    def start_processing(self) -> None:
+        if self._is_processing:
+            return
+        
+        self._is_processing = True
+        for subscription in self._batch_subscriptions:
+            subscription.start()
+        self._processing_thread = threading.Thread(target=self._process_loop, daemon=True)
+        self._processing_thread.start()
+    
+    def stop_processing(self) -> bool:
+        # Le thread vide la file avant de se terminer : tout ce qui a été accepté est traité.
+        # Retourne False si la vidange n'a pas abouti dans le délai (writer à ne pas finaliser).
+        self._is_processing = False
+        drained = True
+        thread = self._processing_thread
+        if thread and thread.is_alive():
+            thread.join(timeout=5.0)
+            if thread.is_alive():
+                drained = False
+                self.logger.log_error_event("Processing drain timeout", "File d'ingestion non vidée à l'arrêt",
+                                            {"processor": self.name, "queue_depth": len(self._ingest)})
+        self._processing_thread = None
+        for subscription in self._batch_subscriptions:
+            subscription.stop()
+        writer = self._writer
+        if writer is not None:
+            writer.flush()
+        return drained
+    
+    def _process_loop(self) -> None:
+        while self._is_processing:
+            batch, enqueued_ns = self._ingest.pop_batch_with_times(self.batch_size)
+            if not batch:
+                with self._writer_lock:
+                    if self._writer is not None:
+                        self._writer.poll()
+                self._ingest.wait(0.05)
+                continue
+            self._process_batch(batch, enqueued_ns)
+        
+        # Arrêt : traiter ce qui reste dans la file avant le vidage final du writer
+        while True:
+            batch, enqueued_ns = self._ingest.pop_batch_with_times(self.batch_size)
+            if not batch:
+                break
+            self._process_batch(batch, enqueued_ns)
+    
+    def _process_batch(self, batch: List[TelemetryReading], enqueued_ns) -> None:
+        started = time.perf_counter_ns()
+        self._enqueue_latency.record_many(started - enqueued_ns)
+        
+        with self._lock:
+            for reading in batch:
+                self._data_buffer.append(reading)
+        
+        with self._writer_lock:
+            writer = self._writer
+            if writer is not None:
+                for reading in batch:
+                    writer.write(reading)
+        processed = time.perf_counter_ns()
+        self._processing_latency.record(processed - started)
+        
+        for reading in batch:
+            self._notify_callbacks(reading)
+        for subscription in self._batch_subscriptions:
+            subscription.offer(batch)
+        self._callback_latency.record(time.perf_counter_ns() - processed)
+    
+    def _notify_callbacks(self, reading: TelemetryReading) -> None:
+        for callback in list(self._callbacks):
+            try:
+                callback(reading)
+            except Exception as e:
+                self.logger.log_error_event("Callback error", str(e), {"exception_type": type(e).__name__})
+    
+    def get_recent_data(self, duration_seconds: float = 60) -> List[TelemetryReading]:
+        cutoff_ns = time.time_ns() - int(duration_seconds * 1e9)
+        return self.get_range(cutoff_ns)
+    
+    def get_range(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> List[TelemetryReading]:
+        # Recherche dichotomique sur les timestamps du tampon, bornes incluses
+        with self._lock:
+            return self._data_buffer.range(start_ns, end_ns)
+    
+    def get_all_data(self) -> List[TelemetryReading]:
+        with self._lock:
+            return self._data_buffer.to_list()
+    
+    def get_all_frame(self) -> TelemetryFrame:
+        with self._lock:
+            return TelemetryFrame.from_readings(self._data_buffer.to_list())
+    
+    def get_latest_reading(self) -> Optional[TelemetryReading]:
+        with self._lock:
+            return self._data_buffer.latest()
+    
+    def clear_data(self) -> None:
+        with self._lock:
+            self._data_buffer.clear()
@@ -0,0 +1,162 @@
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Union
+from ..core.telemetry_data import TelemetryReading
+from ..core.telemetry_frame import TelemetryFrame, CHANNELS
+from .archive import ArchiveReader, ArchiveWriter
+from .flight_log import FlightLogReader, FlightLogWriter
+from .pyramid import DownsamplePyramid, PYRAMID_SUFFIX
+from .stream_writer import FlushPolicy, StreamingWriter, PART_SUFFIX
+from ..utils.logger import get_logger
+from ..utils.metrics import get_registry
+
+
+TelemetryData = Union[List[TelemetryReading], TelemetryFrame]
+
+
+class DataStorage:
+    def __init__(self, base_path: str = "data"):
+        self.base_path = Path(base_path)
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.logger = get_logger()
+        
+        # Métriques publiées : octets écrits (tous formats) et latence des vidages du journal en continu
+        registry = get_registry()
+        self.bytes_metric = registry.counter('telemetry_storage_bytes_written_total', "Octets écrits sur disque")
+        self.flush_metric = registry.histogram('telemetry_storage_flush_seconds',
+                                               "Durée des vidages du journal binaire en continu")
+    
+    def _resolve(self, filename: Optional[str], extension: str) -> Path:
+        if filename is None:
+            filename = f"telemetry_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+        return self.base_path / filename
+    
+    def save_to_json(self, data: TelemetryData, filename: Optional[str] = None) -> str:
+        filepath = self._resolve(filename, "json")
+        readings = data.to_readings() if isinstance(data, TelemetryFrame) else data
+        
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump([reading.to_dict() for reading in readings], f, indent=2)
+        
+        self.bytes_metric.inc(filepath.stat().st_size)
+        self.logger.log_system_event("Data saved", {"file": str(filepath), "format": "json", "count": len(readings)})
+        return str(filepath)
+    
+    def save_to_csv(self, data: TelemetryData, filename: Optional[str] = None) -> str:
+        filepath = self._resolve(filename, "csv")
+        # Le CSV est écrit directement depuis les colonnes du lot
+        frame = data if isinstance(data, TelemetryFrame) else TelemetryFrame.from_readings(data)
+        
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(CHANNELS)
+            writer.writerows(frame.data.tolist())
+        
+        self.bytes_metric.inc(filepath.stat().st_size)
+        self.logger.log_system_event("Data saved", {"file": str(filepath), "format": "csv", "count": len(frame)})
+        return str(filepath)
+    
+    def load_from_json(self, filename: str) -> List[TelemetryReading]:
+        filepath = self.base_path / filename
+        with open(filepath, 'r', encoding='utf-8') as f:
+            raw_data = json.load(f)
+        
+        return [TelemetryReading.from_dict(item) for item in raw_data]
+    
+    def load_frame_from_json(self, filename: str) -> TelemetryFrame:
+        return TelemetryFrame.from_readings(self.load_from_json(filename))
+    
+    def open_flight_log(self, filename: Optional[str] = None) -> FlightLogWriter:
+        # Journal binaire en ajout continu (réouvert en ajout s'il existe déjà)
+        filepath = self._resolve(filename, "rtlog")
+        self.logger.log_system_event("Flight log opened", {"file": str(filepath)})
+        return FlightLogWriter(filepath)
+    
+    def create_stream_writer(self, filename: Optional[str] = None,
+                             policy: Optional[FlushPolicy] = None) -> StreamingWriter:
+        # Écrit dans <fichier>.part jusqu'à finalize(), qui renomme vers le nom définitif
+        filepath = self._resolve(filename, "rtlog")
+        counter = 1
+        while filepath.exists() or filepath.with_name(filepath.name + PART_SUFFIX).exists():
+            # Plusieurs sessions dans la même seconde : ne jamais écraser un fichier finalisé
+            filepath = filepath.with_name(f"{filepath.stem.rsplit('~', 1)[0]}~{counter}{filepath.suffix}")
+            counter += 1
+        self.logger.log_system_event("Streaming writer opened", {"file": str(filepath)})
+        return StreamingWriter(filepath, policy, self.bytes_metric, self.flush_metric)
+    
+    def save_to_binary(self, data: TelemetryData, filename: Optional[str] = None) -> str:
+        frame = data if isinstance(data, TelemetryFrame) else TelemetryFrame.from_readings(data)
+        filepath = self._resolve(filename, "rtlog")
+        if filepath.exists():
+            filepath.unlink()
+        
+        with FlightLogWriter(filepath) as writer:
+            writer.append_frame(frame)
+        
+        self.bytes_metric.inc(filepath.stat().st_size)
+        self.logger.log_system_event("Data saved", {"file": str(filepath), "format": "rtlog", "count": len(frame)})
+        return str(filepath)
+    
+    def load_flight_log(self, filename: str) -> FlightLogReader:
+        # Lecture par memmap : ouverture instantanée, aucune donnée parsée
+        return FlightLogReader(self.base_path / filename)
+    
+    def load_flight_pyramid(self, filename: str, rebuild: bool = False) -> DownsamplePyramid:
+        # Résumés multi-résolution mis en cache à côté du vol (<fichier>.pyr.npz), reconstruits
+        # si le fichier source a changé depuis
+        filepath = self.base_path / filename
+        cache_path = filepath.with_name(filepath.name + PYRAMID_SUFFIX)
+        source_mtime_ns = filepath.stat().st_mtime_ns
+        
+        # Le JSON n'est parsé qu'une fois : le niveau brut est inclus dans le cache
+        reader = FlightLogReader(filepath) if filepath.suffix != '.json' else None
+        base_level = 4 if reader is not None else 0
+        source = None
+        
+        if not rebuild and cache_path.exists():
+            try:
+                meta = DownsamplePyramid.read_meta(cache_path)
+                fresh = meta['source_mtime_ns'] == source_mtime_ns and (
+                    reader is None or meta['source_count'] == len(reader))
+                if fresh:
+                    # Tri éventuel seulement une fois le cache validé
+                    source = reader.sorted_records() if reader is not None else None
+                    return DownsamplePyramid.load(cache_path, source)
+            except (OSError, ValueError, KeyError) as e:
+                self.logger.log_error_event("Pyramid cache unreadable", str(e))
+        
+        # Les résumés supposent des timestamps croissants
+        if reader is not None and source is None:
+            source = reader.sorted_records()
+        records = source if source is not None else self.load_frame_from_json(filename).data
+        pyramid = DownsamplePyramid.build(records, base_level=base_level, keep_source=source is not None)
+        pyramid.save(cache_path, source_mtime_ns)
+        self.logger.log_system_event("Pyramid built", {"file": str(cache_path), "count": pyramid.source_count,
+                                                       "levels": len(pyramid.levels)})
+        return pyramid
+    
+    def save_to_archive(self, data: Union[TelemetryData, FlightLogReader], filename: Optional[str] = None,
+                        chunk_seconds: float = 1.0, codec: str = 'zlib') -> str:
+        # Archive long terme : colonnes compressées par tranches de temps, index en pied de fichier
+        filepath = self._resolve(filename, "rtarc")
+        
+        with ArchiveWriter(filepath, chunk_seconds=chunk_seconds, codec=codec) as writer:
+            if isinstance(data, FlightLogReader):
+                # Conversion par blocs depuis le memmap, sans charger tout le vol
+                block = 65536
+                for start in range(0, len(data), block):
+                    writer.add_frame(data.to_frame(data.records[start:start + block]))
+                count = len(data)
+            else:
+                frame = data if isinstance(data, TelemetryFrame) else TelemetryFrame.from_readings(data)
+                writer.add_frame(frame)
+                count = len(frame)
+        
+        self.bytes_metric.inc(filepath.stat().st_size)
+        self.logger.log_system_event("Data saved", {"file": str(filepath), "format": "rtarc", "count": count})
+        return str(filepath)
+    
+    def open_archive(self, filename: str) -> ArchiveReader:
+        return ArchiveReader(self.base_path / filename)
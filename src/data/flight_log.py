@@ -0,0 +1,248 @@
+import bisect
+import json
+import os
+import struct
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+import numpy as np
+from ..core.telemetry_data import TelemetryReading
+from ..core.telemetry_frame import TelemetryFrame, TELEMETRY_DTYPE
+
+
+# Format du journal de vol binaire :
+#   magic (8 octets) | version, flags, taille d'en-tête, taille d'enregistrement (<HHII)
+#   | schéma JSON des canaux | padding jusqu'à un multiple de 64 octets
+#   | enregistrements de taille fixe (little-endian), ajoutés en fin de fichier
+# Les enregistrements sont dans l'ordre d'arrivée. Si un timestamp recule (plusieurs capteurs,
+# paquets réseau désordonnés), le writer lève FLAG_UNSORTED dans l'en-tête et le reader
+# abandonne la recherche dichotomique pour un masque.
+MAGIC = b'RKTFLOG\x00'
+FORMAT_VERSION = 1
+FLAG_UNSORTED = 0x1
+_PREAMBLE = struct.Struct('<8sHHII')
+_FLAGS = struct.Struct('<H')
+_FLAGS_OFFSET = 10
+_HEADER_ALIGN = 64
+
+
+def _schema_from_dtype(dtype: np.dtype) -> List[Tuple[str, str]]:
+    return [(name, dtype.fields[name][0].str) for name in dtype.names]
+
+
+def _build_header(dtype: np.dtype) -> bytes:
+    schema = json.dumps({'channels': _schema_from_dtype(dtype)}).encode('utf-8')
+    size = _PREAMBLE.size + len(schema)
+    size += -size % _HEADER_ALIGN
+    preamble = _PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, size, dtype.itemsize)
+    return (preamble + schema).ljust(size, b'\x00')
+
+
+def read_header(path: Union[str, Path]) -> Tuple[int, int, np.dtype]:
+    # Retourne (version, taille d'en-tête, dtype des enregistrements)
+    version, _, header_size, dtype = _read_header(path)
+    return version, header_size, dtype
+
+
+def read_flags(path: Union[str, Path]) -> int:
+    return _read_header(path)[1]
+
+
+def _read_header(path: Union[str, Path]) -> Tuple[int, int, int, np.dtype]:
+    with open(path, 'rb') as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise ValueError(f"En-tête tronqué: {path}")
+        magic, version, flags, header_size, record_size = _PREAMBLE.unpack(preamble)
+        if magic != MAGIC:
+            raise ValueError(f"Fichier non reconnu comme journal de vol: {path}")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"Version de format non supportée: {version}")
+        schema = json.loads(f.read(header_size - _PREAMBLE.size).rstrip(b'\x00'))
+    
+    dtype = np.dtype([(name, code) for name, code in schema['channels']])
+    if dtype.itemsize != record_size:
+        raise ValueError(f"Schéma incohérent: {dtype.itemsize} != {record_size}")
+    return version, flags, header_size, dtype
+
+
+class FlightLogWriter:
+    def __init__(self, path: Union[str, Path], dtype: np.dtype = TELEMETRY_DTYPE):
+        self.path = Path(path)
+        self.dtype = dtype
+        self._row = np.empty(1, dtype=dtype)
+        self._records_written = 0
+        self._has_timestamps = 'timestamp_ns' in dtype.names
+        self._last_ns: Optional[int] = None
+        self._flags = 0
+        
+        if self.path.exists() and self.path.stat().st_size > 0:
+            _, self._flags, header_size, existing = _read_header(self.path)
+            if existing != dtype:
+                raise ValueError(f"Schéma différent dans {self.path}, impossible d'ajouter")
+            # Ignorer un éventuel enregistrement partiel laissé par un arrêt brutal
+            records = (self.path.stat().st_size - header_size) // dtype.itemsize
+            os.truncate(self.path, header_size + records * dtype.itemsize)
+            if records and self._has_timestamps:
+                last = np.memmap(self.path, dtype=dtype, mode='r',
+                                 offset=header_size + (records - 1) * dtype.itemsize, shape=(1,))
+                self._last_ns = int(last['timestamp_ns'][0])
+                del last
+            self._file = open(self.path, 'ab')
+        else:
+            self._file = open(self.path, 'wb')
+            self._file.write(_build_header(dtype))
+    
+    @property
+    def records_written(self) -> int:
+        return self._records_written
+    
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+    
+    @property
+    def is_sorted(self) -> bool:
+        return not self._flags & FLAG_UNSORTED
+    
+    def append(self, reading: TelemetryReading) -> None:
+        if self._last_ns is not None and reading.timestamp_ns < self._last_ns and self.is_sorted:
+            self._mark_unsorted()
+        self._last_ns = reading.timestamp_ns
+        self._row[0] = tuple(np.nan if value is None else value for value in reading.as_tuple())
+        self._file.write(self._row.tobytes())
+        self._records_written += 1
+    
+    def append_frame(self, frame: TelemetryFrame) -> None:
+        if not len(frame):
+            return
+        data = frame.data
+        if data.dtype != self.dtype:
+            data = data.astype(self.dtype)
+        if self._has_timestamps:
+            timestamps = data['timestamp_ns']
+            if self.is_sorted and ((self._last_ns is not None and timestamps[0] < self._last_ns)
+                                   or np.any(timestamps[1:] < timestamps[:-1])):
+                self._mark_unsorted()
+            self._last_ns = int(timestamps[-1])
+        self._file.write(data.tobytes())
+        self._records_written += len(data)
+    
+    def _mark_unsorted(self) -> None:
+        # Mise à jour immédiate de l'en-tête : un fichier interrompu reste correctement marqué
+        self._flags |= FLAG_UNSORTED
+        self._file.flush()
+        with open(self.path, 'r+b') as f:
+            f.seek(_FLAGS_OFFSET)
+            f.write(_FLAGS.pack(self._flags))
+    
+    def flush(self) -> None:
+        self._file.flush()
+    
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+    
+    def __enter__(self) -> 'FlightLogWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class _TimestampIndex:
+    # Séquence indexable pour bisect : ne lit que les O(log n) enregistrements visités
+    def __init__(self, column: np.ndarray):
+        self._column = column
+    
+    def __len__(self) -> int:
+        return len(self._column)
+    
+    def __getitem__(self, index: int) -> int:
+        return int(self._column[index])
+
+
+class FlightLogReader:
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.version, self.flags, self.header_size, self.dtype = _read_header(self.path)
+        
+        count = (self.path.stat().st_size - self.header_size) // self.dtype.itemsize
+        if count > 0:
+            self.records = np.memmap(self.path, dtype=self.dtype, mode='r',
+                                     offset=self.header_size, shape=(count,))
+        else:
+            self.records = np.empty(0, dtype=self.dtype)
+    
+    @property
+    def channels(self) -> Tuple[str, ...]:
+        return self.dtype.names
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def column(self, name: str) -> np.ndarray:
+        return self.records[name]
+    
+    @property
+    def is_sorted(self) -> bool:
+        return not self.flags & FLAG_UNSORTED
+    
+    @property
+    def start_ns(self) -> Optional[int]:
+        if not len(self.records):
+            return None
+        timestamps = self.records['timestamp_ns']
+        return int(timestamps[0] if self.is_sorted else timestamps.min())
+    
+    @property
+    def end_ns(self) -> Optional[int]:
+        if not len(self.records):
+            return None
+        timestamps = self.records['timestamp_ns']
+        return int(timestamps[-1] if self.is_sorted else timestamps.max())
+    
+    def index_range(self, start_ns: int, end_ns: int) -> Tuple[int, int]:
+        if not self.is_sorted:
+            raise ValueError(f"Journal non trié par timestamp, pas de plage d'indices: {self.path}")
+        index = _TimestampIndex(self.records['timestamp_ns'])
+        return bisect.bisect_left(index, start_ns), bisect.bisect_right(index, end_ns)
+    
+    def time_slice(self, start_ns: int, end_ns: int) -> np.ndarray:
+        # [start_ns, end_ns] inclus. Vue sur le memmap sans copie si le journal est trié,
+        # sinon copie des enregistrements retenus par un masque (ordre d'arrivée conservé)
+        if not self.is_sorted:
+            timestamps = self.records['timestamp_ns']
+            return self.records[(timestamps >= start_ns) & (timestamps <= end_ns)]
+        low, high = self.index_range(start_ns, end_ns)
+        return self.records[low:high]
+    
+    def sorted_records(self) -> np.ndarray:
+        # Enregistrements par timestamp croissant : le memmap lui-même s'il est déjà trié
+        if self.is_sorted:
+            return self.records
+        return self.records[np.argsort(self.records['timestamp_ns'], kind='stable')]
+    
+    def to_frame(self, records: Optional[np.ndarray] = None) -> TelemetryFrame:
+        # Conversion vers le schéma courant : canaux absents du fichier -> NaN
+        if records is None:
+            records = self.records
+        data = np.zeros(len(records), dtype=TELEMETRY_DTYPE)
+        for name in TELEMETRY_DTYPE.names:
+            if name in self.dtype.names:
+                data[name] = records[name]
+            elif data.dtype.fields[name][0].kind == 'f':
+                data[name] = np.nan
+        return TelemetryFrame.from_array(data)
+    
+    def to_readings(self) -> List[TelemetryReading]:
+        return self.to_frame().to_readings()
+    
+    def close(self) -> None:
+        # Le mapping est libéré quand la dernière vue disparaît
+        self.records = np.empty(0, dtype=self.dtype)
+    
+    def __enter__(self) -> 'FlightLogReader':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
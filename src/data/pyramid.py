@@ -0,0 +1,174 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Sequence, Union
+import numpy as np
+
+
+# Pyramide de résumés pour la navigation dans un vol enregistré : le niveau k regroupe
+# 2**k échantillons par case (min, max, moyenne de chaque canal + bornes temporelles).
+# Chaque niveau est obtenu du précédent par réduction deux à deux : construction en O(n).
+PYRAMID_SUFFIX = ".pyr.npz"
+PYRAMID_VERSION = 1
+STATS = ('min', 'max', 'mean')
+
+
+class PyramidSlice(NamedTuple):
+    start_ns: np.ndarray
+    end_ns: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    mean: np.ndarray
+    bucket_size: int
+
+
+def _reduce(level: Dict[str, np.ndarray], factor: int, channels: Sequence[str]) -> Dict[str, np.ndarray]:
+    # Regroupe les cases par paquets de `factor` ; le dernier paquet peut être incomplet
+    count = len(level['start_ns'])
+    full = (count // factor) * factor
+    has_tail = full < count
+    
+    def combine(values: np.ndarray, ufunc) -> np.ndarray:
+        head = ufunc.reduce(values[:full].reshape(-1, factor), axis=1)
+        if has_tail:
+            head = np.append(head, ufunc.reduce(values[full:]))
+        return head
+    
+    result = {'start_ns': level['start_ns'][::factor].copy()}
+    end_ns = level['end_ns'][factor - 1::factor]
+    result['end_ns'] = np.append(end_ns, level['end_ns'][-1]) if has_tail else end_ns.copy()
+    for channel in channels:
+        # fmin/fmax ignorent les NaN (canaux optionnels absents)
+        result[f'{channel}.min'] = combine(level[f'{channel}.min'], np.fmin)
+        result[f'{channel}.max'] = combine(level[f'{channel}.max'], np.fmax)
+        result[f'{channel}.sum'] = combine(level[f'{channel}.sum'], np.add)
+        result[f'{channel}.count'] = combine(level[f'{channel}.count'], np.add)
+    return result
+
+
+def _finalize(level: Dict[str, np.ndarray], channels: Sequence[str]) -> Dict[str, np.ndarray]:
+    # Les sommes et effectifs ne servent qu'à la construction : seule la moyenne est conservée
+    result = {'start_ns': level['start_ns'], 'end_ns': level['end_ns']}
+    for channel in channels:
+        counts = level[f'{channel}.count']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(counts > 0, level[f'{channel}.sum'] / np.maximum(counts, 1), np.nan)
+        result[f'{channel}.min'] = level[f'{channel}.min']
+        result[f'{channel}.max'] = level[f'{channel}.max']
+        result[f'{channel}.mean'] = mean
+    return result
+
+
+class DownsamplePyramid:
+    def __init__(self, levels: List[Dict[str, np.ndarray]], channels: Sequence[str], base_level: int,
+                 source_count: int, source=None):
+        # levels[i] regroupe 2**(base_level + i) échantillons par case
+        self.levels = levels
+        self.channels = tuple(channels)
+        self.base_level = base_level
+        self.source_count = source_count
+        # Enregistrements bruts (memmap) pour les zooms plus fins que le premier niveau
+        self.source = source
+    
+    @classmethod
+    def build(cls, records: np.ndarray, base_level: int = 4, keep_source: bool = True) -> 'DownsamplePyramid':
+        # records : tableau structuré (memmap d'un FlightLogReader ou TelemetryFrame.data)
+        channels = [name for name in records.dtype.names
+                    if name != 'timestamp_ns' and records.dtype.fields[name][0].kind == 'f']
+        count = len(records)
+        levels: List[Dict[str, np.ndarray]] = []
+        
+        if count:
+            timestamps = np.asarray(records['timestamp_ns'], dtype=np.int64)
+            raw = {'start_ns': timestamps, 'end_ns': timestamps}
+            for channel in channels:
+                values = np.asarray(records[channel], dtype=float)
+                valid = ~np.isnan(values)
+                raw[f'{channel}.min'] = values
+                raw[f'{channel}.max'] = values
+                raw[f'{channel}.sum'] = np.where(valid, values, 0.0)
+                raw[f'{channel}.count'] = valid.astype(np.int64)
+            
+            level = _reduce(raw, 2 ** base_level, channels) if base_level else raw
+            del raw
+            levels.append(_finalize(level, channels))
+            while len(level['start_ns']) > 1:
+                level = _reduce(level, 2, channels)
+                levels.append(_finalize(level, channels))
+        
+        return cls(levels, channels, base_level, count, records if keep_source else None)
+    
+    def bucket_size(self, level_index: int) -> int:
+        return 2 ** (self.base_level + level_index)
+    
+    def query(self, channel: str, start_ns: int, end_ns: int, max_points: int = 2000) -> PyramidSlice:
+        # Résolution la plus fine dont le nombre de cases sur [start_ns, end_ns] tient dans
+        # max_points : le coût ne dépend que de la largeur d'affichage
+        if channel not in self.channels:
+            raise KeyError(f"Canal inconnu: {channel}")
+        
+        if self.source is not None and len(self.source):
+            timestamps = self.source['timestamp_ns']
+            low = int(np.searchsorted(timestamps, start_ns, side='left'))
+            high = int(np.searchsorted(timestamps, end_ns, side='right'))
+            if high - low <= max_points:
+                times = np.asarray(timestamps[low:high], dtype=np.int64)
+                values = np.asarray(self.source[channel][low:high], dtype=float)
+                return PyramidSlice(times, times, values, values, values, 1)
+        
+        for index, level in enumerate(self.levels):
+            low, high = self._bucket_range(level, start_ns, end_ns)
+            if high - low <= max_points or index == len(self.levels) - 1:
+                return PyramidSlice(level['start_ns'][low:high], level['end_ns'][low:high],
+                                    level[f'{channel}.min'][low:high], level[f'{channel}.max'][low:high],
+                                    level[f'{channel}.mean'][low:high], self.bucket_size(index))
+        
+        empty = np.empty(0)
+        return PyramidSlice(empty.astype(np.int64), empty.astype(np.int64), empty, empty, empty, 1)
+    
+    @staticmethod
+    def _bucket_range(level: Dict[str, np.ndarray], start_ns: int, end_ns: int):
+        # Cases qui chevauchent l'intervalle : de celle contenant start_ns à celle contenant end_ns
+        low = int(np.searchsorted(level['end_ns'], start_ns, side='left'))
+        high = int(np.searchsorted(level['start_ns'], end_ns, side='right'))
+        return low, max(low, high)
+    
+    def save(self, path: Union[str, Path], source_mtime_ns: int = 0) -> None:
+        path = Path(path)
+        meta = {
+            'version': PYRAMID_VERSION,
+            'channels': list(self.channels),
+            'base_level': self.base_level,
+            'source_count': self.source_count,
+            'source_mtime_ns': source_mtime_ns,
+            'levels': len(self.levels),
+        }
+        arrays = {'meta': np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8)}
+        for index, level in enumerate(self.levels):
+            for name, values in level.items():
+                arrays[f'L{index}.{name}'] = values
+        
+        # Écriture atomique : un cache tronqué ne doit jamais être relu
+        temp_path = path.with_name(path.name + '.tmp')
+        with open(temp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(temp_path, path)
+    
+    @staticmethod
+    def read_meta(path: Union[str, Path]) -> dict:
+        with np.load(path) as archive:
+            return json.loads(archive['meta'].tobytes().decode('utf-8'))
+    
+    @classmethod
+    def load(cls, path: Union[str, Path], source=None) -> 'DownsamplePyramid':
+        with np.load(path) as archive:
+            meta = json.loads(archive['meta'].tobytes().decode('utf-8'))
+            if meta['version'] != PYRAMID_VERSION:
+                raise ValueError(f"Version de pyramide non supportée: {meta['version']}")
+            
+            levels = []
+            names = ['start_ns', 'end_ns'] + [f'{channel}.{stat}' for channel in meta['channels'] for stat in STATS]
+            for index in range(meta['levels']):
+                levels.append({name: archive[f'L{index}.{name}'] for name in names})
+        
+        return cls(levels, meta['channels'], meta['base_level'], meta['source_count'], source)
@@ -0,0 +1,162 @@
+import threading
+import time
+from typing import Any, Dict, List
+import numpy as np
+
+
+class OverflowPolicy:
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+class SpscRing:
+    # File circulaire mono-producteur / mono-consommateur, préallouée.
+    # Le producteur ne modifie que _reserved et _tail, le consommateur que _head : sous le GIL
+    # ces affectations sont atomiques, aucun verrou n'est pris par élément.
+    # DROP_OLDEST : le producteur annonce chaque écriture (_reserved) avant de toucher la case ;
+    # le consommateur relit ce compteur après sa copie et écarte toute case réécrite entre-temps,
+    # publiée ou non (principe du seqlock). L'ordre FIFO est ainsi garanti.
+    def __init__(self, capacity: int = 4096, overflow: str = OverflowPolicy.DROP_OLDEST,
+                 block_timeout: float = 1.0):
+        if overflow not in (OverflowPolicy.BLOCK, OverflowPolicy.DROP_OLDEST, OverflowPolicy.DROP_NEWEST):
+            raise ValueError(f"Politique de débordement inconnue: {overflow}")
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self.capacity = size
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self._mask = size - 1
+        
+        self._slots = np.empty(size, dtype=object)
+        self._enqueue_ns = np.zeros(size, dtype=np.int64)
+        self._head = 0
+        self._tail = 0
+        # Position de la prochaine écriture annoncée (>= _tail), publiée avant l'écriture
+        self._reserved = 0
+        
+        # Réveil du consommateur uniquement lorsqu'il dort : pas de verrou en régime établi
+        self._consumer_waiting = False
+        self._wakeup = threading.Event()
+        
+        # Compteurs (chacun n'est écrit que par un seul côté)
+        self.pushed = 0
+        self.popped = 0
+        self.dropped_newest = 0
+        self.block_timeouts = 0
+        # Positions sautées par le consommateur (écrasées avant d'être lues)
+        self._skipped = 0
+    
+    def __len__(self) -> int:
+        return min(self._tail - self._head, self.capacity)
+    
+    @property
+    def dropped_oldest(self) -> int:
+        # Sautées par le consommateur + écrasées encore en attente : au repos,
+        # pushed == popped + dropped_oldest + len(ring)
+        head = self._head
+        return self._skipped + max(0, self._tail - head - self.capacity)
+    
+    def push(self, item: Any) -> bool:
+        tail = self._tail
+        if tail - self._head >= self.capacity:
+            if self.overflow == OverflowPolicy.DROP_NEWEST:
+                self.dropped_newest += 1
+                return False
+            if self.overflow == OverflowPolicy.BLOCK and not self._wait_for_space(tail):
+                self.block_timeouts += 1
+                return False
+            # DROP_OLDEST : on écrase la plus ancienne, le consommateur la comptera en la sautant
+        
+        self._reserved = tail + 1
+        index = tail & self._mask
+        self._slots[index] = item
+        self._enqueue_ns[index] = time.perf_counter_ns()
+        self._tail = tail + 1
+        self.pushed += 1
+        
+        if self._consumer_waiting:
+            self._wakeup.set()
+        return True
+    
+    def pop_batch(self, max_items: int = 256) -> List[Any]:
+        items, _ = self._pop(max_items, with_times=False)
+        return items
+    
+    def pop_batch_with_times(self, max_items: int = 256):
+        # Retourne aussi les instants d'enfilement (perf_counter_ns) pour mesurer la latence
+        return self._pop(max_items, with_times=True)
+    
+    def wait(self, timeout: float) -> bool:
+        # Bloque le consommateur jusqu'à l'arrivée de données ou l'expiration du délai
+        if self._tail != self._head:
+            return True
+        self._consumer_waiting = True
+        try:
+            if self._tail == self._head:
+                self._wakeup.wait(timeout)
+        finally:
+            self._consumer_waiting = False
+            self._wakeup.clear()
+        return self._tail != self._head
+    
+    def clear(self) -> None:
+        # À appeler côté consommateur ; les éléments écartés sont comptés comme perdus
+        head, tail = self._head, self._tail
+        self._skipped += tail - head
+        self._head = tail
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'capacity': self.capacity,
+            'depth': len(self),
+            'overflow_policy': self.overflow,
+            'pushed': self.pushed,
+            'popped': self.popped,
+            'dropped_newest': self.dropped_newest,
+            'dropped_oldest': self.dropped_oldest,
+            'block_timeouts': self.block_timeouts,
+        }
+    
+    def _pop(self, max_items: int, with_times: bool):
+        start_head = head = self._head
+        tail = self._tail
+        if tail - head > self.capacity:
+            # Le producteur a fait le tour : les plus anciens sont perdus
+            head = tail - self.capacity
+        
+        count = min(tail - head, max_items)
+        if count <= 0:
+            return [], None
+        
+        start = head & self._mask
+        end = start + count
+        if end <= self.capacity:
+            items = self._slots[start:end].tolist()
+            times = self._enqueue_ns[start:end].copy() if with_times else None
+        else:
+            wrap = end - self.capacity
+            items = self._slots[start:].tolist() + self._slots[:wrap].tolist()
+            times = np.concatenate((self._enqueue_ns[start:], self._enqueue_ns[:wrap])) if with_times else None
+        
+        # Cases réécrites pendant la copie, y compris une écriture annoncée mais pas encore publiée :
+        # la position p est invalide dès que l'écriture de p + capacity a été annoncée
+        overwritten = self._reserved - self.capacity - head
+        if overwritten > 0:
+            overwritten = min(overwritten, count)
+            items = items[overwritten:]
+            times = times[overwritten:] if with_times else None
+        
+        self._head = head + count
+        self.popped += len(items)
+        self._skipped += head + count - start_head - len(items)
+        return items, times
+    
+    def _wait_for_space(self, tail: int) -> bool:
+        deadline = time.monotonic() + self.block_timeout
+        while tail - self._head >= self.capacity:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.0001)
+        return True
@@ -0,0 +1,107 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+from ..core.telemetry_data import TelemetryReading
+from ..core.telemetry_frame import TelemetryFrame, TELEMETRY_DTYPE
+from ..utils.metrics import Counter, Histogram
+from .flight_log import FlightLogWriter
+
+
+PART_SUFFIX = ".part"
+
+
+@dataclass
+class FlushPolicy:
+    max_samples: int = 256  # écrire dès que N échantillons sont en attente
+    max_interval_ms: float = 500.0  # ... ou dès que le plus ancien attend depuis T ms
+
+
+class StreamingWriter:
+    def __init__(self, path: Union[str, Path], policy: Optional[FlushPolicy] = None,
+                 bytes_metric: Optional[Counter] = None, flush_metric: Optional[Histogram] = None):
+        self.policy = policy or FlushPolicy()
+        # Métriques optionnelles fournies par DataStorage
+        self.bytes_metric = bytes_metric
+        self.flush_metric = flush_metric
+        self.final_path = Path(path)
+        self.part_path = self.final_path.with_name(self.final_path.name + PART_SUFFIX)
+        
+        self._log = FlightLogWriter(self.part_path)
+        self._pending = TelemetryFrame(capacity=self.policy.max_samples)
+        self._oldest_pending = 0.0
+        self._lock = threading.Lock()
+        self._finalized = False
+        
+        self.samples_written = 0
+        self.flush_count = 0
+    
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+    
+    @property
+    def finalized(self) -> bool:
+        return self._finalized
+    
+    def write(self, reading: TelemetryReading) -> None:
+        with self._lock:
+            if self._finalized:
+                return
+            if not len(self._pending):
+                self._oldest_pending = time.monotonic()
+            self._pending.append(reading)
+            if self._flush_due():
+                self._flush_locked()
+    
+    def write_frame(self, frame: TelemetryFrame) -> None:
+        with self._lock:
+            if self._finalized or not len(frame):
+                return
+            if not len(self._pending):
+                self._oldest_pending = time.monotonic()
+            self._pending.extend_frame(frame)
+            if self._flush_due():
+                self._flush_locked()
+    
+    def poll(self) -> None:
+        # Appelé périodiquement : applique la politique temporelle sans nouvelle donnée
+        with self._lock:
+            if len(self._pending) and self._flush_due():
+                self._flush_locked()
+    
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+    
+    def finalize(self) -> str:
+        # Sauvegarde = vidage du tampon + renommage atomique du fichier .part
+        with self._lock:
+            if not self._finalized:
+                self._flush_locked()
+                self._log.close()
+                os.replace(self.part_path, self.final_path)
+                self._finalized = True
+        return str(self.final_path)
+    
+    def _flush_due(self) -> bool:
+        if len(self._pending) >= self.policy.max_samples:
+            return True
+        elapsed_ms = (time.monotonic() - self._oldest_pending) * 1000
+        return elapsed_ms >= self.policy.max_interval_ms
+    
+    def _flush_locked(self) -> None:
+        if self._finalized or not len(self._pending):
+            return
+        started = time.perf_counter_ns()
+        self._log.append_frame(self._pending)
+        self._log.flush()
+        if self.flush_metric is not None:
+            self.flush_metric.observe_ns(time.perf_counter_ns() - started)
+        if self.bytes_metric is not None:
+            self.bytes_metric.inc(len(self._pending) * TELEMETRY_DTYPE.itemsize)
+        self.samples_written += len(self._pending)
+        self.flush_count += 1
+        self._pending.clear()
@@ -0,0 +1,79 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from ..core.telemetry_data import TelemetryReading
+
+
+class TimeSortedBuffer:
+    # Tampon circulaire trié par timestamp. Les lectures sont stockées dans une zone
+    # de 2 x capacité : la fenêtre valide [start:end] reste contiguë, ce qui permet
+    # une recherche dichotomique directe sur le tableau des timestamps.
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("La capacité doit être positive")
+        self.capacity = capacity
+        self._items: List[Optional[TelemetryReading]] = [None] * (2 * capacity)
+        self._times = np.zeros(2 * capacity, dtype=np.int64)
+        self._start = 0
+        self._end = 0
+    
+    def __len__(self) -> int:
+        return self._end - self._start
+    
+    @property
+    def timestamps(self) -> np.ndarray:
+        # Vue monotone croissante sur les timestamps (ns) présents
+        return self._times[self._start:self._end]
+    
+    def append(self, reading: TelemetryReading) -> None:
+        timestamp = reading.timestamp_ns
+        if self._end == self._start + self.capacity:
+            if timestamp < self._times[self._start]:
+                return  # Plus ancien que toute la fenêtre : déjà expiré
+            self._items[self._start] = None
+            self._start += 1
+        if self._end == len(self._items):
+            self._compact()
+        
+        end = self._end
+        if end > self._start and timestamp < self._times[end - 1]:
+            # Lecture hors ordre (rare) : insertion à sa place pour garder le tri
+            position = self._start + int(np.searchsorted(self.timestamps, timestamp, side='right'))
+            self._times[position + 1:end + 1] = self._times[position:end]
+            self._items[position + 1:end + 1] = self._items[position:end]
+        else:
+            position = end
+        
+        self._times[position] = timestamp
+        self._items[position] = reading
+        self._end = end + 1
+    
+    def index_range(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> Tuple[int, int]:
+        times = self.timestamps
+        low = 0 if start_ns is None else int(np.searchsorted(times, start_ns, side='left'))
+        high = len(times) if end_ns is None else int(np.searchsorted(times, end_ns, side='right'))
+        return self._start + low, self._start + max(low, high)
+    
+    def range(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> List[TelemetryReading]:
+        # O(log n) pour localiser la plage, seules les références de la plage sont copiées
+        low, high = self.index_range(start_ns, end_ns)
+        return self._items[low:high]
+    
+    def latest(self) -> Optional[TelemetryReading]:
+        return self._items[self._end - 1] if self._end > self._start else None
+    
+    def to_list(self) -> List[TelemetryReading]:
+        return self._items[self._start:self._end]
+    
+    def clear(self) -> None:
+        self._items = [None] * (2 * self.capacity)
+        self._start = 0
+        self._end = 0
+    
+    def _compact(self) -> None:
+        # Recopie amortie O(1) : au plus une fois toutes les `capacity` insertions
+        count = self._end - self._start
+        self._times[:count] = self._times[self._start:self._end]
+        self._items[:count] = self._items[self._start:self._end]
+        self._items[count:] = [None] * (len(self._items) - count)
+        self._start = 0
+        self._end = count
@@ -0,0 +1,61 @@
+import time
+from typing import Callable, List
+from PyQt5.QtCore import QObject, QTimer, Qt
+from ..utils.logger import get_logger
+
+
+class FrameClock(QObject):
+    # Horloge d'affichage unique : toutes les mises à jour du tableau de bord sont faites
+    # une fois par image, au plus `fps` fois par seconde, quel que soit le débit de données
+    def __init__(self, fps: float = 30.0, parent=None):
+        super().__init__(parent)
+        self.logger = get_logger()
+        self._callbacks: List[Callable[[], None]] = []
+        
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+        self.set_fps(fps)
+        
+        self.frames = 0
+        self.last_frame_ms = 0.0
+        self.max_frame_ms = 0.0
+    
+    @property
+    def fps(self) -> float:
+        return self._fps
+    
+    def set_fps(self, fps: float) -> None:
+        if fps <= 0:
+            raise ValueError("fps doit être strictement positif")
+        self._fps = fps
+        self._timer.setInterval(max(1, round(1000 / fps)))
+    
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        self._callbacks.append(callback)
+    
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+    
+    def start(self) -> None:
+        self._timer.start()
+    
+    def stop(self) -> None:
+        self._timer.stop()
+    
+    @property
+    def is_running(self) -> bool:
+        return self._timer.isActive()
+    
+    def _tick(self) -> None:
+        start = time.perf_counter()
+        for callback in self._callbacks:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.log_error_event("Frame callback error", str(e), {"exception_type": type(e).__name__})
+        self.frames += 1
+        self.last_frame_ms = (time.perf_counter() - start) * 1000
+        if self.last_frame_ms > self.max_frame_ms:
+            self.max_frame_ms = self.last_frame_ms
@@ -1,23 +1,31 @@
 import sys
-from typing import Optional
+import time
+from typing import List, Optional
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QWidget, QPushButton, QLabel, QTabWidget, QStatusBar,
                              QGridLayout, QFrame, QSplitter, QSizePolicy)
-from PyQt5.QtCore import QTimer, Qt, pyqtSignal
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QPalette, QColor
 
+from .frame_clock import FrameClock
 from .widgets.telemetry_display import TelemetryDisplayWidget
 from .widgets.graph_widget import GraphWidget
 from .widgets.control_panel import ControlPanelWidget
 from .widgets.status_widget import StatusWidget
 from ..core.telemetry_data import TelemetryReading
+from ..core.telemetry_frame import TelemetryFrame
+from ..sensors.base_sensor import BaseSensor
 from ..sensors.mock_sensor import MockRocketSensor
+from ..sensors.acquisition_engine import AcquisitionEngine
 from ..data.data_processor import TelemetryProcessor
 from ..data.data_storage import DataStorage
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # Fréquence de rafraîchissement du tableau de bord (indépendante du débit de données)
+    DEFAULT_FPS = 30.0
+    
+    def __init__(self, sensor: Optional[BaseSensor] = None, fps: float = DEFAULT_FPS):
         super().__init__()
         self.setWindowTitle("Système de Télémétrie Fusée")
         self.setMinimumSize(800, 600)
@@ -25,17 +33,25 @@ class MainWindow(QMainWindow):
         self.showMaximized()
         
         # Composants principaux
-        self.sensor = MockRocketSensor()
+        # Capteur unique ou SensorHub agrégeant plusieurs sources
+        self.sensor = sensor or MockRocketSensor()
         self.data_processor = TelemetryProcessor()
         self.data_storage = DataStorage()
+        self.stream_writer = None
+        
+        # Horloge d'affichage : les lectures en attente sont récupérées une fois par image
+        self.frame_clock = FrameClock(fps, self)
+        self._paint_latency = self.data_processor.latency.histogram('paint')
+        self._last_stats_update = 0.0
         
-        # Timer pour la lecture des données
-        self.data_timer = QTimer()
-        self.data_timer.timeout.connect(self.read_sensor_data)
+        # Acquisition sur un thread dédié : la charge de l'interface n'affecte plus l'échantillonnage
+        self.acquisition = AcquisitionEngine(self.sensor, self.data_processor.add_reading,
+                                             latency=self.data_processor.latency)
         
         self.setup_ui()
         self.setup_connections()
         self.apply_dark_theme()
+        self.frame_clock.start()
     
     def setup_ui(self):
         central_widget = QWidget()
@@ -98,21 +114,23 @@ class MainWindow(QMainWindow):
         tab_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
         # Tab altitude/vitesse
-        self.altitude_graph = GraphWidget("Altitude (m)", "Temps (s)", "Altitude")
+        self.altitude_graph = GraphWidget("Altitude (m)", "Temps (s)", "Altitude", redraw_interval_ms=None)
         tab_widget.addTab(self.altitude_graph, "Altitude")
         
         # Tab accélération
-        self.acceleration_graph = GraphWidget("Accélération (m/s²)", "Temps (s)", "Accélération")
+        self.acceleration_graph = GraphWidget("Accélération (m/s²)", "Temps (s)", "Accélération", redraw_interval_ms=None)
         tab_widget.addTab(self.acceleration_graph, "Accélération")
         
         # Tab température/pression
-        self.env_graph = GraphWidget("Valeurs", "Temps (s)", "Environnement")
+        self.env_graph = GraphWidget("Valeurs", "Temps (s)", "Environnement", redraw_interval_ms=None)
         tab_widget.addTab(self.env_graph, "Environnement")
         
         # Tab orientation
-        self.orientation_graph = GraphWidget("Degrés", "Temps (s)", "Orientation")
+        self.orientation_graph = GraphWidget("Degrés", "Temps (s)", "Orientation", redraw_interval_ms=None)
         tab_widget.addTab(self.orientation_graph, "Orientation")
         
+        self.graphs = [self.altitude_graph, self.acceleration_graph, self.env_graph, self.orientation_graph]
+        
         right_layout.addWidget(tab_widget)
         
         return right_widget
@@ -125,8 +143,10 @@ class MainWindow(QMainWindow):
         self.control_panel.save_clicked.connect(self.save_data)
         self.control_panel.clear_clicked.connect(self.clear_data)
         
-        # Callback pour les nouvelles données
-        self.data_processor.add_data_callback(self.update_displays)
+        # Les nouvelles données sont mises de côté par le processeur et lues à chaque image
+        # (délestage des plus anciennes si l'UI décroche)
+        self._display_feed = self.data_processor.add_pull_subscription()
+        self.frame_clock.add_callback(self._on_frame)
     
     def apply_dark_theme(self):
         dark_palette = QPalette()
@@ -149,7 +169,7 @@ class MainWindow(QMainWindow):
     def connect_sensor(self):
         if self.sensor.connect():
             self.status_bar.showMessage("Capteur connecté")
-            self.status_widget.update_sensor_status(True)
+            self.status_widget.update_sensor_status(True, self.acquisition.sample_rate)
         else:
             self.status_bar.showMessage("Erreur de connexion au capteur")
     
@@ -158,51 +178,73 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("Connectez d'abord le capteur")
             return
         
+        # Persistance incrémentale : les lectures sont écrites par lots pendant l'acquisition
+        if self.stream_writer is None:
+            self.stream_writer = self.data_storage.create_stream_writer()
+            self.data_processor.attach_writer(self.stream_writer)
+        
         self.data_processor.start_processing()
-        self.data_timer.start(int(1000 / self.sensor.sample_rate))
+        self.acquisition.start()
         self.status_bar.showMessage("Acquisition en cours...")
         self.status_widget.update_acquisition_status(True)
     
     def stop_telemetry(self):
-        self.data_timer.stop()
+        self.acquisition.stop()
         self.data_processor.stop_processing()
         self.status_bar.showMessage("Acquisition arrêtée")
         self.status_widget.update_acquisition_status(False)
     
-    def read_sensor_data(self):
-        reading = self.sensor.read_data()
-        if reading:
-            self.data_processor.add_reading(reading)
+    def _on_frame(self):
+        started = time.perf_counter_ns()
+        readings = self._display_feed.drain()
+        self.update_displays_batch(readings)
+        
+        # Un seul rendu par graphique et par image, uniquement s'il a changé
+        for graph in self.graphs:
+            graph.render_frame()
+        if readings:
+            self._paint_latency.record(time.perf_counter_ns() - started)
+        
+        # Statistiques du pipeline rafraîchies une fois par seconde
+        now = time.monotonic()
+        if self.acquisition.is_running and now - self._last_stats_update >= 1.0:
+            self._last_stats_update = now
+            self.status_widget.update_pipeline_stats(self.data_processor.get_pipeline_stats(),
+                                                     self.acquisition.get_stats())
     
-    def update_displays(self, reading: TelemetryReading):
-        # Mettre à jour l'affichage des données
-        self.telemetry_display.update_data(reading)
+    def update_displays_batch(self, readings: List[TelemetryReading]):
+        if not readings:
+            return
         
-        # Mettre à jour les graphiques
-        timestamp = reading.timestamp.timestamp()
+        # Seule la dernière lecture est affichée dans les labels
+        self.telemetry_display.update_data(readings[-1])
         
-        self.altitude_graph.add_data_point(timestamp, reading.altitude, "Altitude")
-        self.altitude_graph.add_data_point(timestamp, reading.velocity, "Vitesse")
+        # Les graphiques reçoivent le lot entier en une mise à jour par série
+        frame = TelemetryFrame.from_readings(readings)
+        times = frame.times()
         
-        self.acceleration_graph.add_data_point(timestamp, reading.acceleration['x'], "Acc X")
-        self.acceleration_graph.add_data_point(timestamp, reading.acceleration['y'], "Acc Y")
-        self.acceleration_graph.add_data_point(timestamp, reading.acceleration['z'], "Acc Z")
+        self.altitude_graph.add_frame(frame, {"Altitude": "altitude", "Vitesse": "velocity"})
+        self.acceleration_graph.add_frame(frame, {"Acc X": "acc_x", "Acc Y": "acc_y", "Acc Z": "acc_z"})
         
-        self.env_graph.add_data_point(timestamp, reading.temperature, "Température")
-        self.env_graph.add_data_point(timestamp, reading.pressure / 1000, "Pression (kPa)")
+        self.env_graph.add_data_points(times, frame['temperature'], "Température")
+        self.env_graph.add_data_points(times, frame['pressure'] / 1000, "Pression (kPa)")
         
-        self.orientation_graph.add_data_point(timestamp, reading.orientation['roll'], "Roll")
-        self.orientation_graph.add_data_point(timestamp, reading.orientation['pitch'], "Pitch")
-        self.orientation_graph.add_data_point(timestamp, reading.orientation['yaw'], "Yaw")
+        self.orientation_graph.add_frame(frame, {"Roll": "roll", "Pitch": "pitch", "Yaw": "yaw"})
     
     def save_data(self):
-        data = self.data_processor.get_all_data()
-        if data:
-            json_file = self.data_storage.save_to_json(data)
-            csv_file = self.data_storage.save_to_csv(data)
-            self.status_bar.showMessage(f"Données sauvegardées: {json_file}, {csv_file}")
-        else:
+        # Les données sont déjà sur disque : sauvegarder revient à finaliser le fichier en cours
+        writer = self.stream_writer
+        if writer is None or (writer.samples_written == 0 and writer.pending_count == 0):
             self.status_bar.showMessage("Aucune donnée à sauvegarder")
+            return
+        
+        # L'acquisition continue dans un nouveau fichier ; l'ancien n'est finalisé qu'une fois
+        # retiré du thread de traitement
+        self.stream_writer = self.data_storage.create_stream_writer() if self.acquisition.is_running else None
+        self.data_processor.swap_writer(self.stream_writer)
+        log_file = writer.finalize()
+        
+        self.status_bar.showMessage(f"Données sauvegardées: {log_file}")
     
     def clear_data(self):
         self.data_processor.clear_data()
@@ -214,7 +256,12 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Données effacées")
     
     def closeEvent(self, event):
+        self.frame_clock.stop()
         self.stop_telemetry()
+        if self.stream_writer is not None:
+            self.data_processor.detach_writer()
+            self.stream_writer.finalize()
+            self.stream_writer = None
         self.sensor.disconnect()
         event.accept()
 
@@ -1,36 +1,85 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
 from PyQt5.QtCore import QTimer
-import matplotlib.pyplot as plt
+import matplotlib.style
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT
 from matplotlib.figure import Figure
-from matplotlib.animation import FuncAnimation
+from matplotlib.lines import Line2D
 import numpy as np
-from collections import deque
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import time
+from .series_buffer import SeriesBuffer
+
+
+_style_applied = False
+
+
+def _apply_style():
+    # Le thème matplotlib est global : appliqué une seule fois pour tous les graphiques
+    global _style_applied
+    if not _style_applied:
+        matplotlib.style.use('dark_background')
+        _style_applied = True
+
+
+class _GraphToolbar(NavigationToolbar2QT):
+    # Le bouton « Accueil » réactive le suivi automatique au lieu de restaurer la vue initiale
+    def __init__(self, canvas, parent, on_home):
+        super().__init__(canvas, parent)
+        self._on_home = on_home
+    
+    def home(self, *args):
+        self._on_home()
 
 
 class GraphWidget(QWidget):
-    def __init__(self, y_label: str, x_label: str, title: str, max_points: int = 500):
+    # Bande d'hystérésis des limites (fraction de la plage affichée)
+    LIMIT_HYSTERESIS = 0.1
+    
+    # Points tracés par pixel horizontal (un min et un max par colonne)
+    POINTS_PER_PIXEL = 2
+    
+    def __init__(self, y_label: str, x_label: str, title: str, max_points: Optional[int] = None,
+                 redraw_interval_ms: Optional[int] = 33):
         super().__init__()
         self.y_label = y_label
         self.x_label = x_label
         self.title = title
         self.max_points = max_points
+        self.redraw_interval_ms = redraw_interval_ms
+        
+        # Rendu par blitting : fond statique mis en cache, seules les lignes sont redessinées
+        self._background = None
+        self._needs_full_redraw = True
+        
+        # Vue : suivi automatique des données tant que l'utilisateur n'a pas zoomé/déplacé
+        self.follow = True
+        self._adjusting_view = False
         
         # Configuration responsive
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
-        # Données pour les différentes séries
-        self.data_series: Dict[str, deque] = {}
-        self.time_series: Dict[str, deque] = {}
+        # Données pour les différentes séries : historique complet (max_points=None) ou
+        # fenêtre glissante ; seule une version décimée de la vue courante est tracée
+        self.series: Dict[str, SeriesBuffer] = {}
+        self._dirty_series: Set[str] = set()
         self.colors = ['#2196F3', '#4CAF50', '#FF5722', '#FF9800', '#9C27B0', '#607D8B']
         self.color_index = 0
+        self._series_colors: Dict[str, str] = {}
+        
+        # Figure, canvas et lignes créés au premier affichage ; un graphique masqué
+        # accumule ses données sans rendu et rattrape en un seul redraw à l'affichage
+        self.figure = None
+        self.canvas = None
+        self.toolbar = None
+        self.ax = None
+        self.lines: Dict[str, Line2D] = {}
         
         self.setup_ui()
         self.start_time = time.time()
         
-        # Timer pour optimiser les redraws
+        # Timer pour optimiser les redraws ; redraw_interval_ms=None : rendu piloté de l'extérieur
+        # par render_frame() (horloge d'affichage commune)
         self.redraw_timer = QTimer()
         self.redraw_timer.setSingleShot(True)
         self.redraw_timer.timeout.connect(self._perform_redraw)
@@ -39,9 +88,12 @@ class GraphWidget(QWidget):
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
+    
+    def _build_canvas(self):
+        layout = self.layout()
         
         # Configuration matplotlib pour thème sombre
-        plt.style.use('dark_background')
+        _apply_style()
         
         # Créer la figure avec DPI adaptatif
         self.figure = Figure(facecolor='#353535', tight_layout=True)
@@ -49,6 +101,10 @@ class GraphWidget(QWidget):
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(self.canvas)
         
+        # Barre de navigation pour zoomer/déplacer dans l'historique
+        self.toolbar = _GraphToolbar(self.canvas, self, self.reset_view)
+        layout.addWidget(self.toolbar)
+        
         # Créer l'axe
         self.ax = self.figure.add_subplot(111, facecolor='#2d2d2d')
         self.ax.set_xlabel(self.x_label, color='white')
@@ -57,81 +113,153 @@ class GraphWidget(QWidget):
         self.ax.grid(True, alpha=0.3)
         self.ax.tick_params(colors='white')
         
-        # Dict pour stocker les lignes de plot
-        self.lines: Dict[str, plt.Line2D] = {}
-        
         # Configuration des limites initiales
         self.ax.set_xlim(0, 60)  # 60 secondes par défaut
         self.ax.set_ylim(-10, 10)  # Limites par défaut
         
-        self.canvas.draw()
+        # Après chaque rendu complet : capture du fond puis dessin des lignes animées
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+        
+        # Lignes des séries reçues avant le premier affichage
+        for series_name in self.series:
+            self._create_line(series_name)
+    
+    def _ensure_canvas(self):
+        if self.canvas is None:
+            self._build_canvas()
+    
+    def _ensure_series(self, series_name: str):
+        if series_name not in self.series:
+            self.series[series_name] = SeriesBuffer(self.max_points)
+            self._series_colors[series_name] = self.colors[self.color_index % len(self.colors)]
+            self.color_index += 1
+            if self.ax is not None:
+                self._create_line(series_name)
+    
+    def _create_line(self, series_name: str):
+        line, = self.ax.plot([], [], label=series_name, color=self._series_colors[series_name],
+                             linewidth=2, animated=True)
+        self.lines[series_name] = line
+        
+        # Mettre à jour la légende
+        self.ax.legend(loc='upper left', fancybox=True, framealpha=0.8)
+        self._needs_full_redraw = True
     
     def add_data_point(self, timestamp: float, value: float, series_name: str):
         # Convertir timestamp en temps relatif
         relative_time = timestamp - self.start_time if hasattr(self, 'start_time') else 0
         
         # Initialiser la série si elle n'existe pas
-        if series_name not in self.data_series:
-            self.data_series[series_name] = deque(maxlen=self.max_points)
-            self.time_series[series_name] = deque(maxlen=self.max_points)
-            
-            # Créer une nouvelle ligne
-            color = self.colors[self.color_index % len(self.colors)]
-            line, = self.ax.plot([], [], label=series_name, color=color, linewidth=2)
-            self.lines[series_name] = line
-            self.color_index += 1
-            
-            # Mettre à jour la légende
-            self.ax.legend(loc='upper left', fancybox=True, framealpha=0.8)
-        
-        # Ajouter les nouvelles données
-        self.data_series[series_name].append(value)
-        self.time_series[series_name].append(relative_time)
+        self._ensure_series(series_name)
         
-        # Mettre à jour la ligne
-        self.lines[series_name].set_data(list(self.time_series[series_name]), 
-                                        list(self.data_series[series_name]))
-        
-        # Ajuster les limites
-        self._update_limits()
+        # Ajouter les nouvelles données : O(1), la ligne est mise à jour au prochain redraw
+        self.series[series_name].append(relative_time, value)
+        self._dirty_series.add(series_name)
         
         # Redessiner avec optimisation
         self._schedule_redraw()
     
-    def _update_limits(self):
-        if not self.data_series:
+    def add_data_points(self, timestamps, values, series_name: str):
+        # Variante par lot : une seule mise à jour de ligne et de limites pour N points
+        self._ensure_series(series_name)
+        
+        relative_times = np.asarray(timestamps, dtype=float) - self.start_time
+        self.series[series_name].extend(relative_times, np.asarray(values, dtype=float))
+        self._dirty_series.add(series_name)
+        self._schedule_redraw()
+    
+    def add_frame(self, frame, series: Dict[str, str]):
+        # series : nom de série -> canal du TelemetryFrame
+        if not len(frame):
+            return
+        times = frame.times()
+        for series_name, channel in series.items():
+            self.add_data_points(times, frame[channel], series_name)
+    
+    def _update_lines(self):
+        # Décimation min/max de la plage visible : le nombre de sommets tracés dépend de la
+        # largeur du graphique, pas de la durée du vol
+        x_low, x_high = self.ax.get_xlim()
+        budget = max(2, int(self.ax.bbox.width * self.POINTS_PER_PIXEL))
+        for series_name in self._dirty_series:
+            times, values = self.series[series_name].visible(x_low, x_high, budget)
+            self.lines[series_name].set_data(times, values)
+        self._dirty_series.clear()
+    
+    def _invalidate_lines(self):
+        self._dirty_series.update(self.series.keys())
+    
+    def _on_xlim_changed(self, ax):
+        if self._adjusting_view:
+            return
+        # Zoom/déplacement utilisateur : suspendre le suivi et redécimer pour la nouvelle vue
+        self.follow = False
+        self._invalidate_lines()
+        self._needs_full_redraw = True
+        self._schedule_redraw()
+    
+    def _set_view(self, x_limits=None, y_limits=None):
+        self._adjusting_view = True
+        try:
+            if x_limits is not None:
+                self.ax.set_xlim(*x_limits)
+            if y_limits is not None:
+                self.ax.set_ylim(*y_limits)
+        finally:
+            self._adjusting_view = False
+    
+    def reset_view(self):
+        # Retour au suivi automatique des données
+        self.follow = True
+        if self.canvas is None:
             return
+        self._update_limits()
+        self._invalidate_lines()
+        self._needs_full_redraw = True
+        self._perform_redraw()
+    
+    def _update_limits(self) -> bool:
+        # Limites agrégées depuis les min/max incrémentaux de chaque série : O(nombre de séries).
+        # Retourne True si les limites affichées changent (redraw complet nécessaire).
+        time_bounds = [b for b in (buffer.time_bounds() for buffer in self.series.values()) if b]
+        value_bounds = [b for b in (buffer.value_bounds() for buffer in self.series.values()) if b]
+        
+        if not time_bounds or not value_bounds:
+            return False
+        
+        time_min = min(bound[0] for bound in time_bounds)
+        time_max = max(bound[1] for bound in time_bounds)
+        value_min = min(bound[0] for bound in value_bounds)
+        value_max = max(bound[1] for bound in value_bounds)
+        hysteresis = self.LIMIT_HYSTERESIS
+        changed = False
+        
+        # Limites temporelles : la fenêtre avance par paliers plutôt qu'à chaque point
+        time_range = max(60, time_max - time_min + 10)
+        target_low = max(0, time_max - time_range)
+        x_low, x_high = self.ax.get_xlim()
+        if time_max >= x_high or abs(target_low - x_low) > time_range * hysteresis:
+            self._set_view(x_limits=(target_low, time_max + max(5, time_range * 2 * hysteresis)))
+            changed = True
         
-        # Calculer les limites temporelles
-        all_times = []
-        all_values = []
-        
-        for series_name in self.data_series:
-            if self.time_series[series_name]:
-                all_times.extend(list(self.time_series[series_name]))
-                all_values.extend(list(self.data_series[series_name]))
-        
-        if all_times and all_values:
-            time_min, time_max = min(all_times), max(all_times)
-            value_min, value_max = min(all_values), max(all_values)
-            
-            # Limites temporelles avec un peu de marge
-            time_range = max(60, time_max - time_min + 10)
-            self.ax.set_xlim(max(0, time_max - time_range), time_max + 5)
-            
-            # Limites de valeurs avec marge
-            if value_max != value_min:
-                value_range = value_max - value_min
-                margin = value_range * 0.1
-                self.ax.set_ylim(value_min - margin, value_max + margin)
-            else:
-                # Si toutes les valeurs sont identiques
-                self.ax.set_ylim(value_min - 1, value_max + 1)
+        # Limites de valeurs avec marge (plage unitaire si toutes les valeurs sont identiques)
+        margin = (value_max - value_min) * 0.1 if value_max != value_min else 1
+        target_span = value_max - value_min + 2 * margin
+        y_low, y_high = self.ax.get_ylim()
+        outside = value_min < y_low or value_max > y_high
+        too_loose = (y_high - y_low) > target_span * (1 + 6 * hysteresis)
+        if outside or too_loose:
+            headroom = target_span * hysteresis
+            self._set_view(y_limits=(value_min - margin - headroom, value_max + margin + headroom))
+            changed = True
+        
+        return changed
     
     def clear_data(self):
         # Effacer toutes les données
-        self.data_series.clear()
-        self.time_series.clear()
+        self.series.clear()
+        self._dirty_series.clear()
         
         # Effacer toutes les lignes
         for line in self.lines.values():
@@ -140,35 +268,112 @@ class GraphWidget(QWidget):
         
         # Réinitialiser les paramètres
         self.color_index = 0
+        self._series_colors.clear()
         self.start_time = time.time()
+        self.follow = True
+        if self.ax is None:
+            return
         
         # Remettre les limites par défaut
-        self.ax.set_xlim(0, 60)
-        self.ax.set_ylim(-10, 10)
-        self.ax.legend().remove() if self.ax.get_legend() else None
+        self._set_view((0, 60), (-10, 10))
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
         
         # Redessiner
+        self._needs_full_redraw = True
         self._perform_redraw()
     
+    def _is_rendering(self) -> bool:
+        return self.canvas is not None and self.isVisible()
+    
     def _schedule_redraw(self):
-        if not self.pending_redraw:
+        # Graphique masqué : les séries restent marquées modifiées jusqu'à l'affichage
+        if not self.pending_redraw and self._is_rendering():
             self.pending_redraw = True
-            self.redraw_timer.start(50)
+            if self.redraw_interval_ms is not None:
+                self.redraw_timer.start(self.redraw_interval_ms)
+    
+    def render_frame(self):
+        # Appelé par l'horloge d'affichage : au plus un rendu par image
+        if self.pending_redraw:
+            self._perform_redraw()
     
     def _perform_redraw(self):
         self.pending_redraw = False
-        self.canvas.draw_idle()
+        if not self._is_rendering():
+            return
+        if self._dirty_series:
+            if self.follow and self._update_limits():
+                # Nouvelle vue : toutes les séries doivent être redécimées
+                self._invalidate_lines()
+                self._needs_full_redraw = True
+            self._update_lines()
+        
+        if self._needs_full_redraw or self._background is None:
+            # Axes, graduations, légende : rendu complet, le fond est recapturé dans _on_draw
+            self._needs_full_redraw = False
+            self._background = None
+            self.canvas.draw_idle()
+        else:
+            self._blit_lines()
+    
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_lines()
+    
+    def _draw_lines(self):
+        for line in self.lines.values():
+            self.ax.draw_artist(line)
+    
+    def _blit_lines(self):
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.ax.bbox)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._ensure_canvas()
+        # Rattrapage : un seul redraw complet pour tout ce qui a été reçu pendant le masquage
+        self._invalidate_lines()
+        self._needs_full_redraw = True
+        self._perform_redraw()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.redraw_timer.stop()
+        self.pending_redraw = False
     
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        if hasattr(self, 'canvas'):
+        if self._is_rendering():
             self.figure.tight_layout()
+            self._invalidate_lines()
+            self._needs_full_redraw = True
             self._perform_redraw()
     
     def export_plot(self, filename: str):
-        self.figure.savefig(filename, dpi=300, bbox_inches='tight', 
-                          facecolor='#353535', edgecolor='none')
+        # Un graphique jamais affiché est construit et mis à jour pour l'export
+        self._ensure_canvas()
+        if self.follow:
+            self._update_limits()
+        self._invalidate_lines()
+        self._update_lines()
+        
+        # Les lignes animées sont exclues du rendu normal : les réintégrer pour l'export
+        for line in self.lines.values():
+            line.set_animated(False)
+        try:
+            self.figure.savefig(filename, dpi=300, bbox_inches='tight', 
+                              facecolor='#353535', edgecolor='none')
+        finally:
+            for line in self.lines.values():
+                line.set_animated(True)
+            self._needs_full_redraw = True
+            self._perform_redraw()
     
     def set_y_limits(self, min_val: float, max_val: float):
+        self._ensure_canvas()
         self.ax.set_ylim(min_val, max_val)
+        self._needs_full_redraw = True
         self._perform_redraw()
\ No newline at end of file
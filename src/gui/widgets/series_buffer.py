@@ -0,0 +1,174 @@
+from collections import deque
+from typing import Optional, Tuple
+import numpy as np
+
+
+def minmax_decimate(times: np.ndarray, values: np.ndarray, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    # Réduit une série à au plus ~max_points points en conservant, pour chaque paquet
+    # d'échantillons, le minimum et le maximum (dans leur ordre d'apparition).
+    count = len(times)
+    buckets = max(1, max_points // 2)
+    if count <= max_points:
+        return times, values
+    
+    size = -(-count // buckets)  # arrondi supérieur
+    full = (count // size) * size
+    
+    # Les NaN ne doivent être choisis ni comme min ni comme max
+    nan_mask = np.isnan(values)
+    low_source = np.where(nan_mask, np.inf, values) if nan_mask.any() else values
+    high_source = np.where(nan_mask, -np.inf, values) if nan_mask.any() else values
+    
+    starts = np.arange(0, full, size)
+    low = starts + low_source[:full].reshape(-1, size).argmin(axis=1)
+    high = starts + high_source[:full].reshape(-1, size).argmax(axis=1)
+    if full < count:
+        tail_low = full + int(low_source[full:].argmin())
+        tail_high = full + int(high_source[full:].argmax())
+        low = np.append(low, tail_low)
+        high = np.append(high, tail_high)
+    
+    indices = np.stack((np.minimum(low, high), np.maximum(low, high)), axis=1).ravel()
+    return times[indices], values[indices]
+
+
+class SeriesBuffer:
+    # Série temporelle stockée dans des tableaux NumPy. Sans max_points, l'historique
+    # complet est conservé (tableaux à croissance géométrique) ; avec max_points, la
+    # fenêtre glissante reste contiguë dans une zone de 2 x max_points et les min/max
+    # glissants sont maintenus par deques monotones.
+    def __init__(self, max_points: Optional[int] = None, initial_capacity: int = 1024):
+        self.max_points = max_points
+        capacity = 2 * max_points if max_points else initial_capacity
+        self._times = np.empty(capacity, dtype=float)
+        self._values = np.empty(capacity, dtype=float)
+        self._start = 0
+        self._end = 0
+        
+        # Historique complet : extrêmes cumulés
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+        
+        # Fenêtre glissante : indices absolus des échantillons (ne décroissent jamais)
+        self._first_index = 0
+        self._next_index = 0
+        self._min_deque: deque = deque()  # (index, valeur) à valeurs croissantes
+        self._max_deque: deque = deque()  # (index, valeur) à valeurs décroissantes
+    
+    def __len__(self) -> int:
+        return self._end - self._start
+    
+    @property
+    def times(self) -> np.ndarray:
+        return self._times[self._start:self._end]
+    
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[self._start:self._end]
+    
+    def append(self, timestamp: float, value: float) -> None:
+        if self.max_points is None:
+            if self._end == len(self._times):
+                self._grow()
+            self._times[self._end] = timestamp
+            self._values[self._end] = value
+            self._end += 1
+            if value == value:  # les NaN ne participent pas aux limites
+                if self._min is None or value < self._min:
+                    self._min = value
+                if self._max is None or value > self._max:
+                    self._max = value
+            return
+        
+        if self._end - self._start == self.max_points:
+            self._start += 1
+            self._first_index += 1
+        if self._end == len(self._times):
+            self._compact()
+        
+        self._times[self._end] = timestamp
+        self._values[self._end] = value
+        self._end += 1
+        
+        index = self._next_index
+        self._next_index += 1
+        if value == value:
+            while self._min_deque and self._min_deque[-1][1] >= value:
+                self._min_deque.pop()
+            self._min_deque.append((index, value))
+            while self._max_deque and self._max_deque[-1][1] <= value:
+                self._max_deque.pop()
+            self._max_deque.append((index, value))
+        
+        first = self._first_index
+        while self._min_deque and self._min_deque[0][0] < first:
+            self._min_deque.popleft()
+        while self._max_deque and self._max_deque[0][0] < first:
+            self._max_deque.popleft()
+    
+    def extend(self, timestamps, values) -> None:
+        if self.max_points is not None:
+            for timestamp, value in zip(timestamps, values):
+                self.append(timestamp, value)
+            return
+        
+        # Historique complet : copie vectorisée
+        timestamps = np.asarray(timestamps, dtype=float)
+        values = np.asarray(values, dtype=float)
+        count = len(values)
+        if not count:
+            return
+        while self._end + count > len(self._times):
+            self._grow()
+        self._times[self._end:self._end + count] = timestamps
+        self._values[self._end:self._end + count] = values
+        self._end += count
+        
+        finite = values[~np.isnan(values)]
+        if len(finite):
+            low, high = float(finite.min()), float(finite.max())
+            self._min = low if self._min is None else min(self._min, low)
+            self._max = high if self._max is None else max(self._max, high)
+    
+    def time_bounds(self) -> Optional[Tuple[float, float]]:
+        if self._end == self._start:
+            return None
+        return self._times[self._start], self._times[self._end - 1]
+    
+    def value_bounds(self) -> Optional[Tuple[float, float]]:
+        if self.max_points is None:
+            return None if self._min is None else (self._min, self._max)
+        if not self._min_deque:
+            return None
+        return self._min_deque[0][1], self._max_deque[0][1]
+    
+    def visible(self, time_min: float, time_max: float, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Points à tracer pour la vue [time_min, time_max] : un point de part et d'autre
+        # de la vue est conservé pour que la ligne atteigne les bords
+        times = self.times
+        low = max(0, int(np.searchsorted(times, time_min, side='left')) - 1)
+        high = min(len(times), int(np.searchsorted(times, time_max, side='right')) + 1)
+        return minmax_decimate(times[low:high], self.values[low:high], max_points)
+    
+    def clear(self) -> None:
+        self._start = self._end = 0
+        self._min = self._max = None
+        self._first_index = self._next_index
+        self._min_deque.clear()
+        self._max_deque.clear()
+    
+    def _grow(self) -> None:
+        capacity = max(1, len(self._times) * 2)
+        times = np.empty(capacity, dtype=float)
+        values = np.empty(capacity, dtype=float)
+        times[:self._end] = self._times[:self._end]
+        values[:self._end] = self._values[:self._end]
+        self._times = times
+        self._values = values
+    
+    def _compact(self) -> None:
+        count = self._end - self._start
+        self._times[:count] = self._times[self._start:self._end]
+        self._values[:count] = self._values[self._start:self._end]
+        self._start = 0
+        self._end = count
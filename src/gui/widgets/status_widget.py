@@ -2,6 +2,18 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QGroupBox,
                              QGridLayout, QFrame, QSizePolicy)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
+from typing import Any, Dict, Optional
+
+
+# Étapes affichées dans le tableau des latences
+LATENCY_STAGES = (
+    ('sensor_read', "Lecture capteur"),
+    ('validation', "Validation"),
+    ('enqueue', "File d'attente"),
+    ('processing', "Traitement"),
+    ('callback', "Callbacks"),
+    ('paint', "Affichage"),
+)
 
 
 class StatusWidget(QWidget):
@@ -55,18 +67,51 @@ class StatusWidget(QWidget):
         self.data_rate.setStyleSheet("QLabel { color: #4CAF50; font-weight: bold; }")
         perf_layout.addWidget(self.data_rate, 1, 1)
         
+        perf_layout.addWidget(QLabel("Gigue (moy/max):"), 2, 0)
+        self.jitter = QLabel("-")
+        self.jitter.setStyleSheet("QLabel { color: #4CAF50; font-weight: bold; }")
+        perf_layout.addWidget(self.jitter, 2, 1)
+        
+        perf_layout.addWidget(QLabel("Pertes:"), 3, 0)
+        self.dropped = QLabel("0")
+        self.dropped.setStyleSheet("QLabel { color: #4CAF50; font-weight: bold; }")
+        perf_layout.addWidget(self.dropped, 3, 1)
+        
         layout.addWidget(perf_group)
         
+        # Latences par étape : p50 / p99 / max en millisecondes
+        latency_group = QGroupBox("Latences (ms)")
+        latency_layout = QGridLayout(latency_group)
+        for column, header in enumerate(("p50", "p99", "max"), start=1):
+            header_label = QLabel(header)
+            header_label.setAlignment(Qt.AlignRight)
+            latency_layout.addWidget(header_label, 0, column)
+        
+        self.latency_labels: Dict[str, tuple] = {}
+        for row, (stage, title) in enumerate(LATENCY_STAGES, start=1):
+            latency_layout.addWidget(QLabel(title), row, 0)
+            labels = []
+            for column in range(1, 4):
+                label = QLabel("-")
+                label.setAlignment(Qt.AlignRight)
+                label.setStyleSheet("QLabel { color: #607D8B; }")
+                latency_layout.addWidget(label, row, column)
+                labels.append(label)
+            self.latency_labels[stage] = tuple(labels)
+        
+        layout.addWidget(latency_group)
+        
         layout.addStretch()
         
         # Compteurs internes
         self._data_count = 0
     
-    def update_sensor_status(self, connected: bool):
+    def update_sensor_status(self, connected: bool, sample_rate: Optional[float] = None):
         if connected:
             self.sensor_status.setText("Connecté")
             self.sensor_status.setStyleSheet("QLabel { color: #4CAF50; font-weight: bold; }")
-            self.sample_rate.setText("10 Hz")
+            # Fréquence nominale jusqu'à la première mesure
+            self.sample_rate.setText(f"{sample_rate:g} Hz" if sample_rate else "-")
         else:
             self.sensor_status.setText("Déconnecté")
             self.sensor_status.setStyleSheet("QLabel { color: #F44336; font-weight: bold; }")
@@ -84,13 +129,35 @@ class StatusWidget(QWidget):
     def increment_data_count(self):
         self._data_count += 1
         self.data_count.setText(str(self._data_count))
+    
+    def update_pipeline_stats(self, pipeline: Dict[str, Any], acquisition: Optional[Dict[str, Any]] = None):
+        # Valeurs mesurées : TelemetryProcessor.get_pipeline_stats() et AcquisitionEngine.get_stats()
+        self._data_count = pipeline['accepted']
+        self.data_count.setText(str(self._data_count))
+        self.data_rate.setText(f"{pipeline['input_rate']:.1f}")
+        
+        dropped = pipeline['ingest_dropped'] + pipeline['callback_dropped']
+        if acquisition is not None:
+            self.sample_rate.setText(f"{acquisition['achieved_rate']:.1f} Hz")
+            self.jitter.setText(f"{acquisition['jitter_mean_ms']:.2f} / {acquisition['jitter_max_ms']:.2f} ms")
+            dropped += acquisition['missed_deadlines']
+        self.dropped.setText(str(dropped))
+        color = "#F44336" if dropped else "#4CAF50"
+        self.dropped.setStyleSheet(f"QLabel {{ color: {color}; font-weight: bold; }}")
         
-        # Calculer approximativement le taux de données
-        if self._data_count > 0:
-            # Simulation simple - dans une vraie application, on calculerait le vrai taux
-            self.data_rate.setText("10")
+        latency = pipeline['latency']
+        for stage, labels in self.latency_labels.items():
+            stats = latency.get(stage)
+            if not stats or not stats['count']:
+                continue
+            for label, key in zip(labels, ('p50_ms', 'p99_ms', 'max_ms')):
+                label.setText(f"{stats[key]:.2f}")
     
     def reset_counters(self):
         self._data_count = 0
         self.data_count.setText("0")
-        self.data_rate.setText("0")
\ No newline at end of file
+        self.data_rate.setText("0")
+        self.dropped.setText("0")
+        for labels in self.latency_labels.values():
+            for label in labels:
+                label.setText("-")
\ No newline at end of file
@@ -2,14 +2,25 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QGroupBox,
                              QGridLayout, QFrame, QSizePolicy, QScrollArea)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
-from typing import Optional
+from typing import Dict, Optional
 from ...core.telemetry_data import TelemetryReading
 
 
+# Feuilles de style de la batterie par niveau : appliquées uniquement au changement d'état
+BATTERY_STYLES = {
+    'ok': "QLabel { color: #4CAF50; font-weight: bold; }",
+    'low': "QLabel { color: #FF9800; font-weight: bold; }",
+    'critical': "QLabel { color: #F44336; font-weight: bold; }",
+}
+
+
 class TelemetryDisplayWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        # Dernier texte affiché par label : setText (et le relayout Qt) seulement si le texte change
+        self._texts: Dict[QLabel, str] = {}
+        self._battery_state = 'ok'
         self.setup_ui()
     
     def setup_ui(self):
@@ -125,57 +136,69 @@ class TelemetryDisplayWidget(QWidget):
         
         misc_layout.addWidget(QLabel("Batterie:"), 2, 0)
         self.battery_label = QLabel("0.0 V")
-        self.battery_label.setStyleSheet("QLabel { color: #4CAF50; font-weight: bold; }")
+        self.battery_label.setStyleSheet(BATTERY_STYLES['ok'])
         misc_layout.addWidget(self.battery_label, 2, 1)
         
         layout.addWidget(misc_group)
         
         layout.addStretch()
     
+    def _set_text(self, label: QLabel, text: str):
+        if self._texts.get(label) != text:
+            self._texts[label] = text
+            label.setText(text)
+    
+    def _set_battery_state(self, state: str):
+        if state != self._battery_state:
+            self._battery_state = state
+            self.battery_label.setStyleSheet(BATTERY_STYLES[state])
+    
     def update_data(self, reading: TelemetryReading):
-        # Mettre à jour tous les labels avec les nouvelles données
-        self.altitude_label.setText(f"{reading.altitude:.1f} m")
-        self.velocity_label.setText(f"{reading.velocity:.1f} m/s")
+        # Mettre à jour les labels dont le texte formaté a changé
+        set_text = self._set_text
+        set_text(self.altitude_label, f"{reading.altitude:.1f} m")
+        set_text(self.velocity_label, f"{reading.velocity:.1f} m/s")
         
-        self.accel_x_label.setText(f"{reading.acceleration['x']:.1f} m/s²")
-        self.accel_y_label.setText(f"{reading.acceleration['y']:.1f} m/s²")
-        self.accel_z_label.setText(f"{reading.acceleration['z']:.1f} m/s²")
+        set_text(self.accel_x_label, f"{reading.acc_x:.1f} m/s²")
+        set_text(self.accel_y_label, f"{reading.acc_y:.1f} m/s²")
+        set_text(self.accel_z_label, f"{reading.acc_z:.1f} m/s²")
         
-        self.temp_label.setText(f"{reading.temperature:.1f} °C")
-        self.pressure_label.setText(f"{reading.pressure/100:.1f} hPa")
+        set_text(self.temp_label, f"{reading.temperature:.1f} °C")
+        set_text(self.pressure_label, f"{reading.pressure/100:.1f} hPa")
         
-        self.roll_label.setText(f"{reading.orientation['roll']:.1f}°")
-        self.pitch_label.setText(f"{reading.orientation['pitch']:.1f}°")
-        self.yaw_label.setText(f"{reading.orientation['yaw']:.1f}°")
+        set_text(self.roll_label, f"{reading.roll:.1f}°")
+        set_text(self.pitch_label, f"{reading.pitch:.1f}°")
+        set_text(self.yaw_label, f"{reading.yaw:.1f}°")
         
-        if reading.gps_coordinates:
-            self.lat_label.setText(f"{reading.gps_coordinates['lat']:.6f}°")
-            self.lon_label.setText(f"{reading.gps_coordinates['lon']:.6f}°")
+        if reading.lat is not None and reading.lon is not None:
+            set_text(self.lat_label, f"{reading.lat:.6f}°")
+            set_text(self.lon_label, f"{reading.lon:.6f}°")
         
         if reading.battery_voltage:
-            self.battery_label.setText(f"{reading.battery_voltage:.1f} V")
+            set_text(self.battery_label, f"{reading.battery_voltage:.1f} V")
             
             # Changer la couleur selon le niveau de batterie
             if reading.battery_voltage > 11.0:
-                self.battery_label.setStyleSheet("QLabel { color: #4CAF50; font-weight: bold; }")
+                self._set_battery_state('ok')
             elif reading.battery_voltage > 10.0:
-                self.battery_label.setStyleSheet("QLabel { color: #FF9800; font-weight: bold; }")
+                self._set_battery_state('low')
             else:
-                self.battery_label.setStyleSheet("QLabel { color: #F44336; font-weight: bold; }")
+                self._set_battery_state('critical')
     
     def clear_data(self):
         # Remettre toutes les valeurs à zéro
-        self.altitude_label.setText("0.0 m")
-        self.velocity_label.setText("0.0 m/s")
-        self.accel_x_label.setText("0.0 m/s²")
-        self.accel_y_label.setText("0.0 m/s²")
-        self.accel_z_label.setText("0.0 m/s²")
-        self.temp_label.setText("0.0 °C")
-        self.pressure_label.setText("0.0 hPa")
-        self.roll_label.setText("0.0°")
-        self.pitch_label.setText("0.0°")
-        self.yaw_label.setText("0.0°")
-        self.lat_label.setText("0.0°")
-        self.lon_label.setText("0.0°")
-        self.battery_label.setText("0.0 V")
-        self.battery_label.setStyleSheet("QLabel { color: #4CAF50; font-weight: bold; }")
\ No newline at end of file
+        set_text = self._set_text
+        set_text(self.altitude_label, "0.0 m")
+        set_text(self.velocity_label, "0.0 m/s")
+        set_text(self.accel_x_label, "0.0 m/s²")
+        set_text(self.accel_y_label, "0.0 m/s²")
+        set_text(self.accel_z_label, "0.0 m/s²")
+        set_text(self.temp_label, "0.0 °C")
+        set_text(self.pressure_label, "0.0 hPa")
+        set_text(self.roll_label, "0.0°")
+        set_text(self.pitch_label, "0.0°")
+        set_text(self.yaw_label, "0.0°")
+        set_text(self.lat_label, "0.0°")
+        set_text(self.lon_label, "0.0°")
+        set_text(self.battery_label, "0.0 V")
+        self._set_battery_state('ok')
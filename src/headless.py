@@ -0,0 +1,132 @@
+import argparse
+import signal
+import threading
+import time
+from typing import List, Optional
+from .data.data_processor import TelemetryProcessor
+from .data.data_storage import DataStorage
+from .sensors.acquisition_engine import AcquisitionEngine
+from .sensors.base_sensor import BaseSensor
+from .utils.logger import get_logger
+from .utils.metrics import JsonSnapshotWriter, MetricsHttpServer
+
+
+# Acquisition sans interface : capteur -> TelemetryProcessor -> journal binaire.
+# Aucun import de Qt ni de matplotlib dans ce module ni dans ses dépendances.
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Enregistrement de télémétrie sans interface graphique")
+    parser.add_argument('--headless', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--duration', type=float, default=None,
+                        help="durée d'acquisition en secondes (défaut : jusqu'à Ctrl+C)")
+    parser.add_argument('--rate', type=float, default=None,
+                        help="fréquence d'échantillonnage en Hz (défaut : celle du capteur)")
+    parser.add_argument('--output', default=None, help="nom du fichier .rtlog (défaut : horodaté)")
+    parser.add_argument('--output-dir', default="data", help="répertoire de sortie")
+    parser.add_argument('--sensor', choices=('mock', 'replay', 'serial'), default='mock')
+    parser.add_argument('--source', default=None, help="fichier de vol (replay) ou port série (serial)")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="vitesse de rejeu (0 : aussi vite que possible) ; "
+                             "la cadence d'acquisition suit celle du fichier sauf --rate")
+    parser.add_argument('--baudrate', type=int, default=921600)
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="expose /metrics (Prometheus) et /metrics.json sur 127.0.0.1:PORT")
+    parser.add_argument('--metrics-json', default=None, help="fichier d'instantané JSON des métriques")
+    parser.add_argument('--metrics-interval', type=float, default=5.0,
+                        help="période d'écriture de l'instantané JSON en secondes")
+    return parser
+
+
+def create_sensor(args: argparse.Namespace) -> BaseSensor:
+    # Imports différés : seul le capteur choisi est chargé
+    if args.sensor == 'replay':
+        if not args.source:
+            raise ValueError("--source est requis pour --sensor replay")
+        from .sensors.replay_sensor import ReplaySensor
+        return ReplaySensor(args.source, speed=args.speed or None)
+    if args.sensor == 'serial':
+        if not args.source:
+            raise ValueError("--source est requis pour --sensor serial")
+        from .sensors.serial_sensor import SerialPacketSensor
+        return SerialPacketSensor(port=args.source, baudrate=args.baudrate)
+    from .sensors.mock_sensor import MockRocketSensor
+    return MockRocketSensor()
+
+
+def record(sensor: BaseSensor, storage: DataStorage, duration: Optional[float] = None,
+           rate: Optional[float] = None, output: Optional[str] = None,
+           stop_event: Optional[threading.Event] = None,
+           processor: Optional[TelemetryProcessor] = None) -> dict:
+    logger = get_logger()
+    stop_event = stop_event or threading.Event()
+    
+    if not sensor.connect():
+        raise RuntimeError(f"Connexion impossible au capteur: {sensor.name}")
+    
+    processor = processor or TelemetryProcessor()
+    writer = storage.create_stream_writer(output)
+    processor.attach_writer(writer)
+    processor.start_processing()
+    # Sans --rate, la cadence est celle du capteur (pour un rejeu : celle du fichier)
+    engine = AcquisitionEngine(sensor, processor.add_reading, sample_rate=rate, latency=processor.latency)
+    
+    started = time.monotonic()
+    engine.start()
+    logger.log_system_event("Headless acquisition started",
+                            {"sensor": sensor.name, "rate": engine.sample_rate, "output": str(writer.final_path)})
+    try:
+        while not stop_event.is_set():
+            if duration is not None and time.monotonic() - started >= duration:
+                break
+            # Fin d'un rejeu : plus rien à acquérir
+            if getattr(sensor, 'is_finished', False):
+                break
+            stop_event.wait(0.05)
+    finally:
+        # Ordre d'arrêt : plus de producteur, vidange de la file d'ingestion, puis finalisation
+        engine.stop()
+        processor.stop_processing()
+        processor.detach_writer()
+        path = writer.finalize()
+        sensor.disconnect()
+    
+    summary = {
+        'file': str(path),
+        'elapsed_s': round(time.monotonic() - started, 3),
+        'acquisition': engine.get_stats(),
+        'validation': processor.get_validation_stats(),
+        'latency': processor.get_latency_stats(),
+    }
+    logger.log_system_event("Headless acquisition finished", summary)
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    sensor = create_sensor(args)
+    
+    # Ctrl+C ou SIGTERM : arrêt propre avec finalisation du fichier
+    stop_event = threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stop_event.set())
+    
+    # Exposition des métriques pour la supervision sans interface
+    exporters = []
+    if args.metrics_port is not None:
+        exporters.append(MetricsHttpServer(port=args.metrics_port))
+    if args.metrics_json:
+        exporters.append(JsonSnapshotWriter(args.metrics_json, interval_s=args.metrics_interval))
+    for exporter in exporters:
+        exporter.start()
+    # Processeur créé ici pour que ses métriques figurent dans le dernier instantané
+    processor = TelemetryProcessor()
+    try:
+        summary = record(sensor, DataStorage(args.output_dir), duration=args.duration, rate=args.rate,
+                         output=args.output, stop_event=stop_event, processor=processor)
+    finally:
+        for exporter in exporters:
+            exporter.stop()
+    print(f"{summary['acquisition']['samples']} lectures enregistrées dans {summary['file']}")
+    return 0
@@ -0,0 +1,197 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..core.packet_protocol import Packet, PacketDecoder
+from ..data.data_processor import TelemetryProcessor
+from ..data.data_storage import DataStorage
+from ..data.spsc_ring import OverflowPolicy
+from ..data.stream_writer import StreamingWriter
+from ..utils.logger import get_logger
+
+
+class ConnectionStats:
+    # Compteurs d'une connexion TCP ou d'un émetteur UDP ; les pertes viennent des trous de séquence
+    def __init__(self, protocol: str, peer: Tuple):
+        self.protocol = protocol
+        self.peer = peer
+        self.decoder = PacketDecoder()
+        self.bytes_received = 0
+        self.connected_at = time.monotonic()
+        self.last_seen = self.connected_at
+        self.closed = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = self.last_seen - self.connected_at
+        frames = self.decoder.frames
+        lost = self.decoder.lost
+        return {
+            'protocol': self.protocol,
+            'peer': f"{self.peer[0]}:{self.peer[1]}",
+            'frames': frames,
+            'bytes': self.bytes_received,
+            'rate': frames / elapsed if elapsed > 0 else 0.0,
+            'lost': lost,
+            'loss_ratio': lost / (frames + lost) if frames + lost else 0.0,
+            'crc_errors': self.decoder.crc_errors,
+            'closed': self.closed,
+        }
+
+
+def create_vehicle_processor(vehicle_id: int) -> TelemetryProcessor:
+    # add_reading est appelé sur la boucle asyncio : la file ne doit jamais bloquer, sinon un
+    # véhicule saturé retarde toutes les connexions. Les plus anciennes sont écrasées et comptées.
+    return TelemetryProcessor(name=f"vehicle-{vehicle_id}", overflow_policy=OverflowPolicy.DROP_OLDEST)
+
+
+class VehiclePipeline:
+    # Chaîne propre à un véhicule : traitement, puis persistance incrémentale optionnelle
+    def __init__(self, vehicle_id: int, processor: TelemetryProcessor, writer: Optional[StreamingWriter]):
+        self.vehicle_id = vehicle_id
+        self.processor = processor
+        self.writer = writer
+        self.frames = 0
+        
+        if writer is not None:
+            processor.attach_writer(writer)
+        processor.start_processing()
+    
+    def close(self) -> Optional[str]:
+        # Vidange de la file d'ingestion avant finalisation : les dernières trames sont écrites
+        self.processor.stop_processing()
+        if self.writer is None:
+            return None
+        self.processor.detach_writer()
+        return self.writer.finalize()
+
+
+class _TcpProtocol(asyncio.Protocol):
+    def __init__(self, server: 'IngestServer'):
+        self.server = server
+        self.stats: Optional[ConnectionStats] = None
+    
+    def connection_made(self, transport) -> None:
+        self.stats = self.server._open_connection('tcp', transport.get_extra_info('peername'))
+        self.server._transports.add(transport)
+        self.transport = transport
+    
+    def data_received(self, data: bytes) -> None:
+        self.server._ingest(self.stats, data)
+    
+    def connection_lost(self, exc) -> None:
+        self.stats.closed = True
+        self.server._transports.discard(self.transport)
+
+
+class _UdpProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server: 'IngestServer'):
+        self.server = server
+        self._peers: Dict[Tuple, ConnectionStats] = {}
+    
+    def datagram_received(self, data: bytes, addr) -> None:
+        stats = self._peers.get(addr)
+        if stats is None:
+            stats = self._peers[addr] = self.server._open_connection('udp', addr)
+        self.server._ingest(stats, data)
+
+
+class IngestServer:
+    # Service de réception réseau pour station sol multi-véhicules : datagrammes UDP et flux TCP
+    # au format core.packet_protocol, sur une seule boucle asyncio (aucun thread par connexion).
+    # Chaque véhicule est routé vers son propre TelemetryProcessor et, si un DataStorage est
+    # fourni, vers son propre fichier de vol. Un processor_factory personnalisé doit fournir des
+    # processeurs à file non bloquante (DROP_OLDEST ou DROP_NEWEST).
+    def __init__(self, host: str = "127.0.0.1", udp_port: Optional[int] = 0, tcp_port: Optional[int] = 0,
+                 storage: Optional[DataStorage] = None,
+                 processor_factory: Callable[[int], TelemetryProcessor] = create_vehicle_processor):
+        self.host = host
+        self.udp_port = udp_port
+        self.tcp_port = tcp_port
+        self.storage = storage
+        self.processor_factory = processor_factory
+        self.logger = get_logger()
+        
+        self.vehicles: Dict[int, VehiclePipeline] = {}
+        self.connections: List[ConnectionStats] = []
+        self._transports = set()
+        self._udp_transport = None
+        self._tcp_server = None
+    
+    @property
+    def udp_address(self) -> Optional[Tuple]:
+        return self._udp_transport.get_extra_info('sockname') if self._udp_transport else None
+    
+    @property
+    def tcp_address(self) -> Optional[Tuple]:
+        return self._tcp_server.sockets[0].getsockname() if self._tcp_server else None
+    
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self.udp_port is not None:
+            self._udp_transport, _ = await loop.create_datagram_endpoint(
+                lambda: _UdpProtocol(self), local_addr=(self.host, self.udp_port))
+        if self.tcp_port is not None:
+            self._tcp_server = await loop.create_server(lambda: _TcpProtocol(self), self.host, self.tcp_port)
+        self.logger.log_system_event("Ingest server started", {"udp": self.udp_address, "tcp": self.tcp_address})
+    
+    async def stop(self) -> Dict[int, Optional[str]]:
+        if self._udp_transport is not None:
+            self._udp_transport.close()
+            self._udp_transport = None
+        if self._tcp_server is not None:
+            self._tcp_server.close()
+            for transport in list(self._transports):
+                transport.close()
+            await self._tcp_server.wait_closed()
+            self._tcp_server = None
+        
+        # Arrêt des pipelines hors de la boucle : finalize() fait des E/S disque
+        loop = asyncio.get_running_loop()
+        files = {}
+        for vehicle_id, pipeline in self.vehicles.items():
+            files[vehicle_id] = await loop.run_in_executor(None, pipeline.close)
+        self.logger.log_system_event("Ingest server stopped", {"vehicles": len(self.vehicles)})
+        return files
+    
+    def _open_connection(self, protocol: str, peer: Tuple) -> ConnectionStats:
+        stats = ConnectionStats(protocol, peer)
+        self.connections.append(stats)
+        return stats
+    
+    def _ingest(self, stats: ConnectionStats, data: bytes) -> None:
+        # Tout ce qui est reçu est décodé d'un coup : plusieurs trames par appel
+        stats.bytes_received += len(data)
+        stats.last_seen = time.monotonic()
+        packets = stats.decoder.feed(data)
+        if packets:
+            self._route(packets)
+    
+    def _route(self, packets: List[Packet]) -> None:
+        pipeline = None
+        for vehicle_id, _, reading in packets:
+            if pipeline is None or pipeline.vehicle_id != vehicle_id:
+                pipeline = self.vehicles.get(vehicle_id) or self._create_pipeline(vehicle_id)
+            pipeline.processor.add_reading(reading)
+            pipeline.frames += 1
+    
+    def _create_pipeline(self, vehicle_id: int) -> VehiclePipeline:
+        writer = None
+        if self.storage is not None:
+            filename = f"vehicle{vehicle_id}_{time.strftime('%Y%m%d_%H%M%S')}.rtlog"
+            writer = self.storage.create_stream_writer(filename)
+        pipeline = VehiclePipeline(vehicle_id, self.processor_factory(vehicle_id), writer)
+        self.vehicles[vehicle_id] = pipeline
+        self.logger.log_system_event("Vehicle registered", {"vehicle_id": vehicle_id})
+        return pipeline
+    
+    def get_connection_stats(self) -> List[Dict[str, Any]]:
+        return [stats.to_dict() for stats in self.connections]
+    
+    def get_vehicle_stats(self) -> Dict[int, Dict[str, Any]]:
+        return {
+            vehicle_id: {
+                'frames': pipeline.frames,
+                'validation': pipeline.processor.get_validation_stats(),
+                'ingest': pipeline.processor.get_ingest_stats(),
+            }
+            for vehicle_id, pipeline in self.vehicles.items()
+        }
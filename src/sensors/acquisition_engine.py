@@ -0,0 +1,187 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from .base_sensor import BaseSensor
+from ..core.telemetry_data import TelemetryReading
+from ..utils.latency import LatencyTracker
+from ..utils.logger import get_logger
+
+
+class AcquisitionEngine:
+    # Échantillonne un capteur sur son propre thread, à échéances absolues sur l'horloge
+    # monotone : l'échéance k vaut start + k * période, donc les retards ne s'accumulent pas.
+    # Une échéance dépassée de plus d'une période est comptée comme manquée et sautée
+    # (pas de rafale de rattrapage).
+    def __init__(self, sensor: BaseSensor, sink: Callable[[TelemetryReading], Any],
+                 sample_rate: Optional[float] = None, use_asyncio: Optional[bool] = None,
+                 spin_us: float = 0.0, latency: Optional[LatencyTracker] = None):
+        self.sensor = sensor
+        self.sink = sink
+        self.sample_rate = sample_rate or sensor.sample_rate
+        if self.sample_rate <= 0:
+            raise ValueError("sample_rate doit être strictement positif")
+        self.period_ns = int(1e9 / self.sample_rate)
+        # Par défaut, boucle asyncio pour les capteurs qui la supportent
+        self.use_asyncio = sensor.supports_async if use_asyncio is None else use_asyncio
+        # Fin d'attente active avant l'échéance (haute fréquence : précision < 100 µs)
+        self.spin_ns = int(spin_us * 1000)
+        # Histogrammes 'sensor_read' et 'jitter' ; partageable avec le processeur
+        self.latency = latency or LatencyTracker()
+        self._read_histogram = self.latency.histogram('sensor_read')
+        self._jitter_histogram = self.latency.histogram('jitter')
+        self.logger = get_logger()
+        
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reset_stats()
+    
+    def _reset_stats(self) -> None:
+        self.samples = 0
+        self.empty_reads = 0
+        self.read_errors = 0
+        self.missed_deadlines = 0
+        self.jitter_sum_ns = 0
+        self.jitter_max_ns = 0
+        self.read_max_ns = 0
+        self.last_read_ns = 0
+        self._ticks = 0
+        self._started_ns = 0
+        self._read_histogram.reset()
+        self._jitter_histogram.reset()
+    
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._reset_stats()
+        self._thread = threading.Thread(target=self._run, name=f"acquisition-{self.sensor.name}", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+    
+    def _run(self) -> None:
+        if self.use_asyncio:
+            # Import différé : asyncio n'est chargé que pour les capteurs asynchrones
+            import asyncio
+            asyncio.run(self.run_async())
+        else:
+            self._run_threaded()
+    
+    def _run_threaded(self) -> None:
+        deadline = time.monotonic_ns()
+        self._started_ns = deadline
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic_ns() - self.spin_ns
+            if remaining > 0 and self._stop_event.wait(remaining / 1e9):
+                break
+            while time.monotonic_ns() < deadline:
+                pass
+            
+            self._record_wakeup(deadline)
+            started = time.monotonic_ns()
+            try:
+                readings = self.sensor.read_batch()
+            except Exception as e:
+                readings = []
+                self._record_error(e)
+            self._record_read(started)
+            self._deliver_batch(readings)
+            deadline = self._next_deadline(deadline)
+    
+    async def run_async(self) -> None:
+        # Utilisable directement sur une boucle existante ; s'arrête via stop()
+        import asyncio
+        deadline = time.monotonic_ns()
+        self._started_ns = deadline
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic_ns()
+            if remaining > 0:
+                # Attente par tranches courtes pour rester réactif à stop()
+                await asyncio.sleep(min(remaining / 1e9, 0.05))
+                continue
+            
+            self._record_wakeup(deadline)
+            started = time.monotonic_ns()
+            try:
+                reading = await self.sensor.read_data_async()
+            except Exception as e:
+                reading = None
+                self._record_error(e)
+            self._record_read(started)
+            self._deliver(reading)
+            deadline = self._next_deadline(deadline)
+    
+    def _record_wakeup(self, deadline: int) -> None:
+        jitter = time.monotonic_ns() - deadline
+        self._ticks += 1
+        self.jitter_sum_ns += jitter
+        if jitter > self.jitter_max_ns:
+            self.jitter_max_ns = jitter
+        self._jitter_histogram.record(jitter)
+    
+    def _record_read(self, started: int) -> None:
+        self.last_read_ns = time.monotonic_ns() - started
+        if self.last_read_ns > self.read_max_ns:
+            self.read_max_ns = self.last_read_ns
+        self._read_histogram.record(self.last_read_ns)
+    
+    def _record_error(self, error: Exception) -> None:
+        self.read_errors += 1
+        self.sensor.errors_metric.inc()
+        self.logger.log_error_event("Sensor read error", str(error),
+                                    {"sensor": self.sensor.name, "exception_type": type(error).__name__})
+    
+    def _deliver(self, reading: Optional[TelemetryReading]) -> None:
+        if reading is None:
+            self.empty_reads += 1
+            return
+        self.samples += 1
+        self.sensor.reads_metric.inc()
+        try:
+            self.sink(reading)
+        except Exception as e:
+            self.logger.log_error_event("Acquisition sink error", str(e),
+                                        {"sensor": self.sensor.name, "exception_type": type(e).__name__})
+    
+    def _deliver_batch(self, readings: List[TelemetryReading]) -> None:
+        if not readings:
+            self._deliver(None)
+            return
+        for reading in readings:
+            self._deliver(reading)
+    
+    def _next_deadline(self, deadline: int) -> int:
+        deadline += self.period_ns
+        late = time.monotonic_ns() - deadline
+        if late >= self.period_ns:
+            # Échéances entièrement dépassées : sautées, la grille temporelle est conservée
+            skipped = late // self.period_ns
+            self.missed_deadlines += skipped
+            deadline += skipped * self.period_ns
+        return deadline
+    
+    def get_stats(self) -> Dict[str, Any]:
+        elapsed = (time.monotonic_ns() - self._started_ns) / 1e9 if self._started_ns else 0.0
+        return {
+            'sensor': self.sensor.name,
+            'target_rate': self.sample_rate,
+            'achieved_rate': self._ticks / elapsed if elapsed > 0 else 0.0,
+            'samples': self.samples,
+            'empty_reads': self.empty_reads,
+            'read_errors': self.read_errors,
+            'missed_deadlines': self.missed_deadlines,
+            'jitter_mean_ms': self.jitter_sum_ns / self._ticks / 1e6 if self._ticks else 0.0,
+            'jitter_max_ms': self.jitter_max_ns / 1e6,
+            'read_max_ms': self.read_max_ns / 1e6,
+            'read_p99_ms': self._read_histogram.percentile(99) / 1e6,
+            'jitter_p99_ms': self._jitter_histogram.percentile(99) / 1e6,
+            'asyncio': self.use_asyncio,
+        }
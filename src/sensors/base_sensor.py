@@ -1,14 +1,37 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from ..core.telemetry_data import TelemetryReading
+from ..utils.metrics import get_registry, weak_callback
+
+
+def _last_reading_age(sensor: 'BaseSensor') -> float:
+    reading = sensor.last_reading
+    return (time.time_ns() - reading.timestamp_ns) / 1e9 if reading is not None else float('nan')
 
 
 class BaseSensor(ABC):
+    # Les capteurs à E/S asynchrones surchargent read_data_async et passent ce drapeau à True :
+    # l'AcquisitionEngine les exécute alors sur une boucle asyncio
+    supports_async = False
+    
     def __init__(self, name: str, sample_rate: float = 10.0):
         self.name = name
         self.sample_rate = sample_rate
         self._is_connected = False
         self._last_reading: Optional[TelemetryReading] = None
+        
+        # Métriques publiées : lectures et erreurs (incrémentées par l'AcquisitionEngine),
+        # âge de la dernière lecture (calculé à la collecte)
+        registry = get_registry()
+        labels = {'sensor': name}
+        self.reads_metric = registry.counter('telemetry_sensor_reads_total',
+                                             "Lectures retournées par le capteur", labels)
+        self.errors_metric = registry.counter('telemetry_sensor_errors_total',
+                                              "Erreurs de lecture du capteur", labels)
+        registry.register_callback('telemetry_sensor_last_reading_age_seconds',
+                                   "Âge de la dernière lecture du capteur", 'gauge',
+                                   weak_callback(self, _last_reading_age), labels)
     
     @abstractmethod
     def connect(self) -> bool:
@@ -22,6 +45,14 @@ class BaseSensor(ABC):
     def read_data(self) -> Optional[TelemetryReading]:
         pass
     
+    def read_batch(self) -> List[TelemetryReading]:
+        # Les sources agrégées (SensorHub) retournent toutes les lectures disponibles d'un coup
+        reading = self.read_data()
+        return [reading] if reading is not None else []
+    
+    async def read_data_async(self) -> Optional[TelemetryReading]:
+        return self.read_data()
+    
     @property
     def is_connected(self) -> bool:
         return self._is_connected
@@ -1,6 +1,5 @@
 import random
 import time
-from datetime import datetime
 from typing import Optional
 from .base_sensor import BaseSensor
 from ..core.telemetry_data import TelemetryReading
@@ -29,26 +28,20 @@ class MockRocketSensor(BaseSensor):
         altitude = self._simulate_altitude()
         velocity = self._simulate_velocity()
         
-        reading = TelemetryReading(
-            timestamp=datetime.now(),
+        reading = TelemetryReading.from_values(
+            timestamp_ns=time.time_ns(),
             altitude=altitude,
             velocity=velocity,
-            acceleration={
-                'x': random.uniform(-10, 10),
-                'y': random.uniform(-10, 10),
-                'z': random.uniform(-20, 50) if self._phase == "powered_flight" else random.uniform(-10, 10)
-            },
+            acc_x=random.uniform(-10, 10),
+            acc_y=random.uniform(-10, 10),
+            acc_z=random.uniform(-20, 50) if self._phase == "powered_flight" else random.uniform(-10, 10),
             temperature=random.uniform(15, 25) + altitude * -0.006,  # Température diminue avec l'altitude
             pressure=101325 * (1 - 0.0065 * altitude / 288.15) ** 5.257,  # Formule barométrique
-            orientation={
-                'roll': random.uniform(-5, 5),
-                'pitch': random.uniform(-10, 10),
-                'yaw': random.uniform(-5, 5)
-            },
-            gps_coordinates={
-                'lat': 45.5017 + random.uniform(-0.001, 0.001),
-                'lon': -73.5673 + random.uniform(-0.001, 0.001)
-            },
+            roll=random.uniform(-5, 5),
+            pitch=random.uniform(-10, 10),
+            yaw=random.uniform(-5, 5),
+            lat=45.5017 + random.uniform(-0.001, 0.001),
+            lon=-73.5673 + random.uniform(-0.001, 0.001),
             battery_voltage=12.0 - self._flight_time * 0.01
         )
         
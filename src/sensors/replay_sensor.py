@@ -0,0 +1,264 @@
+import csv
+import json
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+import numpy as np
+from .base_sensor import BaseSensor
+from ..core.telemetry_data import TelemetryReading
+from ..core.telemetry_frame import TelemetryFrame, TELEMETRY_DTYPE
+from ..data.flight_log import FlightLogReader
+
+
+# Nombre d'échantillons décodés à la fois : la mémoire reste bornée quelle que soit la taille du vol
+BLOCK_SIZE = 1024
+# Cadence de scrutation maximale sous AcquisitionEngine : au-delà, read_batch livre par lots
+MAX_POLL_RATE = 200.0
+DEFAULT_SOURCE_RATE = 10.0
+_READ_CHUNK = 64 * 1024
+
+
+def _iter_json(path: Path) -> Iterator[List[TelemetryReading]]:
+    # Décodage incrémental du tableau JSON écrit par DataStorage.save_to_json
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        position = 0
+        started = False
+        eof = False
+        block: List[TelemetryReading] = []
+        
+        while True:
+            # Sauter les séparateurs entre éléments
+            while position < len(buffer) and buffer[position] in ' \t\r\n,[':
+                if buffer[position] == '[':
+                    started = True
+                position += 1
+            
+            if position < len(buffer) and buffer[position] == ']' and started:
+                break
+            
+            try:
+                if position >= len(buffer):
+                    raise ValueError("buffer vide")
+                item, position = decoder.raw_decode(buffer, position)
+            except ValueError:
+                # Élément incomplet : lire la suite du fichier
+                if eof:
+                    if buffer[position:].strip():
+                        raise ValueError(f"JSON tronqué: {path}")
+                    break
+                chunk = f.read(_READ_CHUNK)
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            
+            block.append(TelemetryReading.from_dict(item))
+            if len(block) >= BLOCK_SIZE:
+                yield block
+                block = []
+        
+        if block:
+            yield block
+
+
+def _iter_csv(path: Path) -> Iterator[List[TelemetryReading]]:
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        
+        columns = [header.index(name) if name in header else None for name in TELEMETRY_DTYPE.names]
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            # Champ absent ou vide -> NaN (converti en None par le TelemetryFrame)
+            rows.append(tuple(
+                int(row[index]) if name == 'timestamp_ns'
+                else (float(row[index]) if index is not None and row[index] != '' else float('nan'))
+                for name, index in zip(TELEMETRY_DTYPE.names, columns)
+            ))
+            if len(rows) >= BLOCK_SIZE:
+                yield TelemetryFrame.from_array(np.array(rows, dtype=TELEMETRY_DTYPE)).to_readings()
+                rows = []
+        
+        if rows:
+            yield TelemetryFrame.from_array(np.array(rows, dtype=TELEMETRY_DTYPE)).to_readings()
+
+
+def _iter_flight_log(path: Path) -> Iterator[List[TelemetryReading]]:
+    # Memmap : seules les pages du bloc courant sont lues
+    reader = FlightLogReader(path)
+    try:
+        for start in range(0, len(reader), BLOCK_SIZE):
+            yield reader.to_frame(reader.records[start:start + BLOCK_SIZE]).to_readings()
+    finally:
+        reader.close()
+
+
+_SOURCES = {
+    '.json': _iter_json,
+    '.csv': _iter_csv,
+    '.rtlog': _iter_flight_log,
+}
+
+
+def _detect_rate(path: Path) -> float:
+    # Fréquence d'origine estimée sur le premier bloc (intervalle médian entre échantillons)
+    if not path.exists():
+        return DEFAULT_SOURCE_RATE
+    blocks = _SOURCES[path.suffix](path)
+    try:
+        block = next(blocks, [])
+    finally:
+        blocks.close()
+    intervals = np.diff([reading.timestamp_ns for reading in block])
+    intervals = intervals[intervals > 0]
+    if not len(intervals):
+        return DEFAULT_SOURCE_RATE
+    return 1e9 / float(np.median(intervals))
+
+
+class ReplaySensor(BaseSensor):
+    # Rejoue un vol enregistré (JSON, CSV ou journal binaire) avec son cadencement d'origine,
+    # accéléré d'un facteur `speed`, ou aussi vite que possible si speed vaut None.
+    # Sous AcquisitionEngine, read_batch livre à chaque échéance tous les échantillons dus :
+    # la cadence de scrutation (sample_rate) peut donc rester inférieure à celle du vol.
+    def __init__(self, path: Union[str, Path], name: str = "Replay Sensor", speed: Optional[float] = 1.0,
+                 rebase_timestamps: bool = True, blocking: bool = True, sample_rate: Optional[float] = None):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed doit être strictement positif (ou None pour la vitesse maximale)")
+        path = Path(path)
+        if path.suffix not in _SOURCES:
+            raise ValueError(f"Format de vol non supporté: {path.suffix}")
+        
+        # Par défaut, scrutation à la fréquence réelle du fichier (multipliée par speed), plafonnée
+        self.source_rate = _detect_rate(path)
+        if sample_rate is None:
+            sample_rate = MAX_POLL_RATE if speed is None else min(self.source_rate * speed, MAX_POLL_RATE)
+        super().__init__(name, sample_rate)
+        
+        self.path = path
+        self.speed = speed
+        # Recaler les horodatages sur l'heure courante (affichage temps réel des graphiques)
+        self.rebase_timestamps = rebase_timestamps
+        # Si False, read_data retourne None tant que le prochain échantillon n'est pas dû
+        self.blocking = blocking
+        
+        self._blocks: Optional[Iterator[List[TelemetryReading]]] = None
+        self._block: List[TelemetryReading] = []
+        self._block_index = 0
+        self._finished = False
+        self._samples_read = 0
+        
+        # Origines : premier horodatage du fichier, instants de départ monotone et réel
+        self._origin_ns: Optional[int] = None
+        self._start_monotonic_ns = 0
+        self._start_wall_ns = 0
+    
+    def connect(self) -> bool:
+        if not self.path.exists():
+            return False
+        
+        self._blocks = _SOURCES[self.path.suffix](self.path)
+        self._block = []
+        self._block_index = 0
+        self._finished = False
+        self._samples_read = 0
+        self._origin_ns = None
+        self._is_connected = True
+        return True
+    
+    def disconnect(self) -> None:
+        if self._blocks is not None:
+            self._blocks.close()
+            self._blocks = None
+        self._is_connected = False
+    
+    @property
+    def is_finished(self) -> bool:
+        return self._finished
+    
+    @property
+    def samples_read(self) -> int:
+        return self._samples_read
+    
+    def read_data(self) -> Optional[TelemetryReading]:
+        if not self._is_connected or self._finished:
+            return None
+        
+        reading = self._peek()
+        if reading is None:
+            self._finished = True
+            return None
+        
+        offset_ns = self._offset_ns(reading)
+        if self.speed is not None:
+            delay_ns = self._start_monotonic_ns + offset_ns - time.monotonic_ns()
+            if delay_ns > 0:
+                if not self.blocking:
+                    return None
+                time.sleep(delay_ns / 1e9)
+        return self._take(reading, offset_ns)
+    
+    def read_batch(self) -> List[TelemetryReading]:
+        # Tous les échantillons dus à cet instant (au plus un bloc), sans jamais attendre :
+        # l'AcquisitionEngine garde la main sur le cadencement
+        if not self._is_connected or self._finished:
+            return []
+        
+        now_ns = time.monotonic_ns()
+        readings = []
+        while len(readings) < BLOCK_SIZE:
+            reading = self._peek()
+            if reading is None:
+                self._finished = True
+                break
+            offset_ns = self._offset_ns(reading)
+            if self.speed is not None and self._start_monotonic_ns + offset_ns > now_ns:
+                break
+            readings.append(self._take(reading, offset_ns))
+        return readings
+    
+    def _offset_ns(self, reading: TelemetryReading) -> int:
+        # Décalage depuis le début du vol, ramené à la vitesse de rejeu
+        source_ns = reading.timestamp_ns
+        if self._origin_ns is None:
+            self._origin_ns = source_ns
+            self._start_monotonic_ns = time.monotonic_ns()
+            self._start_wall_ns = time.time_ns()
+        offset_ns = source_ns - self._origin_ns
+        if self.speed is not None:
+            offset_ns = int(offset_ns / self.speed)
+        return offset_ns
+    
+    def _take(self, reading: TelemetryReading, offset_ns: int) -> TelemetryReading:
+        self._block_index += 1
+        self._samples_read += 1
+        if self.rebase_timestamps:
+            reading.timestamp_ns = self._start_wall_ns + offset_ns
+        self._last_reading = reading
+        return reading
+    
+    def _peek(self) -> Optional[TelemetryReading]:
+        while self._block_index >= len(self._block):
+            self._block = next(self._blocks, None)
+            self._block_index = 0
+            if self._block is None:
+                self._block = []
+                return None
+        return self._block[self._block_index]
+    
+    def get_status(self):
+        status = super().get_status()
+        status.update({
+            'source': str(self.path),
+            'source_rate': self.source_rate,
+            'speed': self.speed,
+            'samples_read': self._samples_read,
+            'finished': self._finished,
+        })
+        return status
@@ -0,0 +1,156 @@
+import heapq
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .base_sensor import BaseSensor
+from .acquisition_engine import AcquisitionEngine
+from ..core.telemetry_data import TelemetryReading
+
+
+class _Source:
+    __slots__ = ('sensor', 'engine', 'queue', 'in_heap', 'released', 'late',
+                 'lag_ns', 'lag_max_ns', 'started_ns')
+    
+    def __init__(self, sensor: BaseSensor, sample_rate: Optional[float]):
+        self.sensor = sensor
+        # File propre à la source : un seul producteur (son thread d'acquisition), un seul consommateur
+        self.queue: deque = deque()
+        self.engine = AcquisitionEngine(sensor, self.queue.append, sample_rate)
+        self.in_heap = False
+        self.released = 0
+        self.late = 0
+        self.lag_ns = 0
+        self.lag_max_ns = 0
+        self.started_ns = 0
+
+
+class SensorHub(BaseSensor):
+    # Agrège plusieurs capteurs (chacun sur son AcquisitionEngine) en un flux unique trié par
+    # horodatage : fusion k-voies par tas, au plus une tête par source, O(log k) par lecture.
+    # Une lecture est libérée dès que chaque source a une tête dans le tas (ordre garanti),
+    # ou au plus tard après reorder_window_ms : une source lente ne bloque pas les autres.
+    def __init__(self, sensors: Sequence[BaseSensor] = (), name: str = "Sensor Hub",
+                 reorder_window_ms: float = 100.0):
+        super().__init__(name, sample_rate=1.0)
+        self.reorder_window_ns = int(reorder_window_ms * 1e6)
+        self._sources: List[_Source] = []
+        self._heap: List[Tuple[int, int, int, TelemetryReading]] = []
+        self._sequence = 0
+        self._last_released_ns: Optional[int] = None
+        self._ready: deque = deque()
+        for sensor in sensors:
+            self.add_sensor(sensor)
+    
+    def add_sensor(self, sensor: BaseSensor, sample_rate: Optional[float] = None) -> None:
+        if self._is_connected:
+            raise RuntimeError("Ajouter les capteurs avant connect()")
+        self._sources.append(_Source(sensor, sample_rate))
+        # Le hub est interrogé au moins aussi souvent que sa source la plus rapide
+        self.sample_rate = max(source.engine.sample_rate for source in self._sources)
+    
+    @property
+    def sensors(self) -> List[BaseSensor]:
+        return [source.sensor for source in self._sources]
+    
+    def connect(self) -> bool:
+        connected = [source for source in self._sources if source.sensor.connect()]
+        if not connected:
+            return False
+        
+        now = time.monotonic_ns()
+        for source in connected:
+            source.started_ns = now
+            source.engine.start()
+        self._is_connected = True
+        return True
+    
+    def disconnect(self) -> None:
+        for source in self._sources:
+            source.engine.stop()
+            source.sensor.disconnect()
+        self._is_connected = False
+    
+    def read_data(self) -> Optional[TelemetryReading]:
+        if not self._ready:
+            self._ready.extend(self.read_batch())
+        return self._ready.popleft() if self._ready else None
+    
+    def read_batch(self) -> List[TelemetryReading]:
+        released = list(self._ready)
+        self._ready.clear()
+        if not self._is_connected:
+            return released
+        
+        heap = self._heap
+        sources = self._sources
+        
+        # Compléter le tas avec la tête de chaque source qui n'en a pas
+        for index, source in enumerate(sources):
+            if not source.in_heap and source.queue:
+                self._push_head(index, source)
+        
+        # Sources actives sans tête : elles peuvent encore produire une lecture plus ancienne
+        waiting = sum(1 for source in sources if not source.in_heap and source.engine.is_running)
+        watermark = time.time_ns() - self.reorder_window_ns
+        
+        while heap:
+            timestamp, _, index, reading = heap[0]
+            if waiting and timestamp > watermark:
+                break
+            
+            heapq.heappop(heap)
+            source = sources[index]
+            source.in_heap = False
+            self._release(source, reading, timestamp)
+            released.append(reading)
+            
+            if source.queue:
+                self._push_head(index, source)
+            elif source.engine.is_running:
+                waiting += 1
+        
+        if released:
+            self._last_reading = released[-1]
+        return released
+    
+    def _push_head(self, index: int, source: _Source) -> None:
+        reading = source.queue.popleft()
+        self._sequence += 1
+        heapq.heappush(self._heap, (reading.timestamp_ns, self._sequence, index, reading))
+        source.in_heap = True
+    
+    def _release(self, source: _Source, reading: TelemetryReading, timestamp: int) -> None:
+        # Lecture arrivée après la fenêtre de réordonnancement : émise quand même, mais comptée
+        if self._last_released_ns is not None and timestamp < self._last_released_ns:
+            source.late += 1
+        else:
+            self._last_released_ns = timestamp
+        
+        source.released += 1
+        source.lag_ns = time.time_ns() - timestamp
+        if source.lag_ns > source.lag_max_ns:
+            source.lag_max_ns = source.lag_ns
+    
+    def get_source_stats(self) -> List[Dict[str, Any]]:
+        now = time.monotonic_ns()
+        stats = []
+        for source in self._sources:
+            elapsed = (now - source.started_ns) / 1e9 if source.started_ns else 0.0
+            engine_stats = source.engine.get_stats()
+            stats.append({
+                'sensor': source.sensor.name,
+                'received': engine_stats['samples'],
+                'released': source.released,
+                'throughput': source.released / elapsed if elapsed > 0 else 0.0,
+                'queue_depth': len(source.queue) + (1 if source.in_heap else 0),
+                'late': source.late,
+                'lag_ms': source.lag_ns / 1e6,
+                'lag_max_ms': source.lag_max_ns / 1e6,
+                'missed_deadlines': engine_stats['missed_deadlines'],
+            })
+        return stats
+    
+    def get_status(self) -> Dict[str, Any]:
+        status = super().get_status()
+        status['sources'] = self.get_source_stats()
+        return status
@@ -0,0 +1,79 @@
+from collections import deque
+from typing import Any, Dict, List, Optional
+from .base_sensor import BaseSensor
+from ..core.packet_protocol import PacketDecoder
+from ..core.telemetry_data import TelemetryReading
+from ..utils.logger import get_logger
+
+
+class SerialPacketSensor(BaseSensor):
+    # Capteur sur liaison série en protocole binaire tramé (voir core.packet_protocol).
+    # Chaque appel lit tout ce qui est disponible et décode toutes les trames complètes.
+    # `stream` permet d'injecter tout objet exposant read(n) (pty, socket, tampon de test)
+    # à la place du port pyserial.
+    def __init__(self, port: Optional[str] = None, baudrate: int = 921600, stream: Any = None,
+                 name: str = "Serial Packet Sensor", sample_rate: float = 100.0,
+                 vehicle_id: Optional[int] = None, read_size: int = 65536):
+        super().__init__(name, sample_rate)
+        if port is None and stream is None:
+            raise ValueError("Un port série ou un flux doit être fourni")
+        self.port = port
+        self.baudrate = baudrate
+        # Filtre optionnel : ne garder que les trames d'un véhicule
+        self.vehicle_id = vehicle_id
+        self.read_size = read_size
+        self.decoder = PacketDecoder()
+        self.logger = get_logger()
+        
+        self._stream = stream
+        self._owns_stream = stream is None
+        self._pending: deque = deque()
+    
+    def connect(self) -> bool:
+        if self._stream is None:
+            try:
+                # Import différé : pyserial n'est requis que pour un vrai port
+                import serial
+                self._stream = serial.Serial(self.port, self.baudrate, timeout=0)
+            except Exception as e:
+                self.logger.log_error_event("Serial connection error", str(e), {"port": self.port})
+                return False
+        self.decoder.reset()
+        self._pending.clear()
+        self._is_connected = True
+        return True
+    
+    def disconnect(self) -> None:
+        if self._owns_stream and self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        self._is_connected = False
+    
+    def read_batch(self) -> List[TelemetryReading]:
+        readings = list(self._pending)
+        self._pending.clear()
+        if not self._is_connected:
+            return readings
+        
+        # Lecture non bloquante de tout ce qui est en attente (in_waiting si disponible)
+        waiting = getattr(self._stream, 'in_waiting', None)
+        data = self._stream.read(waiting or self.read_size) if waiting != 0 else b''
+        if data:
+            vehicle_id = self.vehicle_id
+            for packet in self.decoder.feed(data):
+                if vehicle_id is None or packet.vehicle_id == vehicle_id:
+                    readings.append(packet.reading)
+        
+        if readings:
+            self._last_reading = readings[-1]
+        return readings
+    
+    def read_data(self) -> Optional[TelemetryReading]:
+        if not self._pending:
+            self._pending.extend(self.read_batch())
+        return self._pending.popleft() if self._pending else None
+    
+    def get_status(self) -> Dict[str, Any]:
+        status = super().get_status()
+        status.update({'port': self.port, 'baudrate': self.baudrate, 'decoder': self.decoder.get_stats()})
+        return status
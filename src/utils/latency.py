@@ -0,0 +1,108 @@
+import bisect
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+
+
+# Bornes supérieures des buckets (ns) : 4 par octave de 1 µs à ~70 s, erreur relative < 19 %.
+# Un dernier bucket reçoit tout ce qui dépasse.
+BUCKETS_PER_OCTAVE = 4
+BUCKET_BOUNDS_NS: List[int] = [int(1000 * 2 ** (i / BUCKETS_PER_OCTAVE)) for i in range(26 * BUCKETS_PER_OCTAVE + 1)]
+_BOUNDS_ARRAY = np.array(BUCKET_BOUNDS_NS, dtype=np.int64)
+
+# Étapes du pipeline, dans l'ordre de parcours d'une lecture
+STAGES = ('sensor_read', 'jitter', 'validation', 'enqueue', 'processing', 'callback', 'paint')
+
+
+class LatencyHistogram:
+    # Histogramme à buckets fixes : enregistrement en O(log n) sans allocation, mémoire constante.
+    # Les percentiles sont la borne supérieure du bucket concerné (plafonnée au maximum observé).
+    __slots__ = ('counts', 'count', 'total_ns', 'max_ns')
+    
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+    
+    def record(self, value_ns: int) -> None:
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_NS, value_ns)] += 1
+        self.count += 1
+        self.total_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+    
+    def record_many(self, values_ns: Iterable[int]) -> None:
+        values = np.asarray(values_ns, dtype=np.int64)
+        if not len(values):
+            return
+        indices = np.searchsorted(_BOUNDS_ARRAY, values, side='left')
+        counts = self.counts
+        binned = np.bincount(indices, minlength=len(counts))
+        for index in np.flatnonzero(binned):
+            counts[index] += int(binned[index])
+        self.count += len(values)
+        self.total_ns += int(values.sum())
+        largest = int(values.max())
+        if largest > self.max_ns:
+            self.max_ns = largest
+    
+    def percentile(self, q: float) -> int:
+        if not self.count:
+            return 0
+        rank = max(1, int(np.ceil(q / 100.0 * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(BUCKET_BOUNDS_NS):
+                    return min(BUCKET_BOUNDS_NS[index], self.max_ns)
+                return self.max_ns
+        return self.max_ns
+    
+    def merge(self, other: 'LatencyHistogram') -> None:
+        for index, bucket_count in enumerate(other.counts):
+            if bucket_count:
+                self.counts[index] += bucket_count
+        self.count += other.count
+        self.total_ns += other.total_ns
+        if other.max_ns > self.max_ns:
+            self.max_ns = other.max_ns
+    
+    def reset(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+    
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ns / self.count / 1e6 if self.count else 0.0,
+            'p50_ms': self.percentile(50) / 1e6,
+            'p99_ms': self.percentile(99) / 1e6,
+            'max_ms': self.max_ns / 1e6,
+        }
+
+
+class LatencyTracker:
+    # Un histogramme par étape du pipeline. Chaque étape est enregistrée par un seul thread ;
+    # les lectures (snapshot) depuis un autre thread sont approximatives mais sans verrou.
+    def __init__(self, stages: Iterable[str] = STAGES):
+        self._histograms: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in stages}
+    
+    def histogram(self, stage: str) -> LatencyHistogram:
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            histogram = self._histograms[stage] = LatencyHistogram()
+        return histogram
+    
+    def record(self, stage: str, value_ns: int) -> None:
+        self.histogram(stage).record(value_ns)
+    
+    def reset(self, stage: Optional[str] = None) -> None:
+        stages = [stage] if stage is not None else list(self._histograms)
+        for name in stages:
+            self.histogram(name).reset()
+    
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {stage: histogram.snapshot() for stage, histogram in self._histograms.items()}
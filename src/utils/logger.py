@@ -1,41 +1,172 @@
+import atexit
 import logging
 import logging.handlers
+import queue
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 import json
 
 
+class _LazyMessage:
+    # Message dont la sérialisation JSON est différée au formatage, donc au thread d'écriture
+    # en mode asynchrone, et faite une seule fois quel que soit le nombre de handlers.
+    __slots__ = ('message', 'data', '_text')
+    
+    def __init__(self, message: str, data: Any):
+        self.message = message
+        self.data = data
+        self._text: Optional[str] = None
+    
+    def __str__(self) -> str:
+        if self._text is None:
+            data = self.data
+            if hasattr(data, 'to_dict'):
+                data = data.to_dict()
+            self._text = f"{self.message} | Data: {json.dumps(data, default=str)}"
+        return self._text
+
+
+class _BatchFlushMixin:
+    # En mode asynchrone, le flush est fait une fois par lot par le thread d'écriture
+    # au lieu d'une fois par message
+    deferred_flush = False
+    
+    def flush(self):
+        if not self.deferred_flush:
+            super().flush()
+    
+    def flush_batch(self):
+        super().flush()
+
+
+class _RotatingFileHandler(_BatchFlushMixin, logging.handlers.RotatingFileHandler):
+    pass
+
+
+class _ConsoleHandler(_BatchFlushMixin, logging.StreamHandler):
+    pass
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    # File bornée : si le thread d'écriture décroche, les messages sont comptés et abandonnés
+    # plutôt que de bloquer le thread appelant
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Pas de formatage ici (contrairement à QueueHandler) : il est fait par le thread d'écriture
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BatchWriter:
+    # Thread d'écriture : vide la file par lots, passe chaque message aux handlers
+    # (rotation comprise) puis flush une seule fois par lot
+    def __init__(self, log_queue: queue.Queue, handlers: List[logging.Handler], max_batch: int = 256):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.max_batch = max_batch
+        self.written = 0
+        self.batches = 0
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        while True:
+            record = self.queue.get()
+            batch = [record]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = False
+            for record in batch:
+                if record is None:
+                    stop = True
+                    continue
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            for handler in self.handlers:
+                try:
+                    handler.flush_batch()
+                except (OSError, ValueError):
+                    # Flux fermé ou disque indisponible : le thread d'écriture ne doit pas mourir
+                    pass
+            
+            self.written += len(batch) - stop
+            self.batches += 1
+            for _ in batch:
+                self.queue.task_done()
+            if stop:
+                return
+    
+    def flush(self, timeout: float = 2.0) -> None:
+        # Attend que les messages déjà en file soient écrits
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks and self._thread.is_alive() and time.monotonic() < deadline:
+            time.sleep(0.005)
+    
+    def stop(self, timeout: float = 2.0) -> None:
+        if self._thread.is_alive():
+            self.queue.put(None)
+            self._thread.join(timeout)
+
+
 class TelemetryLogger:
-    def __init__(self, log_dir: str = "logs", max_bytes: int = 10*1024*1024, backup_count: int = 5):
+    # asynchronous=True : les appels ne font que déposer le message dans une file bornée,
+    # un thread dédié formate et écrit sur disque (aucun blocage sur l'I/O ni la rotation).
+    # Les lectures télémétriques sont échantillonnées : une sur telemetry_sample_every,
+    # au plus telemetry_max_rate par seconde (None : sans limite).
+    def __init__(self, log_dir: str = "logs", max_bytes: int = 10*1024*1024, backup_count: int = 5,
+                 asynchronous: bool = True, queue_size: int = 10000,
+                 telemetry_sample_every: int = 1, telemetry_max_rate: Optional[float] = None):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
+        self.asynchronous = asynchronous
+        
+        self._telemetry_lock = threading.Lock()
+        self.set_telemetry_sampling(telemetry_sample_every, telemetry_max_rate)
         
         # Configuration du logger principal
         self.logger = logging.getLogger('rocket_telemetry')
         self.logger.setLevel(logging.DEBUG)
         
+        self._queue_handler: Optional[_QueueHandler] = None
+        self._writer: Optional[_BatchWriter] = None
+        
         # Éviter la duplication des handlers
         if not self.logger.handlers:
-            self._setup_handlers(max_bytes, backup_count)
+            self._setup_handlers(max_bytes, backup_count, queue_size)
     
-    def _setup_handlers(self, max_bytes: int, backup_count: int):
+    def _setup_handlers(self, max_bytes: int, backup_count: int, queue_size: int):
         # Handler pour fichier principal avec rotation
         main_file = self.log_dir / "telemetry.log"
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = _RotatingFileHandler(
             main_file, maxBytes=max_bytes, backupCount=backup_count
         )
         file_handler.setLevel(logging.DEBUG)
         
         # Handler pour erreurs uniquement
         error_file = self.log_dir / "errors.log"
-        error_handler = logging.handlers.RotatingFileHandler(
+        error_handler = _RotatingFileHandler(
             error_file, maxBytes=max_bytes, backupCount=backup_count
         )
         error_handler.setLevel(logging.ERROR)
         
         # Handler pour console
-        console_handler = logging.StreamHandler()
+        console_handler = _ConsoleHandler()
         console_handler.setLevel(logging.INFO)
         
         # Format des messages
@@ -44,36 +175,72 @@ class TelemetryLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
-        file_handler.setFormatter(formatter)
-        error_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        handlers = [file_handler, error_handler, console_handler]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        if not self.asynchronous:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+            return
         
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(error_handler)
-        self.logger.addHandler(console_handler)
+        for handler in handlers:
+            handler.deferred_flush = True
+        log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._queue_handler = _QueueHandler(log_queue)
+        self._writer = _BatchWriter(log_queue, handlers)
+        self.logger.addHandler(self._queue_handler)
+        # Pas de propagation : un handler racine formaterait et écrirait dans le thread appelant
+        self.logger.propagate = False
+        atexit.register(self.close)
     
-    def info(self, message: str, extra_data: Optional[dict] = None):
+    def _log(self, level: int, message: str, extra_data: Optional[dict]):
+        # Garde de niveau avant toute mise en forme
+        if not self.logger.isEnabledFor(level):
+            return
         if extra_data:
-            message = f"{message} | Data: {json.dumps(extra_data)}"
-        self.logger.info(message)
+            self.logger.log(level, _LazyMessage(message, dict(extra_data)))
+        else:
+            self.logger.log(level, message)
+    
+    def info(self, message: str, extra_data: Optional[dict] = None):
+        self._log(logging.INFO, message, extra_data)
     
     def warning(self, message: str, extra_data: Optional[dict] = None):
-        if extra_data:
-            message = f"{message} | Data: {json.dumps(extra_data)}"
-        self.logger.warning(message)
+        self._log(logging.WARNING, message, extra_data)
     
     def error(self, message: str, extra_data: Optional[dict] = None):
-        if extra_data:
-            message = f"{message} | Data: {json.dumps(extra_data)}"
-        self.logger.error(message)
+        self._log(logging.ERROR, message, extra_data)
     
     def debug(self, message: str, extra_data: Optional[dict] = None):
-        if extra_data:
-            message = f"{message} | Data: {json.dumps(extra_data)}"
-        self.logger.debug(message)
+        self._log(logging.DEBUG, message, extra_data)
     
-    def log_telemetry_reading(self, reading_data: dict):
-        self.debug("Telemetry reading received", reading_data)
+    def set_telemetry_sampling(self, every: int = 1, max_rate: Optional[float] = None):
+        if every < 1:
+            raise ValueError("every doit être >= 1")
+        with self._telemetry_lock:
+            self.telemetry_sample_every = every
+            self._telemetry_min_interval = 1.0 / max_rate if max_rate else 0.0
+            self._telemetry_seen = 0
+            self._telemetry_next = 0.0
+            self.telemetry_logged = 0
+            self.telemetry_suppressed = 0
+    
+    def log_telemetry_reading(self, reading_data: Any):
+        # Accepte un dict ou une lecture (to_dict() n'est appelé que si le message est écrit)
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        with self._telemetry_lock:
+            self._telemetry_seen += 1
+            now = time.monotonic()
+            if self._telemetry_seen % self.telemetry_sample_every or now < self._telemetry_next:
+                self.telemetry_suppressed += 1
+                return
+            self._telemetry_next = now + self._telemetry_min_interval
+            self.telemetry_logged += 1
+        if isinstance(reading_data, dict):
+            reading_data = dict(reading_data)
+        self.logger.debug(_LazyMessage("Telemetry reading received", reading_data))
     
     def log_sensor_event(self, event_type: str, sensor_name: str, details: Optional[dict] = None):
         message = f"Sensor {event_type}: {sensor_name}"
@@ -86,11 +253,51 @@ class TelemetryLogger:
     def log_error_event(self, error_type: str, error_message: str, details: Optional[dict] = None):
         message = f"Error - {error_type}: {error_message}"
         self.error(message, details)
+    
+    def flush(self, timeout: float = 2.0):
+        if self._writer is not None:
+            self._writer.flush(timeout)
+    
+    def close(self):
+        # Retour au mode synchrone : les messages émis après close() (atexit, fin de tests)
+        # sont écrits directement au lieu de s'accumuler dans une file sans consommateur
+        writer, queue_handler = self._writer, self._queue_handler
+        if writer is None:
+            return
+        self.logger.removeHandler(queue_handler)
+        for handler in writer.handlers:
+            handler.deferred_flush = False
+            self.logger.addHandler(handler)
+        self._writer = None
+        self._queue_handler = None
+        writer.stop()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            'asynchronous': self._writer is not None,
+            'telemetry_logged': self.telemetry_logged,
+            'telemetry_suppressed': self.telemetry_suppressed,
+        }
+        if self._writer is not None:
+            stats.update({
+                'queue_depth': self._writer.queue.qsize(),
+                'dropped': self._queue_handler.dropped,
+                'written': self._writer.written,
+                'batches': self._writer.batches,
+            })
+        return stats
 
 
-# Instance globale du logger
-telemetry_logger = TelemetryLogger()
+# Instance globale du logger, créée au premier usage : importer le module ne crée ni
+# répertoire ni fichier
+_telemetry_logger: Optional[TelemetryLogger] = None
+_logger_lock = threading.Lock()
 
 
-def get_logger():
-    return telemetry_logger
\ No newline at end of file
+def get_logger() -> TelemetryLogger:
+    global _telemetry_logger
+    if _telemetry_logger is None:
+        with _logger_lock:
+            if _telemetry_logger is None:
+                _telemetry_logger = TelemetryLogger()
+    return _telemetry_logger
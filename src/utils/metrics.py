@@ -0,0 +1,364 @@
+import json
+import math
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from .latency import BUCKET_BOUNDS_NS, BUCKETS_PER_OCTAVE, LatencyHistogram
+
+
+# Registre de métriques (compteurs, jauges, histogrammes) exportable en texte Prometheus
+# et en JSON. Les mises à jour ne prennent aucun verrou : chaque thread incrémente sa
+# propre cellule (shard), les cellules ne sont sommées qu'à la collecte. Les valeurs déjà
+# tenues par un composant sont publiées par callback, sans aucun coût sur le chemin critique.
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _freeze_labels(labels: Optional[Dict[str, Any]]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in (labels or {}).items()))
+
+
+def weak_callback(owner: Any, getter: Callable[[Any], Any]) -> Callable[[], Any]:
+    # Le registre ne doit pas maintenir le composant en vie : None une fois l'objet détruit
+    reference = weakref.ref(owner)
+    
+    def callback():
+        instance = reference()
+        return None if instance is None else getter(instance)
+    return callback
+
+
+class Counter:
+    kind = 'counter'
+    
+    def __init__(self, name: str, help_text: str, labels: Labels):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._local = threading.local()
+        self._cells: List[List[float]] = []
+        self._lock = threading.Lock()
+    
+    def inc(self, amount: float = 1) -> None:
+        try:
+            self._local.cell[0] += amount
+        except AttributeError:
+            self._new_cell()[0] += amount
+    
+    def _new_cell(self) -> List[float]:
+        # Premier incrément de ce thread : seul moment où un verrou est pris
+        cell = [0]
+        with self._lock:
+            self._cells.append(cell)
+        self._local.cell = cell
+        return cell
+    
+    @property
+    def value(self) -> float:
+        return sum(cell[0] for cell in self._cells)
+
+
+class Gauge:
+    kind = 'gauge'
+    
+    def __init__(self, name: str, help_text: str, labels: Labels):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._value = 0.0
+    
+    def set(self, value: float) -> None:
+        self._value = value
+    
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class Histogram:
+    # Durées sur les buckets fixes de LatencyHistogram, un histogramme par thread
+    kind = 'histogram'
+    
+    def __init__(self, name: str, help_text: str, labels: Labels):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._local = threading.local()
+        self._shards: List[LatencyHistogram] = []
+        self._lock = threading.Lock()
+    
+    def observe_ns(self, value_ns: int) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = LatencyHistogram()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        shard.record(value_ns)
+    
+    @property
+    def value(self) -> LatencyHistogram:
+        merged = LatencyHistogram()
+        for shard in list(self._shards):
+            merged.merge(shard)
+        return merged
+
+
+class CallbackMetric:
+    # Valeur lue à la collecte ; le callback retourne None quand la source a disparu,
+    # NaN quand elle n'a pas encore de valeur
+    def __init__(self, name: str, help_text: str, labels: Labels, kind: str, callback: Callable[[], Any]):
+        if kind not in ('counter', 'gauge', 'histogram'):
+            raise ValueError(f"Type de métrique inconnu: {kind}")
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self.kind = kind
+        self.callback = callback
+    
+    @property
+    def value(self) -> Any:
+        return self.callback()
+
+
+Metric = Union[Counter, Gauge, Histogram, CallbackMetric]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels, extra: Labels = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _format_number(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+# Bornes exportées en Prometheus : une par octave (les buckets internes restent plus fins)
+_EXPORT_BOUNDS = [(index, BUCKET_BOUNDS_NS[index]) for index in range(0, len(BUCKET_BOUNDS_NS), BUCKETS_PER_OCTAVE)]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[Tuple[str, Labels], Metric] = {}
+        self._lock = threading.Lock()
+    
+    def _get_or_create(self, cls, name: str, help_text: str, labels: Optional[Dict[str, Any]]):
+        key = (name, _freeze_labels(labels))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = self._metrics[key] = cls(name, help_text, key[1])
+        if not isinstance(metric, cls):
+            raise ValueError(f"Métrique {name} déjà enregistrée avec le type {metric.kind}")
+        return metric
+    
+    def counter(self, name: str, help_text: str = "", labels: Optional[Dict[str, Any]] = None) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labels)
+    
+    def gauge(self, name: str, help_text: str = "", labels: Optional[Dict[str, Any]] = None) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labels)
+    
+    def histogram(self, name: str, help_text: str = "", labels: Optional[Dict[str, Any]] = None) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labels)
+    
+    def register_callback(self, name: str, help_text: str, kind: str, callback: Callable[[], Any],
+                          labels: Optional[Dict[str, Any]] = None) -> CallbackMetric:
+        # Remplace une éventuelle source précédente avec les mêmes labels (ex. nouvelle instance)
+        metric = CallbackMetric(name, help_text, _freeze_labels(labels), kind, callback)
+        with self._lock:
+            self._metrics[(name, metric.labels)] = metric
+        return metric
+    
+    def unregister(self, name: str, labels: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            self._metrics.pop((name, _freeze_labels(labels)), None)
+    
+    def collect(self) -> List[Tuple[Metric, Any]]:
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        samples = []
+        dead = []
+        for key, metric in metrics:
+            try:
+                value = metric.value
+            except Exception:
+                continue
+            if value is None:
+                dead.append((key, metric))
+                continue
+            if isinstance(value, float) and not math.isfinite(value):
+                # Pas encore de valeur (ex. aucune lecture) : échantillon omis, le JSON reste valide
+                continue
+            samples.append((metric, value))
+        if dead:
+            with self._lock:
+                for key, metric in dead:
+                    if self._metrics.get(key) is metric:
+                        del self._metrics[key]
+        return samples
+    
+    def to_prometheus(self) -> str:
+        lines: List[str] = []
+        current = None
+        for metric, value in self.collect():
+            if metric.name != current:
+                current = metric.name
+                if metric.help:
+                    lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+            if metric.kind == 'histogram':
+                lines.extend(self._histogram_lines(metric, value))
+            else:
+                lines.append(f"{metric.name}{_format_labels(metric.labels)} {_format_number(value)}")
+        return "\n".join(lines) + "\n"
+    
+    @staticmethod
+    def _histogram_lines(metric: Metric, histogram: LatencyHistogram) -> List[str]:
+        lines = []
+        counts = histogram.counts
+        cumulative = 0
+        previous = 0
+        for index, bound_ns in _EXPORT_BOUNDS:
+            cumulative += sum(counts[previous:index + 1])
+            previous = index + 1
+            labels = _format_labels(metric.labels, (('le', repr(bound_ns / 1e9)),))
+            lines.append(f"{metric.name}_bucket{labels} {cumulative}")
+        lines.append(f"{metric.name}_bucket{_format_labels(metric.labels, (('le', '+Inf'),))} {histogram.count}")
+        lines.append(f"{metric.name}_sum{_format_labels(metric.labels)} {histogram.total_ns / 1e9!r}")
+        lines.append(f"{metric.name}_count{_format_labels(metric.labels)} {histogram.count}")
+        return lines
+    
+    def snapshot(self) -> Dict[str, Any]:
+        metrics: Dict[str, List[Dict[str, Any]]] = {}
+        for metric, value in self.collect():
+            if metric.kind == 'histogram':
+                value = value.snapshot()
+            metrics.setdefault(metric.name, []).append({'labels': dict(metric.labels), 'value': value})
+        return {'timestamp': time.time(), 'metrics': metrics}
+
+
+class MetricsHttpServer:
+    # Exposition locale : /metrics (texte Prometheus) et /metrics.json
+    def __init__(self, registry: Optional[MetricsRegistry] = None, host: str = "127.0.0.1", port: int = 9464):
+        self.registry = registry or get_registry()
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def address(self) -> Optional[Tuple[str, int]]:
+        return self._server.server_address[:2] if self._server is not None else None
+    
+    def start(self) -> None:
+        if self._server is not None:
+            return
+        # Import différé : le serveur HTTP n'est chargé que s'il est utilisé
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        registry = self.registry
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?', 1)[0]
+                if path == '/metrics':
+                    body = registry.to_prometheus().encode('utf-8')
+                    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+                elif path == '/metrics.json':
+                    body = json.dumps(registry.snapshot()).encode('utf-8')
+                    content_type = 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=2.0)
+        self._server = None
+        self._thread = None
+
+
+class JsonSnapshotWriter:
+    # Écrit périodiquement registry.snapshot() dans un fichier JSON (remplacement atomique)
+    def __init__(self, path: Union[str, Path], registry: Optional[MetricsRegistry] = None,
+                 interval_s: float = 5.0):
+        if interval_s <= 0:
+            raise ValueError("interval_s doit être strictement positif")
+        self.path = Path(path)
+        self.registry = registry or get_registry()
+        self.interval_s = interval_s
+        self.snapshots_written = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def write_now(self) -> None:
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.registry.snapshot(), f, indent=2)
+        os.replace(temp_path, self.path)
+        self.snapshots_written += 1
+    
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-json", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        # Dernier instantané à l'arrêt
+        self.write_now()
+    
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_s):
+            try:
+                self.write_now()
+            except OSError:
+                pass
+
+
+# Registre global, comme le logger
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> MetricsRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+    return _registry
@@ -0,0 +1,21 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.core.telemetry_data import TelemetryReading
+
+
+FLIGHT_START_NS = 1_700_000_000_000_000_000
+
+
+def make_reading(index: int) -> TelemetryReading:
+    # Champs non nuls pour que les aller-retours d'encodage soient significatifs, GPS une lecture sur deux
+    return TelemetryReading.from_values(
+        timestamp_ns=FLIGHT_START_NS + index * 10_000_000,
+        altitude=float(index), velocity=0.5,
+        acc_x=0.25, acc_y=-0.25, acc_z=9.75,
+        temperature=20.5, pressure=101325.0,
+        roll=1.0, pitch=2.0, yaw=3.0,
+        lat=45.5017 if index % 2 else None, lon=-73.5673 if index % 2 else None,
+        battery_voltage=12.5
+    )
@@ -0,0 +1,83 @@
+import unittest
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.sensors.acquisition_engine import AcquisitionEngine
+from src.sensors.mock_sensor import MockRocketSensor
+
+
+class SlowSensor(MockRocketSensor):
+    def __init__(self, delay: float, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+    
+    def read_data(self):
+        time.sleep(self.delay)
+        return super().read_data()
+
+
+class AsyncSensor(MockRocketSensor):
+    supports_async = True
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.async_reads = 0
+    
+    async def read_data_async(self):
+        self.async_reads += 1
+        return self.read_data()
+
+
+class FailingSensor(MockRocketSensor):
+    def read_data(self):
+        raise IOError("bus error")
+
+
+class TestAcquisitionEngine(unittest.TestCase):
+    def run_engine(self, sensor, duration: float, **kwargs):
+        sensor.connect()
+        received = []
+        engine = AcquisitionEngine(sensor, received.append, **kwargs)
+        engine.start()
+        time.sleep(duration)
+        engine.stop()
+        self.assertFalse(engine.is_running)
+        return engine, received
+    
+    def test_rate_above_integer_millisecond_resolution(self):
+        # 400 Hz : période de 2.5 ms, impossible avec un QTimer en ms entières
+        engine, received = self.run_engine(MockRocketSensor(sample_rate=400.0), 0.5)
+        self.assertGreater(len(received), 150)
+        self.assertLess(len(received), 230)
+        stats = engine.get_stats()
+        self.assertEqual(stats['samples'], len(received))
+        self.assertGreaterEqual(stats['jitter_max_ms'], 0.0)
+    
+    def test_absolute_deadlines_do_not_drift(self):
+        # Lecture de 6 ms pour une période de 10 ms : pas d'accumulation du temps de lecture
+        engine, received = self.run_engine(SlowSensor(0.006, sample_rate=100.0), 0.5)
+        self.assertGreater(len(received), 40)
+        self.assertEqual(engine.missed_deadlines, 0)
+    
+    def test_overrun_counts_missed_deadlines(self):
+        engine, received = self.run_engine(SlowSensor(0.025, sample_rate=100.0), 0.3)
+        self.assertGreater(engine.missed_deadlines, 0)
+        self.assertLess(len(received), 20)
+    
+    def test_async_capable_sensor_runs_on_event_loop(self):
+        sensor = AsyncSensor(sample_rate=100.0)
+        engine, received = self.run_engine(sensor, 0.2)
+        self.assertTrue(engine.use_asyncio)
+        self.assertGreater(sensor.async_reads, 5)
+        self.assertEqual(len(received), sensor.async_reads)
+    
+    def test_read_errors_counted_without_stopping(self):
+        engine, received = self.run_engine(FailingSensor(sample_rate=100.0), 0.1)
+        self.assertEqual(received, [])
+        self.assertGreater(engine.read_errors, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
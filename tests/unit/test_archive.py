@@ -0,0 +1,116 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from src.core.telemetry_data import TelemetryReading
+from src.core.telemetry_frame import TelemetryFrame
+from src.data.archive import ArchiveReader, ArchiveWriter
+from src.data.data_storage import DataStorage
+
+START_NS = 1_700_000_000_000_000_000
+STEP_NS = 10_000_000  # 100 Hz
+
+
+def make_frame(count: int) -> TelemetryFrame:
+    frame = TelemetryFrame(capacity=count)
+    frame.extend(TelemetryReading.from_values(
+        timestamp_ns=START_NS + i * STEP_NS, altitude=i * 0.5, velocity=50.0,
+        acc_x=np.sin(i), acc_y=0.0, acc_z=9.8, temperature=20.0 - i * 0.001,
+        pressure=101325.0, roll=0.0, pitch=0.0, yaw=0.0,
+        lat=45.5 if i % 3 else None, lon=-73.5 if i % 3 else None, battery_voltage=12.0
+    ) for i in range(count))
+    return frame
+
+
+class TestColumnarArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "flight.rtarc")
+        self.frame = make_frame(2000)  # 20 secondes de vol
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def _write(self, codec: str = 'zlib', block: int = 333) -> ArchiveReader:
+        with ArchiveWriter(self.path, chunk_seconds=1.0, codec=codec) as writer:
+            for start in range(0, len(self.frame), block):
+                writer.add_frame(self.frame[start:start + block])
+        return ArchiveReader(self.path)
+    
+    def test_lossless_round_trip(self):
+        for codec in ('zlib', 'lzma'):
+            reader = self._write(codec)
+            restored = reader.to_frame()
+            self.assertEqual(len(restored), len(self.frame))
+            # Comparaison binaire : les NaN doivent aussi être conservés
+            self.assertEqual(restored.data.tobytes(), self.frame.data.tobytes())
+    
+    def test_chunks_follow_time(self):
+        reader = self._write()
+        self.assertEqual(len(reader.chunks), 20)
+        for chunk in reader.chunks:
+            self.assertEqual(chunk['count'], 100)
+            self.assertLess(chunk['t1'] - chunk['t0'], 1_000_000_000)
+    
+    def test_range_query_touches_relevant_chunks(self):
+        reader = self._write()
+        start = START_NS + 3 * 1_000_000_000
+        end = START_NS + 12 * 1_000_000_000
+        
+        self.assertEqual(len(reader.select_chunks(start, end)), 10)
+        times, altitude = reader.read_relative('altitude', 3, 12)
+        self.assertEqual(times[0], start)
+        self.assertEqual(times[-1], end)
+        self.assertEqual(len(altitude), 901)
+        self.assertEqual(altitude[0], 150.0)
+    
+    def test_out_of_order_input(self):
+        # Lectures désordonnées à l'intérieur des lots et d'un lot à l'autre
+        order = np.random.default_rng(3).permutation(len(self.frame))
+        for start in range(0, len(order), 100):
+            order[start:start + 100].sort()
+        shuffled = TelemetryFrame.from_array(self.frame.data[order])
+        with ArchiveWriter(self.path, chunk_seconds=1.0) as writer:
+            for start in range(0, len(shuffled), 250):
+                writer.add_frame(shuffled[start:start + 250])
+        reader = ArchiveReader(self.path)
+        
+        self.assertEqual(len(reader), len(self.frame))
+        self.assertEqual(reader.start_ns, START_NS)
+        self.assertEqual(reader.end_ns, START_NS + 1999 * STEP_NS)
+        restored = reader.to_frame()
+        self.assertEqual(sorted(restored['timestamp_ns'].tolist()), self.frame['timestamp_ns'].tolist())
+        
+        start = START_NS + 3 * 1_000_000_000
+        end = START_NS + 12 * 1_000_000_000
+        times, altitude = reader.read_column('altitude', start, end)
+        self.assertEqual(sorted(times.tolist()), list(range(start, end + 1, STEP_NS)))
+        self.assertEqual(reader.channel_bounds('altitude'), (0.0, 999.5))
+    
+    def test_bounds_from_index(self):
+        reader = self._write()
+        self.assertEqual(reader.channel_bounds('altitude'), (0.0, 999.5))
+        self.assertEqual(reader.channel_bounds('lat'), (45.5, 45.5))
+    
+    def test_compresses_slow_channels(self):
+        reader = self._write()
+        self.assertLess(os.path.getsize(self.path), self.frame.data.nbytes)
+        timestamp_bytes = sum(c['columns']['timestamp_ns']['length'] for c in reader.chunks)
+        self.assertLess(timestamp_bytes, 2000)
+    
+    def test_storage_archive_from_flight_log(self):
+        storage = DataStorage(self.tmp_dir)
+        log_name = os.path.basename(storage.save_to_binary(self.frame, "flight.rtlog"))
+        archive = storage.save_to_archive(storage.load_flight_log(log_name), "flight_log.rtarc")
+        
+        reader = storage.open_archive(os.path.basename(archive))
+        self.assertEqual(len(reader), len(self.frame))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.data.batch_dispatch import BatchSubscription, PullSubscription, SheddingPolicy
+from src.data.data_processor import TelemetryProcessor
+
+from helpers import make_reading
+
+
+class TestBatchSubscription(unittest.TestCase):
+    def test_batches_are_coalesced(self):
+        batches = []
+        subscription = BatchSubscription(batches.append, max_batch=10, max_latency_ms=1000)
+        subscription.start()
+        subscription.offer([make_reading(i) for i in range(25)])
+        time.sleep(0.1)
+        
+        # Deux lots complets livrés immédiatement, le reste attend la latence max
+        self.assertEqual([len(b) for b in batches], [10, 10])
+        subscription.stop()
+        self.assertEqual(sum(len(b) for b in batches), 25)
+    
+    def test_latency_bound_flushes_partial_batch(self):
+        batches = []
+        subscription = BatchSubscription(batches.append, max_batch=100, max_latency_ms=20)
+        subscription.start()
+        subscription.offer([make_reading(0)])
+        time.sleep(0.15)
+        subscription.stop()
+        
+        self.assertEqual([len(b) for b in batches], [1])
+    
+    def test_slow_consumer_keeps_latest(self):
+        release = threading.Event()
+        batches = []
+        
+        def slow_callback(batch):
+            release.wait(2.0)
+            batches.append(batch)
+        
+        subscription = BatchSubscription(slow_callback, max_batch=5, max_latency_ms=1,
+                                         max_pending=10, shedding=SheddingPolicy.LATEST)
+        subscription.start()
+        subscription.offer([make_reading(i) for i in range(5)])
+        time.sleep(0.05)  # premier lot en cours de livraison, bloqué
+        for start in range(5, 50, 5):
+            subscription.offer([make_reading(i) for i in range(start, start + 5)])
+        
+        self.assertLessEqual(subscription.queue_depth, 10)
+        self.assertGreater(subscription.get_stats()['dropped'], 0)
+        
+        release.set()
+        subscription.stop()
+        # La dernière lecture produite est toujours livrée
+        self.assertEqual(batches[-1][-1].altitude, 49.0)
+    
+    def test_drop_oldest_bounds_backlog(self):
+        subscription = BatchSubscription(lambda batch: None, max_batch=100, max_pending=10,
+                                         shedding=SheddingPolicy.DROP_OLDEST)
+        subscription.offer([make_reading(i) for i in range(25)])
+        
+        self.assertEqual(subscription.queue_depth, 10)
+        self.assertEqual(subscription.dropped, 15)
+    
+    def test_processor_batch_callback(self):
+        processor = TelemetryProcessor()
+        received = []
+        processor.add_batch_callback(received.extend, max_batch=20, max_latency_ms=10)
+        processor.start_processing()
+        
+        for i in range(50):
+            processor.add_reading(make_reading(i))
+        time.sleep(0.2)
+        processor.stop_processing()
+        
+        self.assertEqual([r.altitude for r in received], [float(i) for i in range(50)])
+        stats = processor.get_callback_stats()[0]
+        self.assertEqual(stats['delivered'], 50)
+        self.assertEqual(stats['dropped'], 0)
+    
+    
+    def test_pull_subscription_drains_pending(self):
+        subscription = PullSubscription(max_pending=10)
+        self.assertEqual(subscription.drain(), [])
+        
+        subscription.offer([make_reading(i) for i in range(25)])
+        batch = subscription.drain()
+        
+        # Seules les plus récentes sont conservées, dans l'ordre
+        self.assertEqual([r.altitude for r in batch], [float(i) for i in range(15, 25)])
+        self.assertEqual(subscription.drain(), [])
+        stats = subscription.get_stats()
+        self.assertEqual(stats['delivered'], 10)
+        self.assertEqual(stats['dropped'], 15)
+    
+    def test_processor_pull_subscription(self):
+        processor = TelemetryProcessor()
+        feed = processor.add_pull_subscription()
+        processor.start_processing()
+        
+        for i in range(30):
+            processor.add_reading(make_reading(i))
+        time.sleep(0.2)
+        processor.stop_processing()
+        
+        self.assertEqual([r.altitude for r in feed.drain()], [float(i) for i in range(30)])
+
+
+if __name__ == '__main__':
+    unittest.main()
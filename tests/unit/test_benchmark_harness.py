@@ -0,0 +1,61 @@
+import unittest
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from benchmarks.harness import BenchmarkResult, compare, load_baseline, save_results, update_baseline
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_regression_beyond_tolerance(self):
+        baseline = {'results': {
+            'cost': {'value': 10.0},
+            'throughput': {'value': 1000.0},
+            'noisy': {'value': 1.0},
+        }}
+        results = [
+            BenchmarkResult('cost', 12.0, 'µs'),
+            BenchmarkResult('throughput', 700.0, 'lect/s', higher_is_better=True),
+            BenchmarkResult('noisy', 5.0, 'ms', gated=False),
+            BenchmarkResult('new', 1.0, 'ms'),
+        ]
+        comparisons = {c.result.name: c for c in compare(results, baseline, tolerance=0.3)}
+        
+        self.assertFalse(comparisons['cost'].regressed)
+        self.assertAlmostEqual(comparisons['cost'].change, 0.2)
+        # 700 lect/s pour 1000 : ~43 % plus lent
+        self.assertTrue(comparisons['throughput'].regressed)
+        self.assertFalse(comparisons['noisy'].regressed)
+        self.assertIsNone(comparisons['new'].baseline)
+    
+    def test_baseline_round_trip(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "baseline.json"
+            self.assertIsNone(load_baseline(path))
+            save_results([BenchmarkResult('cost', 3.5, 'µs')], path)
+            baseline = load_baseline(path)
+        
+        self.assertEqual(baseline['results']['cost']['value'], 3.5)
+        self.assertIn('python', baseline['environment'])
+        self.assertEqual(compare([BenchmarkResult('cost', 3.5, 'µs')], baseline)[0].change, 0.0)
+    
+    def test_filtered_update_keeps_other_groups(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "baseline.json"
+            # Première exécution filtrée : la référence est créée avec ce seul groupe
+            update_baseline([BenchmarkResult('sensor.rate', 100.0, 'lect/s', higher_is_better=True)], path)
+            update_baseline([BenchmarkResult('storage.save', 2.0, 'ms'),
+                             BenchmarkResult('storage.load', 1.0, 'ms')], path)
+            # Mise à jour filtrée d'un seul groupe
+            update_baseline([BenchmarkResult('sensor.rate', 120.0, 'lect/s', higher_is_better=True)], path)
+            baseline = load_baseline(path)
+        
+        values = {name: entry['value'] for name, entry in baseline['results'].items()}
+        self.assertEqual(values, {'sensor.rate': 120.0, 'storage.save': 2.0, 'storage.load': 1.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,9 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from src.core.telemetry_data import TelemetryReading
+from src.core.telemetry_frame import TelemetryFrame
 from src.data.data_processor import TelemetryProcessor
+from src.data.spsc_ring import OverflowPolicy
 
 
 class TestTelemetryProcessor(unittest.TestCase):
@@ -74,6 +76,22 @@ class TestTelemetryProcessor(unittest.TestCase):
         recent_data = self.processor.get_recent_data(duration_seconds=60)
         self.assertEqual(len(recent_data), 1)
     
+    def test_get_range(self):
+        base_ns = self.sample_reading.timestamp_ns
+        for offset in range(5):
+            reading = TelemetryReading.from_values(
+                timestamp_ns=base_ns + offset * 1_000_000_000, altitude=100.0 * offset, velocity=0.0,
+                acc_x=0.0, acc_y=0.0, acc_z=9.8, temperature=20.0, pressure=101325.0,
+                roll=0.0, pitch=0.0, yaw=0.0
+            )
+            self.processor.add_reading(reading)
+        self.processor.start_processing()
+        
+        time.sleep(0.1)
+        
+        window = self.processor.get_range(base_ns + 1_000_000_000, base_ns + 3_000_000_000)
+        self.assertEqual([r.altitude for r in window], [100.0, 200.0, 300.0])
+    
     def test_get_latest_reading(self):
         self.processor.add_reading(self.sample_reading)
         self.processor.start_processing()
@@ -113,6 +131,55 @@ class TestTelemetryProcessor(unittest.TestCase):
         self.assertTrue(callback_called)
         self.assertIsNotNone(received_reading)
         self.assertEqual(received_reading.altitude, 1000.0)
+    
+    
+    def test_add_frame(self):
+        invalid_reading = TelemetryReading(
+            timestamp=datetime.now(),
+            altitude=1000.0,
+            velocity=50.0,
+            acceleration={'x': 1.0, 'y': 2.0, 'z': 9.8},
+            temperature=150.0,  # Trop élevée
+            pressure=101325.0,
+            orientation={'roll': 0.0, 'pitch': 5.0, 'yaw': -2.0}
+        )
+        frame = TelemetryFrame.from_readings([self.sample_reading, invalid_reading, self.sample_reading])
+        
+        result = self.processor.add_frame(frame)
+        self.assertEqual(result.valid_count, 2)
+        
+        self.processor.start_processing()
+        time.sleep(0.2)
+        
+        self.assertEqual(len(self.processor.get_all_data()), 2)
+        stats = self.processor.get_validation_stats()
+        self.assertEqual(stats['accepted'], 2)
+        self.assertEqual(stats['rejected'], 1)
+        self.assertEqual(stats['rejections_by_rule']['temperature'], 1)
+    
+    def test_stop_drains_queue(self):
+        # Tout ce qui est accepté avant l'arrêt est traité, même si la file n'était pas vide
+        received = []
+        self.processor.add_data_callback(received.append)
+        self.processor.start_processing()
+        for _ in range(5000):
+            self.assertTrue(self.processor.add_reading(self.sample_reading))
+        self.processor.stop_processing()
+        
+        self.assertEqual(len(received), 5000)
+        self.assertEqual(self.processor.get_validation_stats()['accepted'], 5000)
+        self.assertEqual(self.processor.get_ingest_stats()['depth'], 0)
+    
+    def test_dropped_readings_are_not_accepted(self):
+        processor = TelemetryProcessor(queue_capacity=4, overflow_policy=OverflowPolicy.DROP_NEWEST)
+        results = [processor.add_reading(self.sample_reading) for _ in range(6)]
+        frame = TelemetryFrame.from_readings([self.sample_reading] * 3)
+        processor.add_frame(frame)
+        
+        self.assertEqual(results, [True] * 4 + [False] * 2)
+        self.assertEqual(processor.get_validation_stats()['accepted'], 4)
+        pipeline = processor.get_pipeline_stats()
+        self.assertEqual(pipeline['ingest_dropped'], 5)
 
 
 if __name__ == '__main__':
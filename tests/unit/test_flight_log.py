@@ -0,0 +1,122 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from src.core.telemetry_frame import TelemetryFrame
+from src.data.flight_log import FlightLogReader, FlightLogWriter, read_flags, read_header, FLAG_UNSORTED, FORMAT_VERSION
+
+from helpers import make_reading
+
+
+class TestFlightLog(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "flight.rtlog")
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_write_and_read_back(self):
+        readings = [make_reading(i) for i in range(100)]
+        with FlightLogWriter(self.path) as writer:
+            for reading in readings[:50]:
+                writer.append(reading)
+            writer.append_frame(TelemetryFrame.from_readings(readings[50:]))
+        
+        reader = FlightLogReader(self.path)
+        self.assertEqual(len(reader), 100)
+        self.assertEqual(reader.version, FORMAT_VERSION)
+        self.assertIsInstance(reader.records, np.memmap)
+        self.assertEqual(reader.to_readings(), readings)
+    
+    def test_append_to_existing_log(self):
+        with FlightLogWriter(self.path) as writer:
+            writer.append(make_reading(0))
+        
+        # Simuler un enregistrement partiel laissé par un arrêt brutal
+        with open(self.path, 'ab') as f:
+            f.write(b'\x01\x02\x03')
+        self.assertEqual(len(FlightLogReader(self.path)), 1)
+        
+        with FlightLogWriter(self.path) as writer:
+            writer.append(make_reading(1))
+        
+        reader = FlightLogReader(self.path)
+        self.assertEqual(reader.column('altitude').tolist(), [0.0, 1.0])
+    
+    def test_time_slice_is_view(self):
+        with FlightLogWriter(self.path) as writer:
+            writer.append_frame(TelemetryFrame.from_readings([make_reading(i) for i in range(1000)]))
+        
+        reader = FlightLogReader(self.path)
+        start = reader.start_ns + 100 * 10_000_000
+        end = reader.start_ns + 199 * 10_000_000
+        view = reader.time_slice(start, end)
+        
+        self.assertEqual(len(view), 100)
+        self.assertEqual(view['altitude'][0], 100.0)
+        self.assertTrue(np.shares_memory(view, reader.records))
+    
+    def test_out_of_order_input(self):
+        # Arrivée désordonnée (plusieurs capteurs) : le fichier est marqué, les requêtes passent par un masque
+        order = [0, 1, 2, 5, 3, 4, 8, 6, 7, 9]
+        with FlightLogWriter(self.path) as writer:
+            writer.append_frame(TelemetryFrame.from_readings([make_reading(i) for i in order[:3]]))
+            self.assertTrue(writer.is_sorted)
+            for i in order[3:]:
+                writer.append(make_reading(i))
+            self.assertFalse(writer.is_sorted)
+        
+        self.assertTrue(read_flags(self.path) & FLAG_UNSORTED)
+        reader = FlightLogReader(self.path)
+        self.assertFalse(reader.is_sorted)
+        self.assertEqual(reader.start_ns, make_reading(0).timestamp_ns)
+        self.assertEqual(reader.end_ns, make_reading(9).timestamp_ns)
+        
+        selected = reader.time_slice(make_reading(3).timestamp_ns, make_reading(6).timestamp_ns)
+        self.assertEqual(selected['altitude'].tolist(), [5.0, 3.0, 4.0, 6.0])
+        self.assertEqual(reader.sorted_records()['altitude'].tolist(), [float(i) for i in range(10)])
+        with self.assertRaises(ValueError):
+            reader.index_range(0, 1)
+        
+        # Désordre à l'intérieur d'un lot, et conservation du drapeau lors d'un ajout
+        other = os.path.join(self.tmp_dir, "other.rtlog")
+        with FlightLogWriter(other) as writer:
+            writer.append_frame(TelemetryFrame.from_readings([make_reading(i) for i in (1, 0)]))
+        with FlightLogWriter(other) as writer:
+            self.assertFalse(writer.is_sorted)
+        
+        # Ajout plus ancien que le dernier enregistrement d'un fichier existant
+        with FlightLogWriter(self.path + ".2") as writer:
+            writer.append(make_reading(5))
+        with FlightLogWriter(self.path + ".2") as writer:
+            writer.append(make_reading(4))
+        self.assertFalse(FlightLogReader(self.path + ".2").is_sorted)
+    
+    def test_older_schema_is_readable(self):
+        # Un fichier écrit avec moins de canaux reste lisible
+        old_dtype = np.dtype([('timestamp_ns', '<i8'), ('altitude', '<f8')])
+        with FlightLogWriter(self.path, dtype=old_dtype) as writer:
+            frame_data = np.array([(1, 10.0), (2, 20.0)], dtype=old_dtype)
+            writer._file.write(frame_data.tobytes())
+        
+        reader = FlightLogReader(self.path)
+        self.assertEqual(reader.channels, ('timestamp_ns', 'altitude'))
+        frame = reader.to_frame()
+        self.assertEqual(frame['altitude'].tolist(), [10.0, 20.0])
+        self.assertTrue(np.isnan(frame['pressure']).all())
+    
+    def test_rejects_unknown_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a flight log at all' * 4)
+        with self.assertRaises(ValueError):
+            read_header(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.data.data_storage import DataStorage
+from src.data.flight_log import FlightLogReader
+from src.headless import record
+from src.sensors.mock_sensor import MockRocketSensor
+from src.sensors.replay_sensor import ReplaySensor
+
+from helpers import make_reading
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+class TestHeadless(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_record_writes_flight_log(self):
+        summary = record(MockRocketSensor(), DataStorage(self.tmp_dir), duration=0.3, rate=50.0,
+                         output="flight.rtlog")
+        
+        self.assertEqual(summary['file'], os.path.join(self.tmp_dir, "flight.rtlog"))
+        with FlightLogReader(summary['file']) as log:
+            self.assertEqual(len(log), summary['acquisition']['samples'])
+            self.assertGreater(len(log), 5)
+    
+    def test_replay_at_max_speed_records_every_sample(self):
+        # Vol à 100 Hz rejoué sans cadencement : rien ne doit manquer à la fin du fichier
+        storage = DataStorage(self.tmp_dir)
+        source = storage.save_to_binary([make_reading(i) for i in range(3000)], "source.rtlog")
+        summary = record(ReplaySensor(source, speed=None, rebase_timestamps=False), storage,
+                         duration=10.0, output="copy.rtlog")
+        
+        self.assertLess(summary['elapsed_s'], 5.0)
+        self.assertEqual(summary['validation']['accepted'], 3000)
+        with FlightLogReader(summary['file']) as log, FlightLogReader(source) as original:
+            self.assertEqual(log.column('timestamp_ns').tolist(), original.column('timestamp_ns').tolist())
+    
+    def test_entry_point_never_imports_gui_stack(self):
+        # Processus séparé : les modules déjà chargés par la suite de tests ne comptent pas
+        code = (
+            "import sys, runpy\n"
+            "sys.path.insert(0, %r)\n"
+            "sys.argv = ['main.py', '--headless', '--duration', '0.1', '--output-dir', 'out']\n"
+            "try:\n"
+            "    runpy.run_path(%r, run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('GUI_MODULES', sorted(m for m in sys.modules if m.split('.')[0] in ('PyQt5', 'matplotlib')))\n"
+        ) % (ROOT, os.path.join(ROOT, 'main.py'))
+        result = subprocess.run([sys.executable, '-c', code], cwd=self.tmp_dir,
+                                capture_output=True, text=True, timeout=60)
+        
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("GUI_MODULES []", result.stdout)
+        self.assertEqual(len(os.listdir(os.path.join(self.tmp_dir, 'out'))), 1)
+    
+    def test_logger_import_has_no_side_effects(self):
+        code = "import sys, os; sys.path.insert(0, %r); import src.utils.logger; print(os.path.exists('logs'))" % ROOT
+        result = subprocess.run([sys.executable, '-c', code], cwd=self.tmp_dir,
+                                capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == '__main__':
+    unittest.main()
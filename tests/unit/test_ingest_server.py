@@ -0,0 +1,134 @@
+import unittest
+import asyncio
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.core.packet_protocol import encode_frame
+from src.data.data_storage import DataStorage
+from src.data.flight_log import FlightLogReader
+from src.data.data_processor import TelemetryProcessor
+from src.network.ingest_server import IngestServer, VehiclePipeline, create_vehicle_processor
+
+from helpers import make_reading
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
+class TestIngestServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_routes_udp_and_tcp_by_vehicle(self):
+        async def scenario():
+            server = IngestServer(storage=DataStorage(self.tmp_dir))
+            await server.start()
+            
+            # Véhicule 1 en UDP : 2 trames par datagramme, seq 10-11 perdues
+            udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sequence = [s for s in range(30) if s not in (10, 11)]
+            for start in range(0, len(sequence), 2):
+                datagram = b''.join(encode_frame(make_reading(s), 1, s) for s in sequence[start:start + 2])
+                udp.sendto(datagram, server.udp_address)
+            udp.close()
+            
+            # Véhicules 2 et 3 multiplexés sur un même flux TCP, découpé arbitrairement
+            reader, writer = await asyncio.open_connection(*server.tcp_address)
+            stream = b''.join(encode_frame(make_reading(i), 2 + i % 2, i // 2) for i in range(40))
+            for start in range(0, len(stream), 50):
+                writer.write(stream[start:start + 50])
+                await writer.drain()
+            
+            await wait_for(lambda: sum(p.frames for p in server.vehicles.values()) >= 68)
+            await wait_for(lambda: all(len(p.processor.get_all_data()) == p.frames
+                                       for p in server.vehicles.values()))
+            
+            vehicle_stats = server.get_vehicle_stats()
+            connection_stats = server.get_connection_stats()
+            lengths = {vid: len(p.processor.get_all_data()) for vid, p in server.vehicles.items()}
+            
+            writer.close()
+            await writer.wait_closed()
+            files = await server.stop()
+            return vehicle_stats, connection_stats, lengths, files
+        
+        vehicle_stats, connection_stats, lengths, files = asyncio.run(scenario())
+        
+        self.assertEqual(lengths, {1: 28, 2: 20, 3: 20})
+        self.assertEqual(vehicle_stats[1]['validation']['accepted'], 28)
+        
+        by_protocol = {entry['protocol']: entry for entry in connection_stats}
+        self.assertEqual(by_protocol['udp']['frames'], 28)
+        self.assertEqual(by_protocol['udp']['lost'], 2)
+        self.assertEqual(by_protocol['tcp']['frames'], 40)
+        self.assertEqual(by_protocol['tcp']['lost'], 0)
+        
+        # Un fichier de vol par véhicule
+        self.assertEqual(sorted(files), [1, 2, 3])
+        with FlightLogReader(files[2]) as log:
+            self.assertEqual(len(log), 20)
+    
+    def test_saturated_vehicle_does_not_stall_others(self):
+        # Le consommateur du véhicule 1 est bloqué : sa file déborde sans bloquer la boucle
+        release = threading.Event()
+        
+        def factory(vehicle_id):
+            processor = create_vehicle_processor(vehicle_id)
+            if vehicle_id == 1:
+                processor.add_data_callback(lambda reading: release.wait(5.0))
+            return processor
+        
+        async def scenario():
+            server = IngestServer(processor_factory=factory)
+            await server.start()
+            reader, writer = await asyncio.open_connection(*server.tcp_address)
+            burst = 10000
+            stream = b''.join(encode_frame(make_reading(i), 1, i % 65536) for i in range(burst))
+            writer.write(stream)
+            writer.write(b''.join(encode_frame(make_reading(i), 2, i) for i in range(20)))
+            await writer.drain()
+            
+            started = time.monotonic()
+            await wait_for(lambda: 2 in server.vehicles
+                           and len(server.vehicles[2].processor.get_all_data()) == 20)
+            elapsed = time.monotonic() - started
+            stats = server.get_vehicle_stats()
+            
+            release.set()
+            writer.close()
+            await writer.wait_closed()
+            await server.stop()
+            return elapsed, stats
+        
+        elapsed, stats = asyncio.run(scenario())
+        self.assertLess(elapsed, 1.5)
+        self.assertEqual(stats[2]['validation']['accepted'], 20)
+        self.assertEqual(stats[1]['frames'], 10000)
+        self.assertGreater(stats[1]['ingest']['dropped_oldest'], 0)
+    
+    def test_pipeline_close_writes_queued_frames(self):
+        # Fermeture juste après une rafale : la file d'ingestion est vidée avant finalisation
+        writer = DataStorage(self.tmp_dir).create_stream_writer("vehicle.rtlog")
+        pipeline = VehiclePipeline(1, TelemetryProcessor(name="vehicle-close-test"), writer)
+        for i in range(20000):
+            pipeline.processor.add_reading(make_reading(i))
+        path = pipeline.close()
+        
+        with FlightLogReader(path) as log:
+            self.assertEqual(len(log), 20000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import os
+import sys
+import time
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.core.telemetry_data import TelemetryReading
+from src.data.data_processor import TelemetryProcessor
+from src.utils.latency import LatencyHistogram, LatencyTracker
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        # 1 à 1000 µs
+        for value in range(1, 1001):
+            histogram.record(value * 1000)
+        
+        p50 = histogram.percentile(50)
+        p99 = histogram.percentile(99)
+        self.assertGreaterEqual(p50, 500_000)
+        self.assertLess(p50, 500_000 * 1.19)
+        self.assertGreaterEqual(p99, 990_000)
+        self.assertLessEqual(p99, 1_000_000)
+        self.assertEqual(histogram.max_ns, 1_000_000)
+        self.assertAlmostEqual(histogram.snapshot()['mean_ms'], 0.5005)
+    
+    def test_record_many_matches_record(self):
+        values = np.random.default_rng(1).integers(0, 10**9, 5000)
+        one_by_one = LatencyHistogram()
+        for value in values:
+            one_by_one.record(int(value))
+        vectorized = LatencyHistogram()
+        vectorized.record_many(values)
+        
+        self.assertEqual(one_by_one.counts, vectorized.counts)
+        self.assertEqual(one_by_one.snapshot(), vectorized.snapshot())
+    
+    def test_overflow_and_empty(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.percentile(99), 0)
+        histogram.record(10**12)
+        self.assertEqual(histogram.percentile(50), 10**12)
+        self.assertEqual(histogram.counts[-1], 1)
+    
+    def test_tracker_merge_and_reset(self):
+        tracker = LatencyTracker()
+        tracker.record('validation', 2000)
+        other = LatencyHistogram()
+        other.record(4000)
+        tracker.histogram('validation').merge(other)
+        
+        self.assertEqual(tracker.snapshot()['validation']['count'], 2)
+        tracker.reset()
+        self.assertEqual(tracker.snapshot()['validation']['count'], 0)
+
+
+class TestProcessorLatency(unittest.TestCase):
+    def test_pipeline_stats(self):
+        processor = TelemetryProcessor()
+        processor.add_data_callback(lambda reading: None)
+        processor.start_processing()
+        for i in range(100):
+            processor.add_reading(TelemetryReading.from_values(
+                timestamp_ns=time.time_ns(), altitude=float(i), velocity=0.0,
+                acc_x=0.0, acc_y=0.0, acc_z=9.8, temperature=20.0, pressure=101325.0,
+                roll=0.0, pitch=0.0, yaw=0.0
+            ))
+        time.sleep(0.2)
+        processor.stop_processing()
+        
+        stats = processor.get_pipeline_stats()
+        latency = stats['latency']
+        self.assertEqual(latency['validation']['count'], 100)
+        self.assertEqual(latency['enqueue']['count'], 100)
+        self.assertGreater(latency['processing']['count'], 0)
+        self.assertGreater(latency['callback']['count'], 0)
+        self.assertLessEqual(latency['enqueue']['p50_ms'], latency['enqueue']['max_ms'])
+        self.assertEqual(stats['accepted'], 100)
+        self.assertEqual(stats['ingest_dropped'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
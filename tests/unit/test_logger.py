@@ -0,0 +1,147 @@
+import unittest
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.utils.logger import TelemetryLogger
+
+
+class CountingData(dict):
+    def __init__(self):
+        super().__init__(value=1)
+        self.serialized = 0
+    
+    def to_dict(self):
+        self.serialized += 1
+        return dict(self)
+
+
+class TestTelemetryLogger(unittest.TestCase):
+    def setUp(self):
+        # Le logger 'rocket_telemetry' est global : ses handlers sont mis de côté pendant le test
+        self.logging_logger = logging.getLogger('rocket_telemetry')
+        self.saved_handlers = self.logging_logger.handlers[:]
+        self.logging_logger.handlers.clear()
+        self.temp_dir = tempfile.mkdtemp()
+        self.logger = None
+    
+    def tearDown(self):
+        if self.logger is not None:
+            self.logger.close()
+        for handler in self.logging_logger.handlers:
+            handler.close()
+        self.logging_logger.handlers[:] = self.saved_handlers
+        self.logging_logger.setLevel(logging.DEBUG)
+        self.logging_logger.propagate = True
+        shutil.rmtree(self.temp_dir)
+    
+    def read_log(self) -> str:
+        with open(os.path.join(self.temp_dir, "telemetry.log"), encoding='utf-8') as f:
+            return f.read()
+    
+    def test_async_writes_in_batches(self):
+        self.logger = TelemetryLogger(self.temp_dir)
+        self.logging_logger.setLevel(logging.DEBUG)
+        
+        for i in range(500):
+            self.logger.debug("event", {"index": i})
+        self.logger.error("failure")
+        self.logger.flush()
+        
+        content = self.read_log()
+        self.assertIn('event | Data: {"index": 499}', content)
+        self.assertIn("failure", content)
+        stats = self.logger.get_stats()
+        self.assertEqual(stats['written'], 501)
+        self.assertLess(stats['batches'], 501)
+        with open(os.path.join(self.temp_dir, "errors.log"), encoding='utf-8') as f:
+            self.assertIn("failure", f.read())
+    
+    def test_formatting_happens_on_writer_thread(self):
+        self.logger = TelemetryLogger(self.temp_dir)
+        threads = []
+        
+        class Reading:
+            def to_dict(self):
+                threads.append(threading.current_thread().name)
+                return {"altitude": 1.0}
+        
+        self.logger.log_telemetry_reading(Reading())
+        self.logger.flush()
+        
+        self.assertEqual(threads, ["log-writer"])
+        self.assertIn('"altitude": 1.0', self.read_log())
+    
+    def test_filtered_level_is_not_formatted(self):
+        self.logger = TelemetryLogger(self.temp_dir)
+        self.logging_logger.setLevel(logging.INFO)
+        data = CountingData()
+        
+        self.logger.log_telemetry_reading(data)
+        self.logger.flush()
+        
+        self.assertEqual(data.serialized, 0)
+        self.assertEqual(self.logger.get_stats()['telemetry_logged'], 0)
+    
+    def test_telemetry_logs_every_reading_by_default(self):
+        self.logger = TelemetryLogger(self.temp_dir)
+        for i in range(100):
+            self.logger.log_telemetry_reading({"index": i})
+        self.assertEqual(self.logger.telemetry_logged, 100)
+        self.assertEqual(self.logger.telemetry_suppressed, 0)
+    
+    def test_telemetry_sampling(self):
+        self.logger = TelemetryLogger(self.temp_dir, telemetry_sample_every=10)
+        for i in range(100):
+            self.logger.log_telemetry_reading({"index": i})
+        self.assertEqual(self.logger.telemetry_logged, 10)
+        self.assertEqual(self.logger.telemetry_suppressed, 90)
+        
+        # Limite de débit : une seule lecture sur une rafale instantanée
+        self.logger.set_telemetry_sampling(every=1, max_rate=1.0)
+        for i in range(100):
+            self.logger.log_telemetry_reading({"index": i})
+        self.assertEqual(self.logger.telemetry_logged, 1)
+    
+    def test_full_queue_drops_instead_of_blocking(self):
+        self.logger = TelemetryLogger(self.temp_dir, queue_size=5)
+        # Thread d'écriture arrêté : la file se remplit
+        self.logger._writer.stop()
+        
+        for i in range(20):
+            self.logger.info("event", {"index": i})
+        self.assertEqual(self.logger.get_stats()['dropped'], 20 - 5)
+    
+    def test_logging_after_close_is_written(self):
+        self.logger = TelemetryLogger(self.temp_dir)
+        self.logger.info("before close")
+        self.logger.close()
+        self.logger.info("after close")
+        self.logger.error("error after close")
+        
+        content = self.read_log()
+        self.assertIn("before close", content)
+        self.assertIn("after close", content)
+        self.assertIn("error after close", content)
+        with open(os.path.join(self.temp_dir, "errors.log"), encoding='utf-8') as f:
+            self.assertIn("error after close", f.read())
+        self.assertFalse(self.logger.get_stats()['asynchronous'])
+        self.assertEqual(len(self.logging_logger.handlers), 3)
+        
+        # close() est idempotent
+        self.logger.close()
+        self.assertEqual(len(self.logging_logger.handlers), 3)
+    
+    def test_synchronous_mode(self):
+        self.logger = TelemetryLogger(self.temp_dir, asynchronous=False)
+        self.logger.debug("direct")
+        self.assertIn("direct", self.read_log())
+        self.assertFalse(self.logger.get_stats()['asynchronous'])
+
+
+if __name__ == '__main__':
+    unittest.main()
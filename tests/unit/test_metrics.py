@@ -0,0 +1,154 @@
+import unittest
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.data.data_processor import TelemetryProcessor
+from src.data.data_storage import DataStorage
+from src.headless import record
+from src.sensors.mock_sensor import MockRocketSensor
+from src.utils.metrics import (JsonSnapshotWriter, MetricsHttpServer, MetricsRegistry,
+                               get_registry, weak_callback)
+
+
+class Source:
+    def __init__(self):
+        self.value = 7
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_counter_shards_sum_across_threads(self):
+        registry = MetricsRegistry()
+        counter = registry.counter('events_total', "Événements")
+        
+        def work():
+            for _ in range(10000):
+                counter.inc()
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(5)
+        
+        self.assertEqual(counter.value, 40005)
+        self.assertIs(registry.counter('events_total'), counter)
+        with self.assertRaises(ValueError):
+            registry.gauge('events_total')
+    
+    def test_prometheus_text(self):
+        registry = MetricsRegistry()
+        registry.counter('reads_total', "Lectures", {'sensor': 'imu "A"'}).inc(3)
+        registry.gauge('depth', "Profondeur").set(2.5)
+        histogram = registry.histogram('flush_seconds', "Vidages")
+        for value_ns in (2_000, 5_000_000, 40_000_000):
+            histogram.observe_ns(value_ns)
+        
+        text = registry.to_prometheus()
+        self.assertIn('# TYPE reads_total counter', text)
+        self.assertIn('reads_total{sensor="imu \\"A\\""} 3', text)
+        self.assertIn('depth 2.5', text)
+        self.assertIn('# TYPE flush_seconds histogram', text)
+        self.assertIn('flush_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn('flush_seconds_count 3', text)
+        
+        # Buckets cumulatifs croissants
+        buckets = [int(line.rsplit(' ', 1)[1]) for line in text.splitlines()
+                   if line.startswith('flush_seconds_bucket')]
+        self.assertEqual(buckets, sorted(buckets))
+        self.assertEqual(buckets[-1], 3)
+    
+    def test_callback_metric_follows_owner_lifetime(self):
+        registry = MetricsRegistry()
+        source = Source()
+        registry.register_callback('value', "Valeur", 'gauge', weak_callback(source, lambda s: s.value))
+        self.assertIn('value 7', registry.to_prometheus())
+        
+        del source
+        gc.collect()
+        self.assertNotIn('value', registry.snapshot()['metrics'])
+    
+    def test_http_and_json_exporters(self):
+        registry = MetricsRegistry()
+        registry.counter('reads_total', "Lectures").inc(4)
+        temp_dir = tempfile.mkdtemp()
+        server = MetricsHttpServer(registry, port=0)
+        server.start()
+        try:
+            host, port = server.address
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=2) as response:
+                self.assertIn('text/plain', response.headers['Content-Type'])
+                self.assertIn('reads_total 4', response.read().decode())
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics.json", timeout=2) as response:
+                snapshot = json.loads(response.read())
+            self.assertEqual(snapshot['metrics']['reads_total'][0]['value'], 4)
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://{host}:{port}/other", timeout=2)
+            
+            path = os.path.join(temp_dir, "metrics.json")
+            writer = JsonSnapshotWriter(path, registry, interval_s=0.05)
+            writer.start()
+            writer.stop()
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f)['metrics']['reads_total'][0]['value'], 4)
+        finally:
+            server.stop()
+            shutil.rmtree(temp_dir)
+
+
+class TestPublishers(unittest.TestCase):
+    def test_pipeline_publishes_into_global_registry(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            sensor = MockRocketSensor(name="metrics-test", sample_rate=200.0)
+            record(sensor, DataStorage(temp_dir), duration=0.3)
+        finally:
+            shutil.rmtree(temp_dir)
+        
+        metrics = get_registry().snapshot()['metrics']
+        reads = [sample for sample in metrics['telemetry_sensor_reads_total']
+                 if sample['labels'] == {'sensor': 'metrics-test'}]
+        self.assertGreater(reads[0]['value'], 0)
+        self.assertGreater(metrics['telemetry_storage_bytes_written_total'][0]['value'], 0)
+        self.assertGreater(metrics['telemetry_storage_flush_seconds'][0]['value']['count'], 0)
+    
+    def test_sensor_without_reading_keeps_snapshot_valid_json(self):
+        sensor = MockRocketSensor(name="metrics-idle")
+        registry = get_registry()
+        
+        # Aucune lecture : l'âge est omis (NaN rendrait le JSON invalide) mais la jauge reste enregistrée
+        json.loads(json.dumps(registry.snapshot(), allow_nan=False))
+        self.assertNotIn('telemetry_sensor_last_reading_age_seconds{sensor="metrics-idle"}', registry.to_prometheus())
+        
+        sensor.connect()
+        sensor.read_data()
+        ages = [sample for sample in registry.snapshot()['metrics']['telemetry_sensor_last_reading_age_seconds']
+                if sample['labels'] == {'sensor': 'metrics-idle'}]
+        self.assertEqual(len(ages), 1)
+        self.assertGreaterEqual(ages[0]['value'], 0.0)
+    
+    def test_processor_metrics_live_with_processor(self):
+        processor = TelemetryProcessor(name="metrics-test")
+        processor._rejected_count = 3
+        labels = {'processor': 'metrics-test'}
+        
+        metrics = get_registry().snapshot()['metrics']
+        self.assertIn({'labels': labels, 'value': 3}, metrics['telemetry_processor_rejected_total'])
+        self.assertIn({'labels': labels, 'value': 0}, metrics['telemetry_processor_queue_depth'])
+        
+        # Le registre ne garde pas le processeur en vie
+        del processor
+        gc.collect()
+        metrics = get_registry().snapshot()['metrics']
+        self.assertNotIn(labels, [sample['labels'] for sample in metrics.get('telemetry_processor_rejected_total', [])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.core.packet_protocol import PacketDecoder, encode_frame, FRAME_SIZE, SYNC
+
+from helpers import make_reading
+
+
+class TestPacketProtocol(unittest.TestCase):
+    def setUp(self):
+        self.readings = [make_reading(i) for i in range(20)]
+        self.stream = b''.join(encode_frame(r, vehicle_id=7, seq=i) for i, r in enumerate(self.readings))
+    
+    def test_round_trip_multiple_frames_per_call(self):
+        decoder = PacketDecoder()
+        packets = decoder.feed(self.stream)
+        
+        self.assertEqual([p.reading for p in packets], self.readings)
+        self.assertEqual({p.vehicle_id for p in packets}, {7})
+        self.assertEqual([p.seq for p in packets], list(range(20)))
+        self.assertEqual(decoder.pending_bytes, 0)
+        self.assertIsNone(packets[0].reading.lat)
+        self.assertEqual(packets[1].reading.lat, 45.5017)
+    
+    def test_arbitrary_chunking(self):
+        decoder = PacketDecoder()
+        packets = []
+        for size in (1, 3, 7, FRAME_SIZE - 1, FRAME_SIZE + 5):
+            decoder = PacketDecoder()
+            packets = []
+            for start in range(0, len(self.stream), size):
+                packets.extend(decoder.feed(self.stream[start:start + size]))
+            self.assertEqual(len(packets), 20, size)
+            self.assertEqual(decoder.bytes_skipped, 0)
+    
+    def test_resync_after_corruption_and_garbage(self):
+        corrupted = bytearray(self.stream)
+        corrupted[FRAME_SIZE * 3 + 20] ^= 0xFF  # payload de la trame 3
+        corrupted[FRAME_SIZE * 8 + 2] = 0x01  # longueur de la trame 8
+        data = b'\x00\xa5garbage' + SYNC + bytes(corrupted)
+        
+        decoder = PacketDecoder()
+        packets = decoder.feed(data)
+        
+        self.assertEqual([p.seq for p in packets], [i for i in range(20) if i not in (3, 8)])
+        self.assertEqual(decoder.crc_errors, 1)
+        self.assertGreaterEqual(decoder.length_errors, 1)
+        self.assertEqual(decoder.lost, 2)
+    
+    def test_sequence_gaps_counted_per_vehicle_with_wraparound(self):
+        decoder = PacketDecoder()
+        reading = make_reading(0)
+        frames = [encode_frame(reading, 1, 65534), encode_frame(reading, 2, 10),
+                  encode_frame(reading, 1, 1), encode_frame(reading, 2, 11)]
+        decoder.feed(b''.join(frames))
+        self.assertEqual(decoder.lost, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
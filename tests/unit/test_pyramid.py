@@ -0,0 +1,102 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from src.core.telemetry_frame import TelemetryFrame, TELEMETRY_DTYPE
+from src.data.data_storage import DataStorage
+from src.data.pyramid import DownsamplePyramid, PYRAMID_SUFFIX
+
+
+def make_frame(count: int) -> TelemetryFrame:
+    data = np.zeros(count, dtype=TELEMETRY_DTYPE)
+    data['timestamp_ns'] = 1_700_000_000_000_000_000 + np.arange(count, dtype=np.int64) * 1_000_000
+    data['altitude'] = np.random.default_rng(7).normal(size=count).cumsum()
+    data['lat'] = np.where(np.arange(count) % 3, 45.5, np.nan)
+    for name in ('velocity', 'acc_x', 'acc_y', 'acc_z', 'temperature', 'pressure',
+                 'roll', 'pitch', 'yaw', 'lon', 'battery_voltage'):
+        data[name] = 1.0
+    return TelemetryFrame.from_array(data)
+
+
+class TestDownsamplePyramid(unittest.TestCase):
+    def setUp(self):
+        self.frame = make_frame(10_000)
+        self.pyramid = DownsamplePyramid.build(self.frame.data, base_level=2)
+    
+    def test_levels_match_brute_force(self):
+        altitude = self.frame['altitude']
+        for index, level in enumerate(self.pyramid.levels):
+            size = self.pyramid.bucket_size(index)
+            for bucket in (0, len(level['start_ns']) - 1):
+                chunk = altitude[bucket * size:(bucket + 1) * size]
+                self.assertAlmostEqual(level['altitude.min'][bucket], chunk.min())
+                self.assertAlmostEqual(level['altitude.max'][bucket], chunk.max())
+                self.assertAlmostEqual(level['altitude.mean'][bucket], chunk.mean())
+        self.assertEqual(len(self.pyramid.levels[-1]['start_ns']), 1)
+    
+    def test_nan_ignored_in_summaries(self):
+        level = self.pyramid.levels[0]
+        self.assertFalse(np.isnan(level['lat.mean']).any())
+        self.assertEqual(level['lat.max'].max(), 45.5)
+    
+    def test_query_respects_budget_at_every_zoom(self):
+        timestamps = self.frame['timestamp_ns']
+        start = int(timestamps[0])
+        for span in (10_000, 2_000, 300, 50):
+            end = int(timestamps[span - 1])
+            result = self.pyramid.query('altitude', start, end, max_points=100)
+            self.assertLessEqual(len(result.min), 100)
+            self.assertLessEqual(result.start_ns[0], start)
+            self.assertGreaterEqual(result.end_ns[-1], end)
+            np.testing.assert_allclose(result.max.max(), self.frame['altitude'][:span].max())
+        
+        # Zoom fin : échantillons bruts
+        result = self.pyramid.query('altitude', start, int(timestamps[49]), max_points=100)
+        self.assertEqual(result.bucket_size, 1)
+        np.testing.assert_array_equal(result.mean, self.frame['altitude'][:50])
+
+
+class TestPyramidCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.storage = DataStorage(self.tmp_dir)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_binary_flight_cached_next_to_file(self):
+        frame = make_frame(5000)
+        self.storage.save_to_binary(frame, "flight.rtlog")
+        pyramid = self.storage.load_flight_pyramid("flight.rtlog")
+        cache_path = os.path.join(self.tmp_dir, "flight.rtlog" + PYRAMID_SUFFIX)
+        self.assertTrue(os.path.exists(cache_path))
+        
+        cached = self.storage.load_flight_pyramid("flight.rtlog")
+        self.assertEqual(len(cached.levels), len(pyramid.levels))
+        np.testing.assert_array_equal(cached.levels[1]['altitude.max'], pyramid.levels[1]['altitude.max'])
+        self.assertIsNotNone(cached.source)
+    
+    def test_stale_cache_rebuilt(self):
+        self.storage.save_to_binary(make_frame(100), "flight.rtlog")
+        self.assertEqual(self.storage.load_flight_pyramid("flight.rtlog").source_count, 100)
+        
+        self.storage.save_to_binary(make_frame(300), "flight.rtlog")
+        self.assertEqual(self.storage.load_flight_pyramid("flight.rtlog").source_count, 300)
+    
+    def test_json_flight_includes_raw_level(self):
+        frame = make_frame(200)
+        self.storage.save_to_json(frame, "flight.json")
+        pyramid = self.storage.load_flight_pyramid("flight.json")
+        self.assertEqual(pyramid.bucket_size(0), 1)
+        
+        result = pyramid.query('altitude', int(frame['timestamp_ns'][0]), int(frame['timestamp_ns'][-1]), 500)
+        np.testing.assert_allclose(result.mean, frame['altitude'])
+
+
+if __name__ == '__main__':
+    unittest.main()
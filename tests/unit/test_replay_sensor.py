@@ -0,0 +1,122 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.data.data_storage import DataStorage
+from src.sensors.acquisition_engine import AcquisitionEngine
+from src.sensors.replay_sensor import ReplaySensor, BLOCK_SIZE, MAX_POLL_RATE
+
+from helpers import make_reading
+
+
+def drain(sensor: ReplaySensor):
+    readings = []
+    while True:
+        reading = sensor.read_data()
+        if reading is None:
+            break
+        readings.append(reading)
+    return readings
+
+
+class TestReplaySensor(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.storage = DataStorage(self.tmp_dir)
+        self.readings = [make_reading(i) for i in range(BLOCK_SIZE + 37)]
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_replays_every_format_at_max_speed(self):
+        paths = [
+            self.storage.save_to_json(self.readings, "flight.json"),
+            self.storage.save_to_csv(self.readings, "flight.csv"),
+            self.storage.save_to_binary(self.readings, "flight.rtlog"),
+        ]
+        for path in paths:
+            sensor = ReplaySensor(path, speed=None, rebase_timestamps=False)
+            self.assertTrue(sensor.connect())
+            replayed = drain(sensor)
+            
+            self.assertTrue(sensor.is_finished, path)
+            self.assertEqual(replayed, self.readings, path)
+            self.assertIsNone(replayed[0].lat)
+            sensor.disconnect()
+    
+    def test_original_timing_with_speed_multiplier(self):
+        # 10 échantillons à 10 ms d'intervalle, rejoués 2x plus vite : ~45 ms
+        path = self.storage.save_to_binary(self.readings[:10], "flight.rtlog")
+        sensor = ReplaySensor(path, speed=2.0)
+        sensor.connect()
+        
+        start = time.monotonic()
+        replayed = drain(sensor)
+        elapsed = time.monotonic() - start
+        
+        self.assertEqual(len(replayed), 10)
+        self.assertGreaterEqual(elapsed, 0.04)
+        self.assertLess(elapsed, 0.5)
+        # Horodatages recalés sur l'heure courante, espacement divisé par la vitesse
+        self.assertEqual(replayed[1].timestamp_ns - replayed[0].timestamp_ns, 5_000_000)
+        self.assertLess(abs(replayed[0].timestamp_ns - time.time_ns()), 5_000_000_000)
+    
+    def test_non_blocking_returns_none_until_due(self):
+        path = self.storage.save_to_json(self.readings[:2], "flight.json")
+        sensor = ReplaySensor(path, speed=0.1, blocking=False)
+        sensor.connect()
+        
+        self.assertIsNotNone(sensor.read_data())
+        self.assertIsNone(sensor.read_data())
+        self.assertFalse(sensor.is_finished)
+    
+    def _run_engine(self, sensor: ReplaySensor, timeout: float) -> list:
+        received = []
+        engine = AcquisitionEngine(sensor, received.append)
+        sensor.connect()
+        engine.start()
+        deadline = time.monotonic() + timeout
+        while not sensor.is_finished and time.monotonic() < deadline:
+            time.sleep(0.01)
+        engine.stop()
+        sensor.disconnect()
+        return received
+    
+    def test_engine_replays_at_max_speed(self):
+        # Vol à 100 Hz de 20 s : sous l'AcquisitionEngine, tout est livré par blocs
+        readings = [make_reading(i) for i in range(2000)]
+        path = self.storage.save_to_binary(readings, "fast.rtlog")
+        sensor = ReplaySensor(path, speed=None, rebase_timestamps=False)
+        self.assertAlmostEqual(sensor.source_rate, 100.0)
+        self.assertEqual(sensor.sample_rate, MAX_POLL_RATE)
+        
+        received = self._run_engine(sensor, timeout=3.0)
+        self.assertTrue(sensor.is_finished)
+        self.assertEqual(received, readings)
+    
+    def test_engine_follows_original_timing(self):
+        # 0,6 s de vol à 100 Hz rejoué 2x plus vite : ~0,3 s, aucun échantillon perdu
+        path = self.storage.save_to_binary(self.readings[:61], "timed.rtlog")
+        sensor = ReplaySensor(path, speed=2.0)
+        self.assertAlmostEqual(sensor.sample_rate, 200.0)
+        
+        start = time.monotonic()
+        received = self._run_engine(sensor, timeout=3.0)
+        elapsed = time.monotonic() - start
+        
+        self.assertEqual([r.altitude for r in received], [r.altitude for r in self.readings[:61]])
+        self.assertGreaterEqual(elapsed, 0.29)
+        self.assertLess(elapsed, 1.5)
+    
+    def test_missing_file_and_unknown_format(self):
+        self.assertFalse(ReplaySensor(os.path.join(self.tmp_dir, "absent.json")).connect())
+        with self.assertRaises(ValueError):
+            ReplaySensor("flight.txt")
+
+
+if __name__ == '__main__':
+    unittest.main()
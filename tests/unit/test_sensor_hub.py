@@ -0,0 +1,78 @@
+import unittest
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.sensors.acquisition_engine import AcquisitionEngine
+from src.sensors.mock_sensor import MockRocketSensor
+from src.sensors.sensor_hub import SensorHub
+
+
+class DelayedSensor(MockRocketSensor):
+    # Horodatage pris à l'échantillonnage, mais lecture livrée avec du retard
+    def __init__(self, delay: float, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+    
+    def read_data(self):
+        reading = super().read_data()
+        time.sleep(self.delay)
+        return reading
+
+
+class TestSensorHub(unittest.TestCase):
+    def collect(self, hub: SensorHub, duration: float):
+        self.assertTrue(hub.connect())
+        merged = []
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            merged.extend(hub.read_batch())
+            time.sleep(0.005)
+        hub.disconnect()
+        merged.extend(hub.read_batch())
+        return merged
+    
+    def test_merges_sources_in_timestamp_order(self):
+        hub = SensorHub([MockRocketSensor("imu", 200.0), MockRocketSensor("baro", 50.0),
+                         MockRocketSensor("gps", 5.0)], reorder_window_ms=50)
+        self.assertEqual(hub.sample_rate, 200.0)
+        merged = self.collect(hub, 0.4)
+        
+        timestamps = [reading.timestamp_ns for reading in merged]
+        self.assertEqual(timestamps, sorted(timestamps))
+        stats = {entry['sensor']: entry for entry in hub.get_source_stats()}
+        self.assertGreater(stats['imu']['released'], stats['baro']['released'])
+        self.assertGreater(stats['gps']['released'], 0)
+        self.assertEqual(sum(entry['released'] for entry in stats.values()), len(merged))
+        self.assertEqual(sum(entry['late'] for entry in stats.values()), 0)
+    
+    def test_slow_source_does_not_stall_others(self):
+        # Une source qui livre avec 300 ms de retard ne bloque la fusion que pendant la fenêtre
+        hub = SensorHub([MockRocketSensor("fast", 100.0), DelayedSensor(0.3, name="slow", sample_rate=2.0)],
+                        reorder_window_ms=30)
+        released = self.collect(hub, 0.3)
+        
+        stats = {entry['sensor']: entry for entry in hub.get_source_stats()}
+        self.assertGreater(stats['fast']['released'], 15)
+        # Retard borné par la fenêtre de réordonnancement, pas par la source lente
+        self.assertLess(stats['fast']['lag_max_ms'], 100)
+        self.assertEqual(len(released), sum(entry['released'] for entry in stats.values()))
+    
+    def test_feeds_acquisition_engine_as_one_sensor(self):
+        hub = SensorHub([MockRocketSensor("a", 100.0), MockRocketSensor("b", 100.0)], reorder_window_ms=20)
+        hub.connect()
+        received = []
+        engine = AcquisitionEngine(hub, received.append)
+        engine.start()
+        time.sleep(0.3)
+        engine.stop()
+        hub.disconnect()
+        
+        self.assertGreater(len(received), 30)
+        timestamps = [reading.timestamp_ns for reading in received]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+
+if __name__ == '__main__':
+    unittest.main()
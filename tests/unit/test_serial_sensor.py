@@ -0,0 +1,71 @@
+import unittest
+import io
+import os
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.core.packet_protocol import encode_frame
+from src.sensors.serial_sensor import SerialPacketSensor
+
+from helpers import make_reading
+
+
+class TestSerialPacketSensor(unittest.TestCase):
+    def test_reads_from_in_memory_stream(self):
+        frames = b''.join(encode_frame(make_reading(i), vehicle_id=i % 2, seq=i // 2) for i in range(10))
+        sensor = SerialPacketSensor(stream=io.BytesIO(frames), read_size=64)
+        self.assertTrue(sensor.connect())
+        
+        readings = []
+        for _ in range(20):
+            readings.extend(sensor.read_batch())
+        self.assertEqual(readings, [make_reading(i) for i in range(10)])
+        self.assertEqual(sensor.last_reading, make_reading(9))
+    
+    def test_vehicle_filter_and_single_reads(self):
+        frames = b''.join(encode_frame(make_reading(i), vehicle_id=i % 2, seq=i // 2) for i in range(10))
+        sensor = SerialPacketSensor(stream=io.BytesIO(frames), vehicle_id=1)
+        sensor.connect()
+        
+        readings = []
+        while True:
+            reading = sensor.read_data()
+            if reading is None:
+                break
+            readings.append(reading)
+        self.assertEqual([r.altitude for r in readings], [1.0, 3.0, 5.0, 7.0, 9.0])
+    
+    def test_missing_port_reports_failure(self):
+        sensor = SerialPacketSensor(port="/dev/does-not-exist")
+        self.assertFalse(sensor.connect())
+        self.assertFalse(sensor.is_connected)
+    
+    @unittest.skipUnless(hasattr(os, 'openpty'), "pty requis")
+    def test_reads_through_pty(self):
+        try:
+            import serial  # noqa: F401
+        except ImportError:
+            self.skipTest("pyserial non installé")
+        
+        master, slave = os.openpty()
+        sensor = SerialPacketSensor(port=os.ttyname(slave))
+        try:
+            self.assertTrue(sensor.connect())
+            os.write(master, b''.join(encode_frame(make_reading(i), seq=i) for i in range(50)))
+            
+            readings = []
+            deadline = time.monotonic() + 2.0
+            while len(readings) < 50 and time.monotonic() < deadline:
+                readings.extend(sensor.read_batch())
+                time.sleep(0.01)
+            self.assertEqual(len(readings), 50)
+            self.assertEqual(sensor.decoder.lost, 0)
+        finally:
+            sensor.disconnect()
+            os.close(master)
+            os.close(slave)
+
+
+if __name__ == '__main__':
+    unittest.main()
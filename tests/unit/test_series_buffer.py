@@ -0,0 +1,92 @@
+import unittest
+import numpy as np
+import os
+import random
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.gui.widgets.series_buffer import SeriesBuffer, minmax_decimate
+
+
+class TestSeriesBuffer(unittest.TestCase):
+    def test_keeps_last_points_as_contiguous_views(self):
+        buffer = SeriesBuffer(max_points=5)
+        for i in range(13):
+            buffer.append(float(i), float(i * 10))
+        
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(buffer.times.tolist(), [8.0, 9.0, 10.0, 11.0, 12.0])
+        self.assertEqual(buffer.values.tolist(), [80.0, 90.0, 100.0, 110.0, 120.0])
+        self.assertIsNotNone(buffer.times.base)
+    
+    def test_sliding_min_max_matches_brute_force(self):
+        random.seed(1)
+        buffer = SeriesBuffer(max_points=50)
+        values = []
+        for i in range(1000):
+            value = random.uniform(-100, 100)
+            values.append(value)
+            buffer.append(float(i), value)
+            
+            window = values[-50:]
+            self.assertEqual(buffer.value_bounds(), (min(window), max(window)))
+            self.assertEqual(buffer.time_bounds(), (float(max(0, i - 49)), float(i)))
+    
+    def test_nan_values_ignored_for_bounds(self):
+        buffer = SeriesBuffer(max_points=3)
+        buffer.extend([0.0, 1.0, 2.0], [float('nan'), 5.0, -1.0])
+        self.assertEqual(buffer.value_bounds(), (-1.0, 5.0))
+        
+        buffer.clear()
+        self.assertIsNone(buffer.value_bounds())
+        self.assertIsNone(buffer.time_bounds())
+    
+    def test_unbounded_buffer_keeps_full_history(self):
+        buffer = SeriesBuffer(initial_capacity=4)
+        buffer.extend(np.arange(10.0), np.arange(10.0) * 2)
+        for i in range(10, 20):
+            buffer.append(float(i), float(i * 2))
+        
+        self.assertEqual(len(buffer), 20)
+        self.assertEqual(buffer.values.tolist(), [float(i * 2) for i in range(20)])
+        self.assertEqual(buffer.value_bounds(), (0.0, 38.0))
+        self.assertEqual(buffer.time_bounds(), (0.0, 19.0))
+
+
+class TestMinMaxDecimate(unittest.TestCase):
+    def test_small_series_returned_unchanged(self):
+        times = np.arange(10.0)
+        values = np.sin(times)
+        out_times, out_values = minmax_decimate(times, values, 20)
+        self.assertIs(out_times, times)
+        self.assertIs(out_values, values)
+    
+    def test_preserves_extremes_and_order(self):
+        times = np.arange(100000.0)
+        values = np.random.default_rng(3).normal(size=100000)
+        values[31337] = 50.0
+        values[77777] = -50.0
+        
+        out_times, out_values = minmax_decimate(times, values, 1000)
+        self.assertLessEqual(len(out_times), 1002)
+        self.assertIn(50.0, out_values)
+        self.assertIn(-50.0, out_values)
+        self.assertTrue(np.all(np.diff(out_times) >= 0))
+        # Les points retenus sont de vrais échantillons
+        np.testing.assert_array_equal(values[out_times.astype(int)], out_values)
+    
+    def test_nan_never_selected_over_values(self):
+        values = np.array([np.nan, 1.0, np.nan, 3.0] * 100)
+        out_times, out_values = minmax_decimate(np.arange(400.0), values, 10)
+        self.assertFalse(np.isnan(out_values).any())
+    
+    def test_visible_restricts_to_view(self):
+        buffer = SeriesBuffer()
+        buffer.extend(np.arange(1000.0), np.arange(1000.0))
+        times, values = buffer.visible(100.0, 200.0, 1000)
+        self.assertEqual(times[0], 99.0)
+        self.assertEqual(times[-1], 201.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.data.spsc_ring import OverflowPolicy, SpscRing
+
+
+class TestSpscRing(unittest.TestCase):
+    def test_capacity_rounded_to_power_of_two(self):
+        self.assertEqual(SpscRing(100).capacity, 128)
+    
+    def test_fifo_order_across_wrap(self):
+        ring = SpscRing(8)
+        for i in range(6):
+            ring.push(i)
+        self.assertEqual(ring.pop_batch(4), [0, 1, 2, 3])
+        for i in range(6, 12):
+            ring.push(i)
+        self.assertEqual(ring.pop_batch(100), list(range(4, 12)))
+        self.assertEqual(len(ring), 0)
+    
+    def test_drop_newest(self):
+        ring = SpscRing(4, OverflowPolicy.DROP_NEWEST)
+        results = [ring.push(i) for i in range(6)]
+        
+        self.assertEqual(results, [True] * 4 + [False] * 2)
+        self.assertEqual(ring.pop_batch(10), [0, 1, 2, 3])
+        self.assertEqual(ring.get_stats()['dropped_newest'], 2)
+    
+    def test_drop_oldest(self):
+        ring = SpscRing(4, OverflowPolicy.DROP_OLDEST)
+        for i in range(7):
+            self.assertTrue(ring.push(i))
+        
+        # Les écrasements sont comptés dès l'écriture, avant tout dépilement
+        self.assertEqual(ring.get_stats()['dropped_oldest'], 3)
+        self.assertEqual(ring.pop_batch(10), [3, 4, 5, 6])
+        self.assertEqual(ring.get_stats()['dropped_oldest'], 3)
+        
+        for i in range(7, 13):
+            ring.push(i)
+        stats = ring.get_stats()
+        self.assertEqual(stats['dropped_oldest'], 5)
+        self.assertEqual(stats['pushed'], stats['popped'] + stats['dropped_oldest'] + stats['depth'])
+    
+    def test_block_times_out_without_consumer(self):
+        ring = SpscRing(2, OverflowPolicy.BLOCK, block_timeout=0.01)
+        ring.push(0)
+        ring.push(1)
+        
+        self.assertFalse(ring.push(2))
+        self.assertEqual(ring.get_stats()['block_timeouts'], 1)
+    
+    def test_wait_returns_when_data_arrives(self):
+        ring = SpscRing(8)
+        self.assertFalse(ring.wait(0.01))
+        
+        timer = threading.Timer(0.01, ring.push, args=(42,))
+        timer.start()
+        self.assertTrue(ring.wait(2.0))
+        timer.join()
+        
+        items, times = ring.pop_batch_with_times(8)
+        self.assertEqual(items, [42])
+        self.assertEqual(len(times), 1)
+    
+    def test_threaded_producer_consumer(self):
+        ring = SpscRing(64, OverflowPolicy.BLOCK)
+        count = 20000
+        received = []
+        
+        def consume():
+            while len(received) < count:
+                batch = ring.pop_batch(32)
+                if batch:
+                    received.extend(batch)
+                else:
+                    ring.wait(0.01)
+        
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(count):
+            self.assertTrue(ring.push(i))
+        consumer.join(timeout=10)
+        
+        self.assertEqual(received, list(range(count)))
+    
+    def test_threaded_drop_oldest_keeps_fifo_order(self):
+        # Producteur bien plus rapide que le consommateur : écrasements permanents
+        ring = SpscRing(4, OverflowPolicy.DROP_OLDEST)
+        count = 300000
+        received = []
+        done = threading.Event()
+        
+        def consume():
+            while not done.is_set() or len(ring):
+                batch = ring.pop_batch(4)
+                received.extend(batch)
+                if not batch:
+                    time.sleep(0)
+        
+        previous_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            consumer = threading.Thread(target=consume)
+            consumer.start()
+            for i in range(count):
+                ring.push(i)
+            done.set()
+            consumer.join(timeout=30)
+        finally:
+            sys.setswitchinterval(previous_interval)
+        
+        self.assertTrue(all(a < b for a, b in zip(received, received[1:])))
+        stats = ring.get_stats()
+        self.assertEqual(stats['pushed'], count)
+        self.assertEqual(stats['popped'], len(received))
+        self.assertEqual(stats['popped'] + stats['dropped_oldest'] + stats['depth'], count)
+        self.assertEqual(received[-1], count - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.data.data_processor import TelemetryProcessor
+from src.data.data_storage import DataStorage
+from src.data.flight_log import FlightLogReader
+from src.data.spsc_ring import OverflowPolicy
+from src.data.stream_writer import FlushPolicy, StreamingWriter
+
+from helpers import make_reading
+
+
+class TestStreamingWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "flight.rtlog")
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_flush_every_n_samples(self):
+        writer = StreamingWriter(self.path, FlushPolicy(max_samples=10, max_interval_ms=60000))
+        for i in range(25):
+            writer.write(make_reading(i))
+        
+        self.assertEqual(writer.samples_written, 20)
+        self.assertEqual(writer.pending_count, 5)
+        self.assertEqual(len(FlightLogReader(writer.part_path)), 20)
+    
+    def test_flush_after_interval(self):
+        writer = StreamingWriter(self.path, FlushPolicy(max_samples=1000, max_interval_ms=20))
+        writer.write(make_reading(0))
+        writer.poll()
+        self.assertEqual(writer.samples_written, 0)
+        
+        time.sleep(0.05)
+        writer.poll()
+        self.assertEqual(writer.samples_written, 1)
+    
+    def test_finalize_renames_part_file(self):
+        writer = StreamingWriter(self.path, FlushPolicy(max_samples=100))
+        for i in range(5):
+            writer.write(make_reading(i))
+        
+        self.assertTrue(os.path.exists(writer.part_path))
+        final_path = writer.finalize()
+        
+        self.assertFalse(os.path.exists(writer.part_path))
+        self.assertEqual(final_path, self.path)
+        self.assertEqual(len(FlightLogReader(final_path)), 5)
+        
+        # Les écritures après finalisation sont ignorées
+        writer.write(make_reading(6))
+        self.assertEqual(len(FlightLogReader(final_path)), 5)
+    
+    def test_processor_streams_to_disk(self):
+        storage = DataStorage(self.tmp_dir)
+        processor = TelemetryProcessor(buffer_size=10)
+        writer = storage.create_stream_writer("session.rtlog", FlushPolicy(max_samples=8))
+        processor.attach_writer(writer)
+        processor.start_processing()
+        
+        for i in range(50):
+            processor.add_reading(make_reading(i))
+        time.sleep(0.2)
+        processor.stop_processing()
+        
+        # Le tampon mémoire reste borné alors que tout est sur disque
+        self.assertEqual(len(processor.get_all_data()), 10)
+        final_path = writer.finalize()
+        self.assertEqual(len(FlightLogReader(final_path)), 50)
+        
+        # Une nouvelle session ne doit pas écraser la précédente
+        second = storage.create_stream_writer("session.rtlog")
+        self.assertNotEqual(str(second.final_path), final_path)
+        second.finalize()
+    
+    def test_rotation_during_ingest_loses_nothing(self):
+        storage = DataStorage(self.tmp_dir)
+        processor = TelemetryProcessor(buffer_size=10, batch_size=16, overflow_policy=OverflowPolicy.BLOCK)
+        writer = storage.create_stream_writer("rotation.rtlog", FlushPolicy(max_samples=32))
+        processor.attach_writer(writer)
+        processor.start_processing()
+        
+        total = 20000
+        def produce():
+            for i in range(total):
+                processor.add_reading(make_reading(i))
+        producer = threading.Thread(target=produce)
+        producer.start()
+        
+        # Rotations répétées pendant l'ingestion, comme « Sauvegarder » dans l'interface
+        files = []
+        while producer.is_alive():
+            time.sleep(0.01)
+            new_writer = storage.create_stream_writer("rotation.rtlog", FlushPolicy(max_samples=32))
+            files.append(processor.swap_writer(new_writer).finalize())
+        producer.join()
+        while processor.get_ingest_stats()['depth']:
+            time.sleep(0.01)
+        processor.stop_processing()
+        files.append(processor.detach_writer().finalize())
+        
+        self.assertGreater(len(files), 2)
+        altitudes = []
+        for path in files:
+            altitudes.extend(FlightLogReader(path).column('altitude').tolist())
+        self.assertEqual(processor.get_ingest_stats()['dropped_oldest'], 0)
+        self.assertEqual(sorted(altitudes), [float(i) for i in range(total)])
+
+
+if __name__ == '__main__':
+    unittest.main()
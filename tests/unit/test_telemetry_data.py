@@ -4,7 +4,8 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from src.core.telemetry_data import TelemetryReading, TelemetryDataValidator
+from src.core.telemetry_data import TelemetryReading, TelemetryDataValidator, ValidationLimits
+from src.core.telemetry_frame import TelemetryFrame
 
 
 class TestTelemetryReading(unittest.TestCase):
@@ -43,6 +44,47 @@ class TestTelemetryReading(unittest.TestCase):
         self.assertIsInstance(self.sample_reading.temperature, float)
         self.assertIsInstance(self.sample_reading.pressure, float)
         self.assertIsInstance(self.sample_reading.orientation, dict)
+    
+    def test_flat_fields(self):
+        self.assertEqual(self.sample_reading.acc_z, 9.8)
+        self.assertEqual(self.sample_reading.pitch, 5.0)
+        self.assertEqual(self.sample_reading.lat, 45.5017)
+        self.assertIsInstance(self.sample_reading.timestamp_ns, int)
+        self.assertFalse(hasattr(self.sample_reading, '__dict__'))
+    
+    def test_compat_properties(self):
+        self.sample_reading.acceleration = {'x': 3.0, 'y': 4.0, 'z': 5.0}
+        self.assertEqual(self.sample_reading.acc_x, 3.0)
+        self.assertEqual(self.sample_reading.acceleration['z'], 5.0)
+        
+        self.sample_reading.gps_coordinates = None
+        self.assertIsNone(self.sample_reading.gps_coordinates)
+        self.assertIsNone(self.sample_reading.lat)
+    
+    def test_from_values(self):
+        reading = TelemetryReading.from_values(
+            timestamp_ns=self.sample_reading.timestamp_ns,
+            altitude=1000.0, velocity=50.0,
+            acc_x=1.0, acc_y=2.0, acc_z=9.8,
+            temperature=20.0, pressure=101325.0,
+            roll=0.0, pitch=5.0, yaw=-2.0,
+            lat=45.5017, lon=-73.5673, battery_voltage=12.0
+        )
+        self.assertEqual(reading, self.sample_reading)
+    
+    def test_timestamp_round_trip(self):
+        now = datetime.now()
+        self.sample_reading.timestamp = now
+        self.assertEqual(self.sample_reading.timestamp, now)
+    
+    def test_from_dict(self):
+        restored = TelemetryReading.from_dict(self.sample_reading.to_dict())
+        self.assertEqual(restored, self.sample_reading)
+        
+        # Ancien format avec timestamp ISO 8601
+        legacy = self.sample_reading.to_dict()
+        legacy['timestamp'] = self.sample_reading.timestamp.isoformat()
+        self.assertEqual(TelemetryReading.from_dict(legacy), self.sample_reading)
 
 
 class TestTelemetryDataValidator(unittest.TestCase):
@@ -88,6 +130,77 @@ class TestTelemetryDataValidator(unittest.TestCase):
     def test_invalid_pressure_too_high(self):
         self.valid_reading.pressure = 200000.0
         self.assertFalse(self.validator.validate_reading(self.valid_reading))
+    
+    
+    def test_custom_limits(self):
+        validator = TelemetryDataValidator(ValidationLimits(altitude_max=500.0))
+        self.assertFalse(validator.validate_reading(self.valid_reading))
+        self.assertEqual(validator.check_reading(self.valid_reading), 'altitude')
+    
+    def test_validate_reading_on_class(self):
+        # Appel historique sans instance (ancienne staticmethod)
+        self.assertTrue(TelemetryDataValidator.validate_reading(self.valid_reading))
+        self.valid_reading.velocity = 2000.0
+        self.assertFalse(TelemetryDataValidator.validate_reading(self.valid_reading))
+    
+    def test_reassigned_limits_apply(self):
+        validator = TelemetryDataValidator()
+        validator.limits = ValidationLimits(altitude_max=500.0)
+        self.assertEqual(validator.check_reading(self.valid_reading), 'altitude')
+    
+    def test_limits_from_dict(self):
+        limits = ValidationLimits.from_dict({'velocity_max': 10.0})
+        self.assertEqual(limits.velocity_max, 10.0)
+        self.assertEqual(limits.altitude_max, 100000)
+        
+        with self.assertRaises(ValueError):
+            ValidationLimits.from_dict({'unknown_limit': 1.0})
+
+
+class TestBatchValidation(unittest.TestCase):
+    def setUp(self):
+        self.validator = TelemetryDataValidator()
+        self.frame = TelemetryFrame(capacity=8)
+        for altitude, velocity, pressure in [(1000.0, 50.0, 101325.0),
+                                             (-2000.0, 50.0, 101325.0),
+                                             (1000.0, -2000.0, -1.0),
+                                             (500.0, 10.0, 90000.0)]:
+            self.frame.append(TelemetryReading(
+                timestamp=datetime.now(),
+                altitude=altitude,
+                velocity=velocity,
+                acceleration={'x': 0.0, 'y': 0.0, 'z': 9.8},
+                temperature=20.0,
+                pressure=pressure,
+                orientation={'roll': 0.0, 'pitch': 0.0, 'yaw': 0.0}
+            ))
+    
+    def test_mask_matches_per_reading_validation(self):
+        result = self.validator.validate_batch(self.frame)
+        expected = [self.validator.validate_reading(r) for r in self.frame.to_readings()]
+        self.assertEqual(result.mask.tolist(), expected)
+        self.assertEqual(result.valid_count, 2)
+        self.assertEqual(result.rejected_count, 2)
+    
+    def test_rejection_counts_per_rule(self):
+        # La 3e lecture viole vitesse et pression : seule la première règle en échec est comptée
+        result = self.validator.validate_batch(self.frame)
+        self.assertEqual(result.rejections, {'altitude': 1, 'velocity': 1, 'temperature': 0, 'pressure': 0})
+        self.assertEqual(sum(result.rejections.values()), result.rejected_count)
+    
+    def test_rejection_counts_match_per_reading_path(self):
+        expected = {}
+        for reading in self.frame.to_readings():
+            rule = self.validator.check_reading(reading)
+            if rule is not None:
+                expected[rule] = expected.get(rule, 0) + 1
+        counts = {rule: count for rule, count in self.validator.validate_batch(self.frame).rejections.items() if count}
+        self.assertEqual(counts, expected)
+    
+    def test_empty_batch(self):
+        result = self.validator.validate_batch(TelemetryFrame())
+        self.assertEqual(len(result.mask), 0)
+        self.assertEqual(result.rejected_count, 0)
 
 
 if __name__ == '__main__':
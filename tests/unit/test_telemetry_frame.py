@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from src.core.telemetry_data import TelemetryReading
+from src.core.telemetry_frame import TelemetryFrame, TELEMETRY_DTYPE
+
+
+def make_reading(altitude: float, gps: bool = True) -> TelemetryReading:
+    return TelemetryReading(
+        timestamp=datetime.now(),
+        altitude=altitude,
+        velocity=50.0,
+        acceleration={'x': 1.0, 'y': 2.0, 'z': 9.8},
+        temperature=20.0,
+        pressure=101325.0,
+        orientation={'roll': 0.0, 'pitch': 5.0, 'yaw': -2.0},
+        gps_coordinates={'lat': 45.5017, 'lon': -73.5673} if gps else None,
+        battery_voltage=12.0 if gps else None
+    )
+
+
+class TestTelemetryFrame(unittest.TestCase):
+    def test_round_trip(self):
+        readings = [make_reading(100.0 * i) for i in range(10)]
+        frame = TelemetryFrame.from_readings(readings)
+        
+        self.assertEqual(len(frame), 10)
+        self.assertEqual(frame.data.dtype, TELEMETRY_DTYPE)
+        
+        restored = frame.to_readings()
+        for original, copy in zip(readings, restored):
+            self.assertEqual(original.altitude, copy.altitude)
+            self.assertEqual(original.acceleration, copy.acceleration)
+            self.assertEqual(original.orientation, copy.orientation)
+            self.assertEqual(original.gps_coordinates, copy.gps_coordinates)
+            self.assertEqual(original.timestamp, copy.timestamp)
+    
+    def test_optional_fields_are_nan(self):
+        frame = TelemetryFrame.from_readings([make_reading(10.0, gps=False)])
+        
+        self.assertTrue(np.isnan(frame['lat'][0]))
+        self.assertTrue(np.isnan(frame['battery_voltage'][0]))
+        
+        reading = frame.reading_at(0)
+        self.assertIsNone(reading.gps_coordinates)
+        self.assertIsNone(reading.battery_voltage)
+    
+    def test_columns_are_views(self):
+        frame = TelemetryFrame(capacity=4)
+        frame.append(make_reading(1.0))
+        frame.append(make_reading(2.0))
+        
+        column = frame['altitude']
+        self.assertEqual(column.tolist(), [1.0, 2.0])
+        self.assertTrue(np.shares_memory(column, frame.data))
+    
+    def test_grows_past_capacity(self):
+        frame = TelemetryFrame(capacity=2)
+        frame.extend(make_reading(float(i)) for i in range(5))
+        
+        self.assertEqual(len(frame), 5)
+        self.assertGreaterEqual(frame.capacity, 5)
+        self.assertEqual(frame['altitude'].tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+    
+    def test_slice(self):
+        frame = TelemetryFrame.from_readings([make_reading(float(i)) for i in range(6)])
+        part = frame[2:4]
+        
+        self.assertIsInstance(part, TelemetryFrame)
+        self.assertEqual(part['altitude'].tolist(), [2.0, 3.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.core.telemetry_data import TelemetryReading
+from src.data.time_buffer import TimeSortedBuffer
+
+
+def make_reading(timestamp_ns: int) -> TelemetryReading:
+    return TelemetryReading.from_values(
+        timestamp_ns=timestamp_ns, altitude=float(timestamp_ns), velocity=0.0,
+        acc_x=0.0, acc_y=0.0, acc_z=9.8, temperature=20.0, pressure=101325.0,
+        roll=0.0, pitch=0.0, yaw=0.0
+    )
+
+
+class TestTimeSortedBuffer(unittest.TestCase):
+    def test_keeps_last_capacity_readings(self):
+        buffer = TimeSortedBuffer(capacity=10)
+        for t in range(35):
+            buffer.append(make_reading(t))
+        
+        self.assertEqual(len(buffer), 10)
+        self.assertEqual([r.timestamp_ns for r in buffer.to_list()], list(range(25, 35)))
+        self.assertEqual(buffer.latest().timestamp_ns, 34)
+    
+    def test_range_is_inclusive(self):
+        buffer = TimeSortedBuffer(capacity=100)
+        for t in range(0, 100, 2):
+            buffer.append(make_reading(t))
+        
+        self.assertEqual([r.timestamp_ns for r in buffer.range(10, 20)], [10, 12, 14, 16, 18, 20])
+        self.assertEqual([r.timestamp_ns for r in buffer.range(11, 13)], [12])
+        self.assertEqual(buffer.range(200, 300), [])
+        self.assertEqual(len(buffer.range()), 50)
+    
+    def test_out_of_order_insert(self):
+        buffer = TimeSortedBuffer(capacity=5)
+        for t in (10, 20, 30, 25, 15):
+            buffer.append(make_reading(t))
+        
+        self.assertEqual(buffer.timestamps.tolist(), [10, 15, 20, 25, 30])
+        
+        # Plus ancien que toute la fenêtre pleine : ignoré
+        buffer.append(make_reading(5))
+        self.assertEqual(buffer.timestamps.tolist(), [10, 15, 20, 25, 30])
+        
+        buffer.append(make_reading(27))
+        self.assertEqual(buffer.timestamps.tolist(), [15, 20, 25, 27, 30])
+    
+    def test_clear(self):
+        buffer = TimeSortedBuffer(capacity=3)
+        buffer.append(make_reading(1))
+        buffer.clear()
+        
+        self.assertEqual(len(buffer), 0)
+        self.assertIsNone(buffer.latest())
+
+
+if __name__ == '__main__':
+    unittest.main()